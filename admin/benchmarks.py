@@ -132,6 +132,31 @@ def test_context_from_path():
         CryptContext.from_path(path)
     return helper
 
+def _context_snapshot_helper(snapshot):
+    from passlib import context as mod
+    with open(sample_config_1p) as fh:
+        source = fh.read()
+    data = CryptContext.from_string(source).to_snapshot(source)
+    def helper():
+        # NOTE: clearing record cache, so records are actually rebuilt
+        mod._record_cache.clear()
+        mod._recent_records.clear()
+        if snapshot:
+            CryptContext.from_snapshot(data, source=source)
+        else:
+            CryptContext.from_string(source)
+    return helper
+
+@benchmark.constructor()
+def test_context_from_string_cold():
+    """test speed of CryptContext.from_string(), w/o record cache"""
+    return _context_snapshot_helper(False)
+
+@benchmark.constructor()
+def test_context_from_snapshot_cold():
+    """test speed of CryptContext.from_snapshot(), w/o record cache"""
+    return _context_snapshot_helper(True)
+
 @benchmark.constructor()
 def test_context_update():
     """test speed of CryptContext.update()"""
@@ -248,6 +273,157 @@ def test_sha1_crypt():
         handler.verify(OTHER, hash)
     return helper
 
+#=============================================================================
+# compiled verify() fast path
+#=============================================================================
+def _fast_helper(handler, hash):
+    def helper():
+        handler.verify(SECRET, hash)
+        handler.verify(OTHER, hash)
+    return helper
+
+def _regular_helper(handler, hash):
+    """replicates verify() w/o the compiled fast path"""
+    from passlib.utils import consteq
+    def verify(secret):
+        self = handler.from_string(hash)
+        return consteq(self._calc_checksum(secret), self.checksum)
+    def helper():
+        verify(SECRET)
+        verify(OTHER)
+    return helper
+
+def _pbkdf2_sha256_hash():
+    from passlib.hash import pbkdf2_sha256
+    return pbkdf2_sha256, pbkdf2_sha256.using(rounds=1).hash(SECRET)
+
+def _sha256_crypt_hash():
+    from passlib.hash import sha256_crypt
+    return sha256_crypt, sha256_crypt.using(rounds=1000).hash(SECRET)
+
+def _bcrypt_hash():
+    from passlib.hash import bcrypt
+    bcrypt.set_backend()
+    return bcrypt, "$2b$04$abcdefghijklmnopqrstuuywucb/roa0ElV5kj09NRH.9HVsAP/hi"
+
+@benchmark.constructor()
+def test_fast_verify_pbkdf2_sha256():
+    """test pbkdf2_sha256.verify() w/ fast path"""
+    return _fast_helper(*_pbkdf2_sha256_hash())
+
+@benchmark.constructor()
+def test_regular_verify_pbkdf2_sha256():
+    """test pbkdf2_sha256.verify() w/o fast path"""
+    return _regular_helper(*_pbkdf2_sha256_hash())
+
+@benchmark.constructor()
+def test_fast_verify_sha256_crypt():
+    """test sha256_crypt.verify() w/ fast path"""
+    return _fast_helper(*_sha256_crypt_hash())
+
+@benchmark.constructor()
+def test_regular_verify_sha256_crypt():
+    """test sha256_crypt.verify() w/o fast path"""
+    return _regular_helper(*_sha256_crypt_hash())
+
+@benchmark.constructor()
+def test_fast_verify_bcrypt():
+    """test bcrypt.verify() w/ fast path"""
+    return _fast_helper(*_bcrypt_hash())
+
+@benchmark.constructor()
+def test_regular_verify_bcrypt():
+    """test bcrypt.verify() w/o fast path"""
+    return _regular_helper(*_bcrypt_hash())
+
+#=============================================================================
+# backend probe cache
+#=============================================================================
+_cold_start_script = """\
+from passlib.context import CryptContext
+ctx = CryptContext(["bcrypt", "sha512_crypt", "sha256_crypt", "md5_crypt", "bsdi_crypt", "des_crypt"])
+for scheme in ctx.schemes():
+    handler = ctx.handler(scheme)
+    if hasattr(handler, "get_backend"):
+        handler.get_backend()
+"""
+
+def _cold_start_helper(cache_path=None):
+    import subprocess
+    env = os.environ.copy()
+    env.pop("PASSLIB_PROBE_CACHE", None)
+    if cache_path:
+        env["PASSLIB_PROBE_CACHE"] = cache_path
+    cmd = [sys.executable, "-c", _cold_start_script]
+    def helper():
+        subprocess.check_call(cmd, env=env)
+    return helper
+
+@benchmark.constructor()
+def test_cold_start_wo_probe_cache():
+    """test process startup & backend loading for 6 crypt schemes w/o probe cache"""
+    return _cold_start_helper()
+
+@benchmark.constructor()
+def test_cold_start_w_probe_cache():
+    """test process startup & backend loading for 6 crypt schemes w/ probe cache"""
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "probe-cache.json")
+    helper = _cold_start_helper(path)
+    helper()  # populate cache
+    return helper
+
+#=============================================================================
+# compiled PrefixWrapper
+#=============================================================================
+def _prefix_wrapper_helper(handler):
+    hash = handler.hash(SECRET)
+    def helper():
+        handler.hash(SECRET)
+        handler.verify(SECRET, hash)
+        handler.verify(OTHER, hash)
+        handler.identify(hash)
+    return helper
+
+@benchmark.constructor()
+def test_ldap_hex_md5_wrapper():
+    """test ldap_hex_md5 via PrefixWrapper"""
+    from passlib.hash import ldap_hex_md5
+    return _prefix_wrapper_helper(ldap_hex_md5)
+
+@benchmark.constructor()
+def test_ldap_hex_md5_compiled():
+    """test ldap_hex_md5 via PrefixWrapper.compile()"""
+    from passlib.hash import ldap_hex_md5
+    return _prefix_wrapper_helper(ldap_hex_md5.compile())
+
+#=============================================================================
+# bulk parsing
+#=============================================================================
+def _parse_many_helper(bulk):
+    from passlib.hash import md5_crypt, pbkdf2_sha256
+    hashes = [(handler, [handler.using(salt_size=8, rounds=1000).hash("test")
+                         if handler is pbkdf2_sha256 else handler.hash("test")] * 1000)
+              for handler in (md5_crypt, pbkdf2_sha256)]
+    def helper():
+        for handler, values in hashes:
+            if bulk:
+                handler.parse_many(values)
+            else:
+                for hash in values:
+                    handler.from_string(hash)
+    return helper
+
+@benchmark.constructor()
+def test_parse_many_wo_bulk():
+    """test parsing 2x1000 hashes via from_string()"""
+    return _parse_many_helper(False)
+
+@benchmark.constructor()
+def test_parse_many_w_bulk():
+    """test parsing 2x1000 hashes via parse_many()"""
+    return _parse_many_helper(True)
+
 #=============================================================================
 # crypto utils
 #=============================================================================
@@ -267,6 +443,30 @@ def test_pbkdf2_sha256():
         assert result == 'fadef97054306c93c55213cd57111d6c0791735dcdde8ac32f9f934b49c5af1e', result
     return helper
 
+#=============================================================================
+# salt generation
+#=============================================================================
+def _salt_helper(rng, count=1000):
+    from passlib.utils import getrandstr, getrandbytes
+    from passlib.utils.binary import HASH64_CHARS
+    def helper():
+        for _ in range(count):
+            getrandstr(rng, HASH64_CHARS, 16)
+            getrandbytes(rng, 16)
+    return helper
+
+@benchmark.constructor()
+def test_salts_system_random():
+    """test generating 1000 salts w/ SystemRandom"""
+    import random
+    return _salt_helper(random.SystemRandom())
+
+@benchmark.constructor()
+def test_salts_entropy_pool():
+    """test generating 1000 salts w/ EntropyPool"""
+    from passlib.utils import EntropyPool
+    return _salt_helper(EntropyPool())
+
 #=============================================================================
 # entropy estimates
 #=============================================================================
@@ -0,0 +1,350 @@
+"""passlib.analyze - helpers for surveying a database of existing hashes"""
+#=============================================================================
+# imports
+#=============================================================================
+# core
+import argparse
+from collections import Counter, deque
+from itertools import islice
+import json
+import logging; log = logging.getLogger(__name__)
+import sys
+# site
+# pkg
+from passlib.utils import _measure, handlers as uh
+# local
+__all__ = [
+    "HashInventory",
+    "analyze_hashes",
+    "main",
+]
+
+#=============================================================================
+# inventory
+#=============================================================================
+class HashInventory(object):
+    """
+    Summary of a collection of hashes, as returned by :meth:`CryptContext.analyze() <passlib.context.CryptContext.analyze>`.
+
+    All the histograms are :class:`collections.Counter` instances,
+    keyed by ``(scheme, ident, rounds)`` tuples (``ident`` and ``rounds``
+    will be ``None`` for hashes which don't have that setting).
+    Their size depends only on the number of distinct configurations seen,
+    not the number of hashes.
+
+    .. versionadded:: 1.8
+    """
+    #===================================================================
+    # instance attrs
+    #===================================================================
+
+    #: total number of hashes seen
+    total = 0
+
+    #: number of hashes which didn't belong to any scheme in the context
+    unknown = 0
+
+    #: number of hashes which were identified, but couldn't be parsed
+    malformed = 0
+
+    #: histogram of all (identified & parsed) hashes
+    counts = None
+
+    #: histogram of hashes which :meth:`!needs_update` flagged
+    stale = None
+
+    #: estimated seconds it takes to generate a new hash using the context's
+    #: default scheme (``None`` if not measured)
+    hash_cost = None
+
+    def __init__(self):
+        self.counts = Counter()
+        self.stale = Counter()
+
+    #===================================================================
+    # building
+    #===================================================================
+    def update(self, other):
+        """merge counts from another :class:`!HashInventory` into this one"""
+        self.total += other.total
+        self.unknown += other.unknown
+        self.malformed += other.malformed
+        self.counts.update(other.counts)
+        self.stale.update(other.stale)
+
+    #===================================================================
+    # reports
+    #===================================================================
+    def _group(self, counter, *fields):
+        """collapse histogram onto specified subset of ``(scheme, ident, rounds)``"""
+        result = Counter()
+        for key, count in counter.items():
+            result[tuple(key[index] for index in fields)] += count
+        return result
+
+    @property
+    def needs_update(self):
+        """total number of hashes :meth:`!needs_update` flagged"""
+        return sum(self.stale.values())
+
+    @property
+    def by_scheme(self):
+        """:class:`!Counter` mapping scheme -> number of hashes"""
+        result = Counter()
+        for key, count in self.counts.items():
+            result[key[0]] += count
+        return result
+
+    @property
+    def by_ident(self):
+        """:class:`!Counter` mapping ``(scheme, ident)`` -> number of hashes"""
+        return self._group(self.counts, 0, 1)
+
+    @property
+    def by_rounds(self):
+        """:class:`!Counter` mapping ``(scheme, rounds)`` -> number of hashes"""
+        return self._group(self.counts, 0, 2)
+
+    @property
+    def rehash_cost(self):
+        """
+        estimated total CPU seconds it will take to rehash all the
+        hashes flagged by :meth:`!needs_update` (``None`` if not measured)
+        """
+        if self.hash_cost is None:
+            return None
+        return self.needs_update * self.hash_cost
+
+    def to_dict(self):
+        """
+        return JSON-compatible dict containing the report
+        """
+        def render(counter, fields):
+            return [dict(zip(fields, key), count=count)
+                    for key, count in sorted(counter.items(), key=_sort_key)]
+        fields = ("scheme", "ident", "rounds")
+        return dict(
+            total=self.total,
+            unknown=self.unknown,
+            malformed=self.malformed,
+            needs_update=self.needs_update,
+            hash_cost=self.hash_cost,
+            rehash_cost=self.rehash_cost,
+            counts=render(self.counts, fields),
+            stale=render(self.stale, fields),
+        )
+
+    def to_string(self):
+        """
+        return human-readable report
+        """
+        lines = []
+        add = lines.append
+        total = self.total or 1
+        def row(label, count):
+            add("  %-40s %12d %6.1f%%" % (label, count, 100.0 * count / total))
+        def label(*parts):
+            return " ".join(str(part) for part in parts if part is not None)
+
+        add("%d hashes: %d needs update, %d unknown, %d malformed" %
+            (self.total, self.needs_update, self.unknown, self.malformed))
+        for title, counter in [("by scheme:", self._group(self.counts, 0)),
+                               ("by ident:", self.by_ident),
+                               ("by rounds:", self.by_rounds),
+                               ("needs update:", self.stale)]:
+            add("")
+            add(title)
+            for key, count in sorted(counter.items(), key=_sort_key):
+                row(label(*key), count)
+        if self.hash_cost is not None:
+            add("")
+            add("estimated rehash cost: %.1f cpu-seconds (%.2fms per hash)" %
+                (self.rehash_cost, self.hash_cost * 1000))
+        return "\n".join(lines) + "\n"
+
+    #===================================================================
+    # eoc
+    #===================================================================
+
+def _sort_key(item):
+    """sort histogram entries by key, treating None as less than anything"""
+    key, count = item
+    return tuple((value is not None, value) for value in key)
+
+#=============================================================================
+# classification
+#=============================================================================
+def _get_settings(record, hash):
+    """
+    parse hash, and return ``(ident, rounds)`` for it.
+    raises ValueError if the hash is malformed.
+    """
+    if isinstance(record, uh.PrefixWrapper):
+        hash = record._unwrap_hash(hash)
+        record = record.wrapped
+    if not hasattr(record, "parsehash"):
+        # XXX: non-GenericHandler hashes offer no way to parse w/o a secret,
+        #      so all we can report is the scheme.
+        return None, None
+    info = record.parsehash(hash, checksum=False)
+    # NOTE: parsehash() omits settings which match the class default.
+    settings = record.setting_kwds
+    ident = info.get("ident", record.ident) if "ident" in settings else None
+    rounds = info.get("rounds", record.rounds) if "rounds" in settings else None
+    return ident, rounds
+
+def _analyze_chunk(context, hashes, category):
+    """
+    classify an iterable of hashes, and return :class:`HashInventory` for them
+    """
+    result = HashInventory()
+    counts = result.counts
+    stale = result.stale
+    identify_record = context._identify_record
+    for hash in hashes:
+        result.total += 1
+        try:
+            record = identify_record(hash, category)
+        except ValueError:
+            result.unknown += 1
+            continue
+        try:
+            key = (record.name,) + _get_settings(record, hash)
+            flagged = record.deprecated or record.needs_update(hash)
+        except ValueError:
+            result.malformed += 1
+            continue
+        counts[key] += 1
+        if flagged:
+            stale[key] += 1
+    return result
+
+#: CryptContext instance used by process pool worker (see _worker_init)
+_worker_context = None
+
+def _worker_init(config):
+    """initializer for process pool -- loads worker's copy of context"""
+    global _worker_context
+    from passlib.context import CryptContext
+    _worker_context = CryptContext(**config)
+
+def _worker_call(hashes, category):
+    """classify chunk within process pool worker"""
+    return _analyze_chunk(_worker_context, hashes, category)
+
+def _iter_chunks(source, size):
+    """split iterable into lists of specified size"""
+    source = iter(source)
+    while True:
+        chunk = list(islice(source, size))
+        if not chunk:
+            return
+        yield chunk
+
+def analyze_hashes(context, hashes, category=None, workers=None, chunk_size=10000,
+                   estimate_cost=True):
+    """
+    helper which implements :meth:`CryptContext.analyze() <passlib.context.CryptContext.analyze>`;
+    see that method for details.
+
+    .. versionadded:: 1.8
+    """
+    if workers is None:
+        result = _analyze_chunk(context, hashes, category)
+    else:
+        unregistered = context._get_unregistered_handlers()
+        if unregistered:
+            raise RuntimeError("analyze() with workers requires all handlers to be "
+                               "registered with passlib.registry: %s" %
+                               ", ".join(repr(handler.name) for handler in unregistered))
+        from concurrent.futures import ProcessPoolExecutor
+        result = HashInventory()
+        # NOTE: only keeping 2 chunks per worker in flight, so memory use stays
+        #       constant no matter how many hashes are in the input.
+        pending = deque()
+        with ProcessPoolExecutor(workers, initializer=_worker_init,
+                                 initargs=(context.to_dict(),)) as pool:
+            for chunk in _iter_chunks(hashes, chunk_size):
+                if len(pending) >= 2 * workers:
+                    result.update(pending.popleft().result())
+                pending.append(pool.submit(_worker_call, chunk, category))
+            while pending:
+                result.update(pending.popleft().result())
+    if estimate_cost:
+        record = context._get_record(None, category)
+        result.hash_cost = _measure(record, 1, 3)
+    return result
+
+#=============================================================================
+# cli
+#=============================================================================
+_description = """\
+read hashes (one per line) from files or stdin, and report how many of them
+the CryptContext configuration would flag for rehashing, grouped by scheme,
+ident, and rounds; along with the estimated cost of rehashing them.
+"""
+
+def _read_lines(paths, field, delimiter):
+    """yield hashes from each file (or stdin), skipping blank lines"""
+    for path in paths:
+        if path == "-":
+            fh = sys.stdin
+        else:
+            fh = open(path, "r", encoding="utf-8")
+        try:
+            for line in fh:
+                line = line.strip()
+                if field is not None:
+                    parts = line.split(delimiter)
+                    line = parts[field] if len(parts) > field else ""
+                if line:
+                    yield line
+        finally:
+            if fh is not sys.stdin:
+                fh.close()
+
+def main(*args):
+    parser = argparse.ArgumentParser(prog="python -m passlib.analyze", description=_description)
+    parser.add_argument("paths", nargs="*", metavar="PATH", default=["-"],
+                        help="files containing hashes (defaults to stdin)")
+    parser.add_argument("-c", "--config", metavar="PATH", required=True,
+                        help="INI file containing CryptContext configuration")
+    parser.add_argument("--section", default="passlib",
+                        help="INI section to read config from (default: %(default)s)")
+    parser.add_argument("--category", default=None,
+                        help="user category to check hashes against (default: none)")
+    parser.add_argument("-f", "--field", type=int, default=None, metavar="N",
+                        help="read hash from Nth (0-based) field of each line, "
+                             "e.g. 1 for htpasswd / shadow style files")
+    parser.add_argument("-d", "--delimiter", default=":",
+                        help="field delimiter used by --field (default: '%(default)s')")
+    parser.add_argument("-j", "--workers", type=int, default=None, metavar="N",
+                        help="number of worker processes (default: run in-process)")
+    parser.add_argument("--no-cost", dest="estimate_cost", action="store_false",
+                        help="don't measure rehash cost")
+    parser.add_argument("--json", action="store_true",
+                        help="output report as json")
+    opts = parser.parse_args(args)
+    if opts.workers is not None and opts.workers < 1:
+        parser.error("workers must be >= 1")
+    if opts.field is not None and opts.field < 0:
+        parser.error("field must be >= 0")
+
+    from passlib.context import CryptContext
+    context = CryptContext.from_path(opts.config, section=opts.section)
+    hashes = _read_lines(opts.paths, opts.field, opts.delimiter)
+    result = context.analyze(hashes, category=opts.category, workers=opts.workers,
+                             estimate_cost=opts.estimate_cost)
+    if opts.json:
+        json.dump(result.to_dict(), sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(result.to_string())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:]))
+
+#=============================================================================
+# eof
+#=============================================================================
@@ -3,17 +3,26 @@
 # imports
 #=============================================================================
 # core
+from collections import OrderedDict, deque
 from configparser import ConfigParser
+from contextlib import contextmanager
+from functools import partial
 from io import StringIO
+import hashlib
+import itertools
+import json
+import os
 import re
 import logging; log = logging.getLogger(__name__)
 import threading
 import time
+import weakref
 from warnings import warn
 # site
 # pkg
-from passlib import exc
+from passlib import __version__, exc
 from passlib.exc import ExpectedStringError, ExpectedTypeError, PasslibConfigWarning
+from passlib.crypto.digest import compile_hmac
 from passlib.registry import get_crypt_handler, _validate_handler_name
 from passlib.utils import (handlers as uh, to_bytes,
                            to_unicode, splitcomma,
@@ -28,6 +37,10 @@ from passlib.utils.decor import deprecated_method, memoized_property
 __all__ = [
     'CryptContext',
     'LazyCryptContext',
+    'VerifyCache',
+    'AdmissionControl',
+    'ConfigWatcher',
+    'ContextMetrics',
 ]
 
 #=============================================================================
@@ -66,6 +79,108 @@ def _is_handler_registered(handler):
     """detect if handler is registered or a custom handler"""
     return get_crypt_handler(handler.name, None) is handler
 
+#: format identifier stored in CryptContext.to_snapshot() output
+_SNAPSHOT_FORMAT = "passlib-context-snapshot-1"
+
+def _snapshot_digest(source, section):
+    """digest used by to_snapshot() to detect changes to source config"""
+    source = to_bytes(source, param="source")
+    return hashlib.sha256(section.encode("utf-8") + b"\0" + source).hexdigest()
+
+def _parse_snapshot(data, source=None, section="passlib"):
+    """
+    helper for from_snapshot() & ConfigWatcher --
+    validate snapshot, and return compiled config state stored in it
+    (see :meth:`_CryptConfig._get_state`).
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if not isinstance(data, bytes):
+        raise ExpectedTypeError(data, "bytes", "data")
+    try:
+        info = json.loads(data.decode("utf-8"))
+        kind = info["format"]
+        version = info["passlib"]
+        digest = info["source"]
+        state = info["state"]
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("malformed context snapshot")
+    if kind != _SNAPSHOT_FORMAT:
+        raise ValueError("unsupported context snapshot format: %r" % (kind,))
+    if version != __version__:
+        raise ValueError("context snapshot was created by passlib %r" % (version,))
+    if source is not None and digest != _snapshot_digest(source, section):
+        raise ValueError("context snapshot doesn't match source config")
+    if not isinstance(state, dict):
+        raise ValueError("malformed context snapshot")
+    return state
+
+def _same_items(left, right):
+    """check if two sequences contain the exact same objects, in the same order"""
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right))
+
+def _verify_and_needs_update(handler, secret, hash, **kwds):
+    """
+    fallback for handlers w/o a ``verify_and_needs_update()`` method
+    (see :meth:`GenericHandler.verify_and_needs_update`).
+    """
+    if not handler.verify(secret, hash, **kwds):
+        return False, False
+    return True, handler.needs_update(hash, secret=secret)
+
+def _get_record_method(record, name):
+    """
+    return ``record.<name>``; using :func:`_verify_and_needs_update` as fallback
+    for handlers w/o a ``verify_and_needs_update()`` method.
+    """
+    if name == "verify_and_needs_update" and not hasattr(record, name):
+        return partial(_verify_and_needs_update, record)
+    return getattr(record, name)
+
+def _record_needs_update(record, hash, secret=None):
+    """helper for :meth:`CryptContext.needs_update` -- check record & hash"""
+    return record.deprecated or record.needs_update(hash, secret=secret)
+
+def _get_bulk_verify(record, kwds):
+    """
+    helper for :meth:`CryptContext.verify_many` --
+    returns function to use in place of ``record.verify()``
+    for verifying many hashes w/ the same record & *kwds*.
+
+    for handlers offering a compiled verify() fast path (see :meth:`GenericHandler._compile_verify`),
+    this looks it up once, rather than once per hash; falling back to ``record.verify()``
+    for any hash the fast path can't handle.
+    """
+    if kwds:
+        return record.verify
+    get_compiled_verify = getattr(record, "_get_compiled_verify", None)
+    if get_compiled_verify is None or record.parse_cache is not None:
+        # NOTE: if parse cache is enabled, record.verify() will use it,
+        #       which already avoids re-parsing any repeated hashes.
+        return record.verify
+    compiled_verify = get_compiled_verify()
+    if compiled_verify is None:
+        return record.verify
+    verify = record.verify
+    def bulk_verify(secret, hash):
+        uh.validate_secret(secret)
+        result = compiled_verify(secret, hash)
+        if result is None:
+            return verify(secret, hash)
+        return result
+    return bulk_verify
+
+def _get_pending_result(item):
+    """
+    helper for :meth:`CryptContext.verify_many` --
+    resolve entry from pending queue (future, deferred error, or ``None``) into result
+    """
+    if item is None:
+        return False
+    if isinstance(item, Exception):
+        raise item
+    return item.result()
+
 @staticmethod
 def _always_needs_update(hash, secret=None):
     """
@@ -77,6 +192,991 @@ def _always_needs_update(hash, secret=None):
 #: list of keys allowed under wildcard "all" scheme w/o a security warning.
 _global_settings = set(["truncate_error", "vary_rounds"])
 
+#: identify() implementations which are known to match purely on a constant prefix
+#: (:attr:`ident` or :attr:`ident_values`), used by _get_identify_prefixes().
+_prefix_identify_funcs = (uh.GenericHandler.identify.__func__,
+                          uh.HasManyIdents.identify.__func__)
+
+def _get_identify_prefixes(handler):
+    """
+    helper for _CryptConfig's identify dispatch table --
+    returns ``(prefixes, exact)`` for the specified handler.
+
+    *prefixes* is a tuple of strings, one of which *every* hash recognized
+    by ``handler.identify()`` is guaranteed to start with; or ``None`` if
+    the handler can't promise that (e.g. hex digests, mysql323), in which case
+    it has to be checked via a linear scan.
+
+    *exact* is ``True`` if ``handler.identify()`` will accept *any* string
+    starting with one of the prefixes (used to detect handlers which
+    shadow each other).
+    """
+    func = getattr(handler.identify, "__func__", None)
+    if func is uh.PrefixWrapper.identify:
+        prefix, orig_prefix, wrapped = handler.prefix, handler.orig_prefix, handler.wrapped
+    elif func is uh._CompiledPrefixMixin.identify.__func__:
+        # class generated by PrefixWrapper.compile()
+        prefix, orig_prefix, wrapped = (handler._wrap_prefix, handler._wrap_orig_prefix,
+                                        handler._wrap_handler)
+    else:
+        prefix = None
+    if prefix is not None:
+        if not prefix:
+            return None, False
+        if not orig_prefix:
+            prefixes, exact = _get_identify_prefixes(wrapped)
+            if prefixes:
+                return tuple(prefix + value for value in prefixes), exact
+        return (prefix,), False
+    if func not in _prefix_identify_funcs:
+        return None, False
+    if func is uh.HasManyIdents.identify.__func__:
+        prefixes = handler.ident_values
+    elif handler.ident is not None:
+        prefixes = (handler.ident,)
+    else:
+        # GenericHandler.identify() will fall back to regex / from_string()
+        return None, False
+    if not prefixes or not all(isinstance(value, str) and value for value in prefixes):
+        return None, False
+    return tuple(prefixes), True
+
+#=============================================================================
+# verify cache
+#=============================================================================
+class VerifyCache(object):
+    """Short-lived cache of successful :meth:`CryptContext.verify` results.
+
+    This is an opt-in helper for applications which repeatedly verify the same
+    credential (e.g. HTTP Basic auth, or API tokens checked on every request),
+    and don't want to pay for a full hash each time.
+    It can be enabled by passing ``verify_cache=VerifyCache(...)``
+    (or ``verify_cache=True``, for the default settings) to :class:`CryptContext`.
+
+    Entries are keyed by an HMAC of the secret & hash, using a random key
+    generated when the cache is created; so the secret itself is never stored.
+    :class:`!CryptContext` additionally includes a token identifying its current
+    configuration in the key, so entries added under a previous configuration
+    are never returned once it's been replaced.
+    Only *successful* verifications are cached; failed attempts always
+    pay the full cost of the hash.
+
+    :param max_size:
+        maximum number of entries to keep (least recently used entries are evicted first).
+        Defaults to 1024.
+
+    :param ttl:
+        number of seconds an entry remains valid after it's added.
+        Defaults to 60.
+
+    .. attribute:: hits
+
+        number of lookups which were found in cache.
+
+    .. attribute:: misses
+
+        number of lookups which weren't found in cache.
+
+    .. versionadded:: 1.8
+    """
+    #===================================================================
+    # instance attrs
+    #===================================================================
+
+    #: number of cache hits
+    hits = 0
+
+    #: number of cache misses
+    misses = 0
+
+    #===================================================================
+    # init
+    #===================================================================
+    def __init__(self, max_size=1024, ttl=60):
+        if not isinstance(max_size, int):
+            raise ExpectedTypeError(max_size, "int", "max_size")
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if not isinstance(ttl, num_types):
+            raise ExpectedTypeError(ttl, "int or float", "ttl")
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._hmac = compile_hmac("sha256", os.urandom(32))
+        self._lock = threading.Lock()
+        # maps key -> (expire time, hash tag), in LRU order
+        self._entries = OrderedDict()
+        # maps hash tag -> set of keys, used by invalidate()
+        self._tags = {}
+
+    def __repr__(self):
+        return "<VerifyCache max_size=%r ttl=%r size=%d hits=%d misses=%d>" % \
+               (self.max_size, self.ttl, len(self), self.hits, self.misses)
+
+    def __len__(self):
+        return len(self._entries)
+
+    #===================================================================
+    # internal helpers
+    #===================================================================
+    def _get_tag(self, hash):
+        return self._hmac(to_bytes(hash, param="hash"))
+
+    def _get_key(self, secret, tag, scope):
+        # NOTE: tag is fixed size, and scope is length-prefixed, so this is unambiguous.
+        return self._hmac(tag + bytes([len(scope)]) + scope + to_bytes(secret, param="secret"))
+
+    def _remove(self, key):
+        """remove entry (lock should be held)"""
+        _, tag = self._entries.pop(key)
+        keys = self._tags[tag]
+        keys.discard(key)
+        if not keys:
+            del self._tags[tag]
+
+    #===================================================================
+    # public api
+    #===================================================================
+    def lookup(self, secret, hash, scope=b""):
+        """
+        return ``True`` if *secret* was recently verified against *hash*,
+        else ``False``.
+
+        *scope* is an optional (short) :class:`!bytes` token;
+        entries are only found when looked up using the same scope they were added with.
+        """
+        key = self._get_key(secret, self._get_tag(hash), scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > timer():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True
+                self._remove(key)
+            self.misses += 1
+            return False
+
+    def add(self, secret, hash, scope=b""):
+        """record that *secret* successfully verified against *hash* (see :meth:`lookup`)."""
+        tag = self._get_tag(hash)
+        key = self._get_key(secret, tag, scope)
+        with self._lock:
+            entries = self._entries
+            if key in entries:
+                self._remove(key)
+            entries[key] = (timer() + self.ttl, tag)
+            self._tags.setdefault(tag, set()).add(key)
+            while len(entries) > self.max_size:
+                self._remove(next(iter(entries)))
+
+    def invalidate(self, hash):
+        """remove any entries for *hash*, under any scope (e.g. because user's hash has been replaced)."""
+        tag = self._get_tag(hash)
+        with self._lock:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def clear(self):
+        """remove all entries, and reset :attr:`hits` & :attr:`misses` counters."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self.hits = self.misses = 0
+
+    #===================================================================
+    # eoc
+    #===================================================================
+
+#=============================================================================
+# admission control
+#=============================================================================
+class AdmissionControl(object):
+    """Limits how many hashes a :class:`CryptContext` will run at once.
+
+    This is an opt-in helper for servers which need to stay responsive
+    when flooded with login attempts (e.g. during a credential stuffing attack).
+    It can be enabled by passing ``admission=AdmissionControl(...)``
+    to :class:`CryptContext`; after which each hash run by :meth:`~CryptContext.hash`,
+    :meth:`~CryptContext.verify`, :meth:`~CryptContext.verify_and_update`,
+    and :meth:`~CryptContext.dummy_verify` (including the asyncio versions,
+    and :meth:`~CryptContext.verify_many`) will have to be admitted before running.
+    (The re-hash done by :meth:`!verify_and_update` is admitted separately;
+    and calls answered from the context's *verify_cache* don't need to be admitted at all).
+    Calls beyond *max_inflight* wait in a queue (highest priority first);
+    calls beyond that fail immediately with :exc:`~passlib.exc.OverloadError`.
+
+    :param max_inflight:
+        maximum number of hashes allowed to run at once.
+        Defaults to the number of CPUs.
+
+    :param max_queue:
+        maximum number of calls allowed to wait for a slot.
+        Defaults to ``4 * max_inflight``. Use ``0`` to reject immediately
+        whenever *max_inflight* is reached.
+
+    :param timeout:
+        default number of seconds a call may wait in the queue before
+        giving up with :exc:`!OverloadError`. ``None`` (the default) waits indefinitely.
+        Note this only limits the time spent waiting, not the hash itself.
+
+    :param priorities:
+        names of the priority classes, from highest to lowest.
+        Defaults to ``("interactive", "background")``.
+        Calls use the first priority unless changed via :meth:`options`.
+
+    .. attribute:: admitted
+
+        number of calls which have been admitted.
+
+    .. attribute:: rejected
+
+        number of calls rejected because the queue was full.
+
+    .. attribute:: timed_out
+
+        number of calls rejected because they waited past their deadline.
+
+    .. versionadded:: 1.8
+    """
+    #===================================================================
+    # instance attrs
+    #===================================================================
+
+    #: number of calls admitted
+    admitted = 0
+
+    #: number of calls rejected because queue was full
+    rejected = 0
+
+    #: number of calls which timed out waiting in queue
+    timed_out = 0
+
+    #===================================================================
+    # init
+    #===================================================================
+    def __init__(self, max_inflight=None, max_queue=None, timeout=None,
+                 priorities=("interactive", "background")):
+        if max_inflight is None:
+            max_inflight = os.cpu_count() or 1
+        elif not isinstance(max_inflight, int):
+            raise ExpectedTypeError(max_inflight, "int or None", "max_inflight")
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be >= 1")
+        if max_queue is None:
+            max_queue = 4 * max_inflight
+        elif not isinstance(max_queue, int):
+            raise ExpectedTypeError(max_queue, "int or None", "max_queue")
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+        if timeout is not None:
+            if not isinstance(timeout, num_types):
+                raise ExpectedTypeError(timeout, "int, float, or None", "timeout")
+            if timeout < 0:
+                raise ValueError("timeout must be >= 0")
+        if isinstance(priorities, str):
+            priorities = splitcomma(priorities)
+        priorities = tuple(priorities)
+        if not priorities:
+            raise ValueError("at least one priority must be specified")
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.priorities = priorities
+        self._cond = threading.Condition(threading.Lock())
+        self._inflight = 0
+        # list of waiter queues, one per priority (highest first)
+        self._queues = [deque() for _ in priorities]
+        # per-thread state -- 'depth' (for nested calls), 'priority' & 'timeout' overrides
+        self._local = threading.local()
+
+    def __repr__(self):
+        return "<AdmissionControl max_inflight=%r max_queue=%r inflight=%d queued=%d rejected=%d>" % \
+               (self.max_inflight, self.max_queue, self.inflight, self.queue_depth,
+                self.rejected + self.timed_out)
+
+    #===================================================================
+    # stats
+    #===================================================================
+    @property
+    def inflight(self):
+        """number of calls currently running"""
+        return self._inflight
+
+    @property
+    def queue_depth(self):
+        """number of calls currently waiting in queue"""
+        return sum(len(queue) for queue in self._queues)
+
+    #===================================================================
+    # per-call options
+    #===================================================================
+    def _get_priority_index(self, priority):
+        try:
+            return self.priorities.index(priority)
+        except ValueError:
+            raise ValueError("unknown priority: %r" % (priority,))
+
+    @contextmanager
+    def options(self, priority=None, timeout=_UNSET):
+        """
+        context manager which changes the priority and/or timeout
+        used by hashes started by the current thread::
+
+            >>> with admission.options(priority="background", timeout=5):
+            ...     new_hash = context.hash(secret)
+
+        """
+        if priority is not None:
+            self._get_priority_index(priority)
+        local = self._local
+        orig = (getattr(local, "priority", None), getattr(local, "timeout", _UNSET))
+        if priority is not None:
+            local.priority = priority
+        if timeout is not _UNSET:
+            local.timeout = timeout
+        try:
+            yield self
+        finally:
+            local.priority, local.timeout = orig
+
+    #===================================================================
+    # admission
+    #===================================================================
+    def _acquire(self, priority, timeout):
+        """wait for slot, or raise OverloadError"""
+        index = self._get_priority_index(priority)
+        queues = self._queues
+        with self._cond:
+            if self._inflight < self.max_inflight and not any(queues[:index + 1]):
+                self._inflight += 1
+                self.admitted += 1
+                return
+            if self.queue_depth >= self.max_queue:
+                self.rejected += 1
+                raise exc.OverloadError("queue_full")
+            waiter = object()
+            queue = queues[index]
+            queue.append(waiter)
+            deadline = None if timeout is None else timer() + timeout
+            try:
+                while True:
+                    if (self._inflight < self.max_inflight and queue[0] is waiter and
+                            not any(queues[:index])):
+                        queue.popleft()
+                        self._inflight += 1
+                        self.admitted += 1
+                        return
+                    if deadline is None:
+                        self._cond.wait()
+                        continue
+                    remaining = deadline - timer()
+                    if remaining <= 0:
+                        self.timed_out += 1
+                        raise exc.OverloadError("timeout")
+                    self._cond.wait(remaining)
+            finally:
+                if queue and waiter in queue:
+                    # timed out, or interrupted by some other error
+                    queue.remove(waiter)
+                # let other waiters re-check whether they're now at the front
+                self._cond.notify_all()
+
+    def _release(self):
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def admit(self):
+        """
+        context manager which waits until the caller is admitted,
+        or raises :exc:`~passlib.exc.OverloadError`.
+        Nested calls from within an admitted block (e.g. if the application
+        wraps its own code in :meth:`!admit`) are admitted immediately.
+        """
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth:
+            local.depth = depth + 1
+            try:
+                yield
+            finally:
+                local.depth = depth
+            return
+        priority = getattr(local, "priority", None) or self.priorities[0]
+        timeout = getattr(local, "timeout", _UNSET)
+        if timeout is _UNSET:
+            timeout = self.timeout
+        self._acquire(priority, timeout)
+        local.depth = 1
+        try:
+            yield
+        finally:
+            local.depth = 0
+            self._release()
+
+    #===================================================================
+    # eoc
+    #===================================================================
+
+#=============================================================================
+# metrics
+#=============================================================================
+
+#: histogram buckets (in seconds) used by ContextMetrics
+_default_buckets = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+class _MetricSeries(object):
+    """counters & latency histogram for a single (method, scheme, category, backend)"""
+    __slots__ = ("calls", "failures", "errors", "needs_update", "buckets", "total")
+
+    def __init__(self, size):
+        self.calls = self.failures = self.errors = self.needs_update = 0
+        self.buckets = [0] * size
+        self.total = 0.0
+
+class ContextMetrics(object):
+    """Collects usage statistics from a :class:`CryptContext`.
+
+    This is an opt-in helper for applications which want to know how their
+    password hashing is actually performing (e.g. for capacity planning).
+    It can be enabled by passing ``metrics=ContextMetrics()`` to :class:`CryptContext`;
+    contexts created without it aren't affected at all.
+    The same instance may be shared by multiple contexts.
+
+    The following are recorded for each call to :meth:`~CryptContext.hash`,
+    :meth:`~CryptContext.verify`, :meth:`~CryptContext.verify_and_update`,
+    :meth:`~CryptContext.needs_update`, and :meth:`~CryptContext.dummy_verify`
+    (including the asyncio versions, and :meth:`~CryptContext.verify_many`),
+    broken down by method, scheme, category, and backend:
+
+    * number of calls, and a histogram of how long they took.
+    * number of failed verifications (i.e. the wrong password).
+    * number of errors (calls which raised an exception).
+    * for :meth:`!verify_and_update`, number of hashes that were replaced;
+      and for :meth:`!needs_update`, number of hashes which needed replacing.
+
+    Calls answered from the context's *verify_cache* don't run the hash,
+    and so aren't recorded. Additionally, the number of hashes which couldn't be
+    identified (by any method) is recorded per category.
+
+    :param buckets:
+        upper bounds (in seconds) for the latency histogram buckets.
+        Defaults to a range from 1ms to 10s.
+
+    .. versionadded:: 1.8
+    """
+    #===================================================================
+    # init
+    #===================================================================
+    def __init__(self, buckets=None):
+        if buckets is None:
+            buckets = _default_buckets
+        buckets = tuple(sorted(buckets))
+        if not buckets or buckets[0] <= 0:
+            raise ValueError("buckets must be a non-empty list of positive numbers")
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """discard all recorded statistics"""
+        with self._lock:
+            self._series = {}
+            self._identify_misses = {}
+
+    #===================================================================
+    # recording
+    #===================================================================
+    @staticmethod
+    def _get_key(method, record, category):
+        """return series key for method & record"""
+        # NOTE: backend may change via set_backend(), so looking it up each time.
+        #       done before acquiring lock, since get_backend() may have to load a backend.
+        backend = record.get_backend() if hasattr(record, "get_backend") else None
+        return method, record.name, category, backend
+
+    def _get_series(self, key):
+        """return series for key, creating if needed (lock must be held)"""
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _MetricSeries(len(self.buckets) + 1)
+        return series
+
+    def _observe(self, series, elapsed):
+        """add call to series (lock must be held)"""
+        series.calls += 1
+        series.total += elapsed
+        buckets = self.buckets
+        idx = 0
+        end = len(buckets)
+        while idx < end and elapsed > buckets[idx]:
+            idx += 1
+        series.buckets[idx] += 1
+
+    @staticmethod
+    def _get_outcome(method, record, result):
+        """return name of counter (besides calls) to increment for result of call, if any"""
+        if method == "verify":
+            return None if result else "failures"
+        elif method == "verify_and_update":
+            # NOTE: result is from handler's verify_and_needs_update()
+            verified, needs_update = result
+            if not verified:
+                return "failures"
+            return "needs_update" if (needs_update or record.deprecated) else None
+        elif method == "needs_update":
+            return "needs_update" if result else None
+        return None
+
+    def _call(self, method, record, category, func, *args, **kwds):
+        """
+        invoke ``func(*args, **kwds)``, and record it under method & record.
+        (used by :meth:`CryptContext._call_handler`).
+        """
+        start = timer()
+        try:
+            result = func(*args, **kwds)
+        except Exception:
+            elapsed = timer() - start
+            key = self._get_key(method, record, category)
+            with self._lock:
+                series = self._get_series(key)
+                self._observe(series, elapsed)
+                series.errors += 1
+            raise
+        elapsed = timer() - start
+        key = self._get_key(method, record, category)
+        outcome = self._get_outcome(method, record, result)
+        with self._lock:
+            series = self._get_series(key)
+            self._observe(series, elapsed)
+            if outcome is not None:
+                setattr(series, outcome, getattr(series, outcome) + 1)
+        return result
+
+    def _identify_miss(self, category):
+        """record hash which couldn't be identified"""
+        with self._lock:
+            misses = self._identify_misses
+            misses[category] = misses.get(category, 0) + 1
+
+    #===================================================================
+    # reporting
+    #===================================================================
+    def snapshot(self):
+        """
+        Return the current statistics, as a JSON-compatible dict::
+
+            {
+                "series": [
+                    {
+                        "method": "verify",  # hash, verify, verify_and_update, needs_update, or dummy_verify
+                        "scheme": "bcrypt",
+                        "category": None,
+                        "backend": "bcrypt",  # None for schemes w/o multiple backends
+                        "calls": 10,
+                        "failures": 1,  # verify returned False
+                        "errors": 0,  # raised an exception
+                        "needs_update": 0,  # verify_and_update returned a new hash (or needs_update returned True)
+                        "latency": {
+                            "buckets": [[0.001, 0], [0.0025, 0], ..., ["+Inf", 10]],  # cumulative
+                            "sum": 2.51,  # total seconds
+                        },
+                    },
+                    ...
+                ],
+                "identify_misses": {"": 2},  # maps category -> count ("" for default category)
+            }
+        """
+        with self._lock:
+            items = [(key, series.calls, series.failures, series.errors, series.needs_update,
+                      list(series.buckets), series.total)
+                     for key, series in self._series.items()]
+            misses = dict((category or "", count)
+                          for category, count in self._identify_misses.items())
+        bounds = list(self.buckets) + ["+Inf"]
+        result = []
+        for key, calls, failures, errors, needs_update, buckets, total in sorted(items, key=_key_sort):
+            method, scheme, category, backend = key
+            cumulative = []
+            count = 0
+            for bound, value in zip(bounds, buckets):
+                count += value
+                cumulative.append([bound, count])
+            result.append(dict(method=method, scheme=scheme, category=category, backend=backend,
+                               calls=calls, failures=failures, errors=errors,
+                               needs_update=needs_update,
+                               latency=dict(buckets=cumulative, sum=total)))
+        return dict(series=result, identify_misses=misses)
+
+    def to_prometheus(self, prefix="passlib"):
+        """
+        Return the current statistics in the
+        `Prometheus text exposition format <https://prometheus.io/docs/instrumenting/exposition_formats/>`_,
+        e.g. for serving from a ``/metrics`` endpoint.
+        All metric names start with *prefix* (defaults to ``"passlib"``).
+        """
+        data = self.snapshot()
+        lines = []
+        add = lines.append
+
+        def render(**labels):
+            return ",".join('%s="%s"' % (name, _escape_label(value))
+                            for name, value in sorted(labels.items()))
+
+        def labels_of(entry):
+            return dict(method=entry["method"], scheme=entry["scheme"],
+                        category=entry["category"] or "", backend=entry["backend"] or "")
+
+        for name, field, text in [
+            ("calls_total", "calls", "Number of CryptContext calls."),
+            ("failures_total", "failures", "Number of verifications which failed to match."),
+            ("errors_total", "errors", "Number of calls which raised an error."),
+            ("needs_update_total", "needs_update", "Number of hashes which needed replacing."),
+        ]:
+            add("# HELP %s_%s %s" % (prefix, name, text))
+            add("# TYPE %s_%s counter" % (prefix, name))
+            for entry in data["series"]:
+                add("%s_%s{%s} %d" % (prefix, name, render(**labels_of(entry)), entry[field]))
+
+        name = prefix + "_duration_seconds"
+        add("# HELP %s Time taken by CryptContext calls." % name)
+        add("# TYPE %s histogram" % name)
+        for entry in data["series"]:
+            labels = labels_of(entry)
+            latency = entry["latency"]
+            for bound, count in latency["buckets"]:
+                add("%s_bucket{%s} %d" % (name, render(le=_format_bound(bound), **labels), count))
+            add("%s_sum{%s} %r" % (name, render(**labels), latency["sum"]))
+            add("%s_count{%s} %d" % (name, render(**labels), entry["calls"]))
+
+        name = prefix + "_identify_misses_total"
+        add("# HELP %s Number of hashes which couldn't be identified." % name)
+        add("# TYPE %s counter" % name)
+        for category, count in sorted(data["identify_misses"].items()):
+            add("%s{%s} %d" % (name, render(category=category), count))
+        return "\n".join(lines) + "\n"
+
+    #===================================================================
+    # eoc
+    #===================================================================
+
+def _key_sort(item):
+    """sort key for ContextMetrics series, treating None as less than anything"""
+    return tuple((value is not None, value) for value in item[0])
+
+def _escape_label(value):
+    """escape prometheus label value"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_bound(bound):
+    """format histogram bucket bound for prometheus"""
+    return bound if isinstance(bound, str) else repr(float(bound))
+
+#=============================================================================
+# config file watcher
+#=============================================================================
+def _stat_signature(path):
+    """
+    return value which changes whenever file is modified or replaced
+    (used by ConfigWatcher to cheaply detect changes).
+    """
+    st = os.stat(path)
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+class ConfigWatcher(object):
+    """Keeps a :class:`CryptContext` in sync with the INI file it was loaded from.
+
+    Instances are created by passing ``watch=True`` to :meth:`CryptContext.from_path`,
+    and are available via the resulting context's :attr:`~CryptContext.watcher` attribute.
+    A background (daemon) thread checks the file's inode, size, and mtime
+    every *interval* seconds. When it changes, the new configuration is parsed
+    & compiled in that thread, and then installed in the context with a single assignment;
+    calls already in progress finish using the policy they started with,
+    and successful :meth:`~CryptContext.verify` results cached under the old policy
+    are never returned for the new one.
+
+    If the context was created with a *snapshot_path*, reloads are restored from
+    the snapshot when it matches the file's new contents; otherwise the snapshot
+    is rewritten after the new configuration has been loaded.
+
+    If the new configuration can't be loaded (e.g. it's missing, or invalid),
+    the context keeps its current policy, the error is logged and counted,
+    and the file isn't retried until it changes again.
+
+    .. attribute:: reloads
+
+        number of times the configuration has been reloaded
+        (not counting the initial load).
+
+    .. attribute:: failures
+
+        number of reload attempts which failed.
+
+    .. attribute:: last_error
+
+        exception raised by the most recent reload attempt, or ``None`` if it succeeded.
+
+    .. attribute:: last_latency
+
+        number of seconds the most recent successful reload took to parse & compile,
+        or ``None`` if there hasn't been one.
+
+    .. versionadded:: 1.8
+    """
+    #===================================================================
+    # instance attrs
+    #===================================================================
+
+    #: number of successful reloads
+    reloads = 0
+
+    #: number of failed reload attempts
+    failures = 0
+
+    #: exception from last reload attempt (or None)
+    last_error = None
+
+    #: time taken by last successful reload (or None)
+    last_latency = None
+
+    #: background thread (or None if not running)
+    _thread = None
+
+    #===================================================================
+    # init
+    #===================================================================
+    def __init__(self, context, path, section="passlib", encoding="utf-8",
+                 interval=5, signature=None, snapshot_path=None):
+        if not isinstance(interval, num_types):
+            raise ExpectedTypeError(interval, "int or float", "interval")
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        # NOTE: only keeping weak ref, so background thread doesn't keep context alive.
+        self._context_ref = weakref.ref(context)
+        self.path = path
+        self.section = section
+        self.encoding = encoding
+        self.interval = interval
+        self.snapshot_path = snapshot_path
+        self._signature = signature
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def __repr__(self):
+        return "<ConfigWatcher path=%r reloads=%d failures=%d>" % (self.path, self.reloads,
+                                                                  self.failures)
+
+    #===================================================================
+    # polling
+    #===================================================================
+    def check(self):
+        """
+        Reload the context's configuration if the file has changed since it was last loaded.
+        This is normally called periodically by the background thread,
+        but may be called directly (e.g. from a ``SIGHUP`` handler).
+
+        :returns:
+            ``True`` if the configuration was reloaded, ``False`` if the file was unchanged,
+            or the new configuration failed to load.
+        """
+        context = self._context_ref()
+        if context is None:
+            return False
+        with self._lock:
+            # NOTE: signature is read *before* the file, so a change made while
+            #       reading the file will be picked up by the next check.
+            try:
+                signature = _stat_signature(self.path)
+            except OSError as err:
+                signature = None
+                error = err
+            else:
+                error = None
+            if signature == self._signature and (signature or self.last_error):
+                return False
+            self._signature = signature
+            start = timer()
+            try:
+                if error:
+                    raise error
+                config, source = self._load_config(context)
+            except Exception as err:
+                self.failures += 1
+                self.last_error = err
+                log.warning("failed to reload CryptContext config from %r, keeping current "
+                            "policy: %s", self.path, err)
+                return False
+            prepared = list(context._state.dummy_hashes)
+            context._set_config(config)
+            self.reloads += 1
+            self.last_error = None
+            self.last_latency = timer() - start
+            log.info("reloaded CryptContext config from %r", self.path)
+            if prepared:
+                # NOTE: keeping dummy_verify() prepared, if app had done so before reload.
+                try:
+                    context.prepare_dummy_verify(prepared, background=False)
+                except Exception as err:
+                    log.debug("failed to precalculate dummy_verify() hashes: %s", err)
+            if source is not None:
+                try:
+                    context._write_snapshot(self.snapshot_path, source, self.section)
+                except OSError as err:
+                    log.warning("unable to write context snapshot %r: %s", self.snapshot_path, err)
+            return True
+
+    def _load_config(self, context):
+        """
+        load config file (or snapshot), and return ``(config, source)``;
+        where *config* is the new _CryptConfig instance, and *source* is the
+        file contents if the snapshot needs to be rewritten, else ``None``.
+        """
+        with open(self.path, "rb") as fh:
+            source = fh.read()
+        snapshot_path = self.snapshot_path
+        if snapshot_path is not None:
+            try:
+                with open(snapshot_path, "rb") as fh:
+                    state = _parse_snapshot(fh.read(), source, self.section)
+                return _CryptConfig._from_state(state, parent=context._config), None
+            except (OSError, ValueError) as err:
+                log.debug("rebuilding context snapshot %r: %s", snapshot_path, err)
+        kwds = context._parse_ini_stream(StringIO(source.decode(self.encoding)),
+                                         self.section, self.path)
+        parse = context._parse_config_key
+        config = _CryptConfig(dict((parse(key), value) for key, value in kwds.items()),
+                              parent=context._config)
+        return config, (None if snapshot_path is None else source)
+
+    #===================================================================
+    # background thread
+    #===================================================================
+    @property
+    def running(self):
+        """whether the background thread is running"""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self):
+        """start background thread (if not already running)"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        thread = self._thread = threading.Thread(target=self._run, name="passlib-config-watcher")
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        """stop background thread"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def _run(self):
+        """background thread main loop"""
+        while not self._stop_event.wait(self.interval):
+            if self._context_ref() is None:
+                return
+            try:
+                self.check()
+            except Exception: # pragma: no cover -- check() shouldn't raise
+                log.exception("error checking CryptContext config %r", self.path)
+
+    #===================================================================
+    # eoc
+    #===================================================================
+
+#=============================================================================
+# record interning
+#=============================================================================
+
+# NOTE: processes holding many CryptContexts (e.g. one per tenant) will frequently
+#       have the same settings in most of them. so rather than having each create
+#       its own set of handler subclasses, the records (and record lists) are
+#       interned here, keyed by handler + settings. entries are weakly referenced,
+#       so they're discarded once no context uses them; except that the most recently
+#       used ones are kept alive (see _recent_records), so code which builds a short-lived
+#       context per request (e.g. via CryptContext.copy()) doesn't rebuild its records each time.
+#       this is private to CryptContext -- the public handler.using() still returns a new class.
+
+#: lock held while accessing _record_cache / _recent_records / _record_list_cache
+_record_cache_lock = threading.Lock()
+
+#: map of (handler, deprecated, settings) -> record created by _CryptConfig._create_record()
+_record_cache = weakref.WeakValueDictionary()
+
+#: map of key -> record for the most recently used _record_cache entries, in LRU order
+_recent_records = OrderedDict()
+
+#: max number of records kept alive by _recent_records
+_max_recent_records = 256
+
+def _touch_record(key, record):
+    """mark _record_cache entry as most recently used (caller must hold lock)"""
+    recent = _recent_records
+    recent[key] = record
+    recent.move_to_end(key)
+    while len(recent) > _max_recent_records:
+        recent.popitem(last=False)
+
+#: map of tuple of records -> _RecordList instance containing them
+_record_list_cache = weakref.WeakValueDictionary()
+
+def _get_record_key(handler, deprecated, settings):
+    """
+    return key used by _record_cache for record,
+    or ``None`` if the settings can't be used as a key.
+    """
+    # NOTE: including type of each value, so that e.g. vary_rounds=1 (rounds)
+    #       doesn't collide with vary_rounds=1.0 (percent).
+    key = (handler, bool(deprecated),
+           tuple(sorted((name, type(value), value) for name, value in settings.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+#: attrs of record classes which are recreated by type(), or set by _CryptConfig,
+#: and so aren't included in the output of _get_record_state()
+_record_state_ignored_attrs = frozenset(["__abstractmethods__", "_abc_impl",
+                                         "_Context__orig_handler", "_Context__state"])
+
+def _get_record_state(record, handler):
+    """
+    return ``[name, attrs]`` describing the record created by
+    ``handler.using(**settings)``, for storing in a snapshot; or ``None``
+    if the record can't be recreated directly from its attrs
+    (see :meth:`_CryptConfig._restore_record`).
+    """
+    # NOTE: this excludes PrefixWrapper records, which aren't classes
+    if not isinstance(record, type) or record.__bases__ != (handler,):
+        return None
+    attrs = {}
+    for name, value in record.__dict__.items():
+        if name in _record_state_ignored_attrs:
+            continue
+        # NOTE: only storing values which survive a round trip through JSON unchanged
+        if value is not None and type(value) not in (str, int, float, bool):
+            return None
+        attrs[name] = value
+    return [record.__name__, attrs]
+
+class _RecordList(list):
+    """
+    list of records for a given category (see :meth:`_CryptConfig._get_record_list`);
+    separate class so it can be weakly referenced by _record_list_cache,
+    and can store the identify dispatch table built from it.
+    """
+    #: dispatch table built by _CryptConfig._get_identify_index()
+    identify_index = None
+
 #=============================================================================
 # _CryptConfig helper class
 #=============================================================================
@@ -89,6 +1189,12 @@ class _CryptConfig(object):
     that just complicates interface too much (c.f. CryptPolicy)
 
     :arg source: config as dict mapping ``(cat,scheme,option) -> value``
+
+    :param parent:
+        optional existing :class:`!_CryptConfig` this one is derived from
+        (e.g. by :meth:`CryptContext.copy`). records, record lists, and identify
+        dispatch tables whose options are unchanged will be reused from *parent*,
+        rather than built from scratch.
     """
     #===================================================================
     # instance attrs
@@ -120,18 +1226,27 @@ class _CryptConfig(object):
     # dict mapping (scheme, category) -> custom handler
     _records = None
 
+    # dict mapping (scheme, category) -> options passed to _create_record(),
+    # for each record created by _init_records(). used to detect which records
+    # can be reused when deriving a new config from this one.
+    _record_options = None
+
     # dict mapping category -> list of custom handler instances for that category,
     # in order of schemes(). populated on demand by _get_record_list()
     _record_lists = None
 
+    # dict mapping category -> identify dispatch table used by identify_record().
+    # populated on demand by _get_identify_index()
+    _identify_indexes = None
+
     #===================================================================
     # constructor
     #===================================================================
-    def __init__(self, source):
+    def __init__(self, source, parent=None):
         self._init_scheme_list(source.get((None,None,"schemes")))
         self._init_options(source)
         self._init_default_schemes()
-        self._init_records()
+        self._init_records(parent)
 
     def _init_scheme_list(self, data):
         """initialize .handlers and .schemes attributes"""
@@ -459,31 +1574,75 @@ class _CryptConfig(object):
     #===================================================================
     # CryptRecord objects
     #===================================================================
-    def _init_records(self):
+    def _init_records(self, parent=None):
         # NOTE: this step handles final validation of settings,
         #       checking for violations against handler's internal invariants.
         #       this is why we create all the records now,
         #       so CryptContext throws error immediately rather than later.
         self._record_lists = {}
+        self._identify_indexes = {}
         records = self._records = {}
+        record_options = self._record_options = {}
         all_context_kwds = self.context_kwds = set()
         get_options = self._get_record_options_with_flag
         categories = (None,) + self.categories
+        if parent is not None:
+            parent_records = parent._records
+            parent_options = parent._record_options
         for handler in self.handlers:
             scheme = handler.name
             all_context_kwds.update(handler.context_kwds)
             for cat in categories:
                 kwds, has_cat_options = get_options(scheme, cat)
                 if cat is None or has_cat_options:
-                    records[scheme, cat] = self._create_record(handler, cat, **kwds)
+                    key = (scheme, cat)
+                    record_options[key] = kwds
+                    # NOTE: records aren't modified once created, so if parent
+                    #       built one from the same handler & options, reuse it.
+                    if (parent is not None and parent_options.get(key, _UNSET) == kwds and
+                            parent_records[key]._Context__orig_handler is handler):
+                        records[key] = parent_records[key]
+                    else:
+                        records[key] = self._create_record(handler, cat, **kwds)
                 # NOTE: if handler has no category-specific opts, get_record()
                 # will automatically use the default category's record.
         # NOTE: default records for specific category stored under the
         # key (None,category); these are populated on-demand by get_record().
 
+        # build dispatch table for default category now,
+        # so any ambiguous prefixes are reported when context is built.
+        # (skipped when derived from a parent with the same handlers,
+        # since they were reported when the parent was built)
+        self._get_identify_index(None)
+        if not (parent is not None and _same_items(self.handlers, parent.handlers)):
+            self._check_identify_prefixes()
+
+    @staticmethod
+    def _create_record(handler, category=None, deprecated=False, _record_state=None, **settings):
+        # NOTE: records don't depend on category, and aren't modified once created;
+        #       so all configs w/ the same handler & settings can share the same record.
+        # NOTE: if _record_state is set (when restoring a snapshot), it's used to recreate
+        #       the record, rather than calling handler.using() -- see _restore_record().
+        key = _get_record_key(handler, deprecated, settings)
+        if key is not None:
+            with _record_cache_lock:
+                record = _record_cache.get(key)
+                if record is not None:
+                    _touch_record(key, record)
+                    return record
+        if _record_state is None:
+            record = _CryptConfig._build_record(handler, deprecated, settings)
+        else:
+            record = _CryptConfig._restore_record(handler, _record_state)
+        if key is not None:
+            with _record_cache_lock:
+                record = _record_cache.setdefault(key, record)
+                _touch_record(key, record)
+        return record
+
     @staticmethod
-    def _create_record(handler, category=None, deprecated=False, **settings):
-        # create custom handler if needed.
+    def _build_record(handler, deprecated, settings):
+        """helper for _create_record() -- creates new custom handler"""
         try:
             # XXX: relaxed=True is mostly here to retain backwards-compat behavior.
             #      could make this optional flag in future.
@@ -503,6 +1662,19 @@ class _CryptConfig(object):
         ##subcls._Context__category = category
         subcls._Context__orig_handler = handler
         subcls.deprecated = deprecated  # attr reserved for this purpose
+        subcls._Context__state = _get_record_state(subcls, handler)
+        return subcls
+
+    @staticmethod
+    def _restore_record(handler, state):
+        """
+        helper for _create_record() -- recreates custom handler from
+        the output of _get_record_state(), without calling ``handler.using()``.
+        """
+        name, attrs = state
+        subcls = type(name, (handler,), attrs)
+        subcls._Context__orig_handler = handler
+        subcls._Context__state = state
         return subcls
 
     def _get_record_options_with_flag(self, scheme, category):
@@ -583,13 +1755,91 @@ class _CryptConfig(object):
             return self._record_lists[category]
         except KeyError:
             pass
-        # cache miss - build list from scratch
-        value = self._record_lists[category] = [
-            self.get_record(scheme, category)
-            for scheme in self.schemes
-            ]
+        # cache miss - build list from scratch, and intern it
+        # NOTE: since records are interned, any config w/ the same settings will have
+        #       the exact same records, and so can share the same list.
+        records = tuple(self.get_record(scheme, category) for scheme in self.schemes)
+        with _record_cache_lock:
+            value = _record_list_cache.get(records)
+            if value is None:
+                value = _record_list_cache[records] = _RecordList(records)
+        self._record_lists[category] = value
         return value
 
+    def _get_identify_index(self, category=None):
+        """return identify dispatch table for category (cached)
+
+        this is an internal helper used only by identify_record().
+        it returns a tuple ``(records, prefix_map, prefix_sizes, unprefixed)``, where
+        *prefix_map* maps each known ident prefix -> list of positions within *records*;
+        *prefix_sizes* is a tuple of all the distinct prefix lengths;
+        and *unprefixed* is a list of the positions of records which have
+        no known prefix, and must always be checked.
+
+        prefixes which are ambiguous (claimed by more than one record, or overlapping
+        another record's prefix; e.g. ``$p5k2$`` used by both cta_pbkdf2_sha1 & dlitz_pbkdf2_sha1)
+        map to the positions of *all* the records, so hashes starting with them
+        fall back to a linear scan, exactly as if there was no dispatch table.
+        """
+        # type check of category - handled by _get_record_list()
+        try:
+            return self._identify_indexes[category]
+        except KeyError:
+            pass
+        records = self._get_record_list(category)
+        # record lists are interned (see _get_record_list()), so another config
+        # using the same records may have already built the table.
+        value = records.identify_index
+        if value is not None:
+            self._identify_indexes[category] = value
+            return value
+        prefix_map = {}
+        unprefixed = []
+        for idx, record in enumerate(records):
+            prefixes, _ = _get_identify_prefixes(record)
+            if prefixes is None:
+                unprefixed.append(idx)
+                continue
+            for prefix in set(prefixes):
+                prefix_map.setdefault(prefix, []).append(idx)
+        if prefix_map:
+            everything = list(range(len(records)))
+            for prefix, found in list(prefix_map.items()):
+                if len(found) > 1 or any(other != prefix and (other.startswith(prefix) or
+                                                              prefix.startswith(other))
+                                         for other in prefix_map):
+                    prefix_map[prefix] = everything
+        prefix_sizes = tuple(sorted(set(len(prefix) for prefix in prefix_map)))
+        value = self._identify_indexes[category] = (records, prefix_map,
+                                                    prefix_sizes, unprefixed)
+        records.identify_index = value
+        return value
+
+    def _check_identify_prefixes(self):
+        """
+        log any handler whose hashes will never be identified,
+        because an earlier handler claims all strings with the same prefix.
+
+        .. note::
+            this is only logged at debug level, since such configurations
+            (e.g. :data:`passlib.apps.master_context`) are valid,
+            and are identified the same as they always have been.
+        """
+        info = [(handler.name,) + _get_identify_prefixes(handler)
+                for handler in self.handlers]
+        for idx, (name, prefixes, exact) in enumerate(info):
+            if not (prefixes and exact):
+                continue
+            for other, other_prefixes, _ in info[idx+1:]:
+                for prefix in prefixes:
+                    if other_prefixes and any(value.startswith(prefix)
+                                              for value in other_prefixes):
+                        log.debug("%r hashes may be misidentified as %r hashes, "
+                                  "since both use the %r prefix; %r should be listed "
+                                  "before %r in the schemes list",
+                                  other, name, prefix, other, name)
+                        break
+
     def identify_record(self, hash, category, required=True):
         """internal helper to identify appropriate custom handler for hash"""
         # NOTE: this is part of the critical path shared by
@@ -599,12 +1849,32 @@ class _CryptConfig(object):
         #        this will only return first match. might want to do something
         #        about this in future, but for now only hashes with
         #        unique identifiers will work properly in a CryptContext.
-        # XXX: if all handlers have a unique prefix (e.g. all are MCF / LDAP),
-        #      could use dict-lookup to speed up this search.
         if not isinstance(hash, unicode_or_bytes):
             raise ExpectedStringError(hash, "hash")
-        # type check of category - handled by _get_record_list()
-        for record in self._get_record_list(category):
+        # type check of category - handled by _get_identify_index()
+        # NOTE: rather than trying every record in turn, this looks up
+        #       the records whose ident prefix matches the hash,
+        #       and only falls back to checking records w/o a known prefix.
+        #       candidates are still checked in order of schemes().
+        records, prefix_map, prefix_sizes, unprefixed = self._get_identify_index(category)
+        if prefix_map:
+            key = uh.to_unicode_for_identify(hash)
+            candidates = None
+            for size in prefix_sizes:
+                found = prefix_map.get(key[:size])
+                if found:
+                    if candidates is None:
+                        candidates = found
+                    else:
+                        candidates = candidates + found
+            if candidates is None:
+                candidates = unprefixed
+            elif unprefixed or len(candidates) > 1:
+                candidates = sorted(set(candidates).union(unprefixed))
+        else:
+            candidates = unprefixed
+        for idx in candidates:
+            record = records[idx]
             if record.identify(hash):
                 return record
         if not required:
@@ -673,10 +1943,228 @@ class _CryptConfig(object):
                     for key in sorted(kwds):
                         yield (cat, scheme, key), kwds[key]
 
+    #===================================================================
+    # snapshots
+    #===================================================================
+    def _get_state(self):
+        """
+        return compiled state of config, as JSON-compatible dict
+        (used by :meth:`CryptContext.to_snapshot`).
+
+        unlike :meth:`iter_config`, this stores the options in their normalized form,
+        along with the default schemes, and the options & attrs of each record;
+        so :meth:`_from_state` can restore them directly.
+        """
+        return dict(
+            schemes=list(self.schemes),
+            categories=list(self.categories),
+            scheme_options=[[scheme, cat, key, value]
+                            for scheme, category_map in self._scheme_options.items()
+                            for cat, kwds in category_map.items()
+                            for key, value in kwds.items()],
+            # NOTE: 'schemes' option may contain handler objects, and is stored above
+            context_options=[[key, cat, value]
+                             for key, category_map in self._context_options.items()
+                             if key != "schemes"
+                             for cat, value in category_map.items()],
+            default_schemes=[[cat, scheme] for cat, scheme in self._default_schemes.items()],
+            records=[[scheme, cat, kwds, self._records[scheme, cat]._Context__state]
+                     for (scheme, cat), kwds in self._record_options.items()],
+        )
+
+    @classmethod
+    def _from_state(cls, state, parent=None):
+        """
+        recreate config from output of :meth:`_get_state`
+        (used by :meth:`CryptContext.from_snapshot`).
+
+        this skips normalizing the options, and recreates each record
+        from its stored attrs, rather than via ``handler.using()``
+        (records whose attrs couldn't be stored fall back to the latter).
+        if *parent* is provided, unchanged records are reused from it,
+        as with the main constructor.
+        """
+        self = cls.__new__(cls)
+        try:
+            self.schemes = schemes = tuple(state["schemes"])
+            self.handlers = handlers = tuple(get_crypt_handler(scheme) for scheme in schemes)
+            self.categories = tuple(state["categories"])
+            self._scheme_options = scheme_options = {}
+            for scheme, cat, key, value in state["scheme_options"]:
+                scheme_options.setdefault(scheme, {}).setdefault(cat, {})[key] = value
+            self._context_options = context_options = {}
+            for key, cat, value in state["context_options"]:
+                context_options.setdefault(key, {})[cat] = value
+            self._default_schemes = dict(state["default_schemes"])
+            record_states = [(scheme, cat, dict(kwds), record_state)
+                             for scheme, cat, kwds, record_state in state["records"]]
+        except (TypeError, ValueError, KeyError) as err:
+            raise ValueError("malformed context snapshot: %s" % (err,))
+
+        # recreate records
+        self._record_lists = {}
+        self._identify_indexes = {}
+        records = self._records = {}
+        record_options = self._record_options = {}
+        self.context_kwds = set().union(*(handler.context_kwds for handler in handlers))
+        if parent is not None:
+            parent_records = parent._records
+            parent_options = parent._record_options
+        for scheme, cat, kwds, record_state in record_states:
+            key = (scheme, cat)
+            handler = handlers[schemes.index(scheme)]
+            record_options[key] = kwds
+            if (parent is not None and parent_options.get(key, _UNSET) == kwds and
+                    parent_records[key]._Context__orig_handler is handler):
+                records[key] = parent_records[key]
+            else:
+                records[key] = self._create_record(handler, cat, _record_state=record_state, **kwds)
+
+        # NOTE: not checking for ambiguous prefixes,
+        #       since they were reported when the snapshot was created.
+        self._get_identify_index(None)
+        return self
+
     #===================================================================
     # eoc
     #===================================================================
 
+#=============================================================================
+# dummy_verify() helpers
+#=============================================================================
+
+#: maps record -> ``(secret, hash)`` precalculated for dummy_verify(),
+#: so contexts sharing the same records (e.g. via copy(), or identical settings)
+#: don't each have to recalculate it.
+_dummy_record_hashes = weakref.WeakKeyDictionary()
+
+class _DummyHashes(dict):
+    """
+    dict mapping category -> hash used by :meth:`CryptContext.dummy_verify`,
+    for a single :class:`_CryptConfig`.
+
+    Only ``None`` and the configured categories are stored; any other category
+    uses the same settings as ``None``, so it shares that hash
+    (this keeps callers passing arbitrary category strings from growing the dict).
+    """
+    def __init__(self, config, secret):
+        super().__init__()
+        self.config = config
+        self.secret = secret
+
+    def norm_category(self, category):
+        """map category onto key used by dict"""
+        if category is None or category in self.config.categories:
+            return category
+        return None
+
+    def get_hash(self, category):
+        """return hash for category (calculating it if needed)"""
+        category = self.norm_category(category)
+        try:
+            return self[category]
+        except KeyError:
+            pass
+        # NOTE: no lock is held while hashing, so a concurrent call (or a fork)
+        #       can't leave other callers waiting on it; at worst two threads
+        #       both calculate the hash, and the first one stored is used.
+        #       calling record directly, so this isn't subject to admission control etc.
+        secret = self.secret
+        record = self.config.get_record(None, category)
+        entry = _dummy_record_hashes.get(record)
+        if entry is None or entry[0] != secret:
+            entry = _dummy_record_hashes.setdefault(record, (secret, record.hash(secret)))
+        return self.setdefault(category, entry[1])
+
+    def build(self, categories=None):
+        """calculate hashes for categories (defaults to ``None`` + all configured categories)"""
+        if categories is None:
+            categories = (None,) + self.config.categories
+        for category in categories:
+            self.get_hash(category)
+
+#=============================================================================
+# per-configuration state
+#=============================================================================
+def _strip_unused_context_kwds(context_kwds, kwds, record):
+    """
+    helper for :class:`_ContextState` -- removes any context keywords from **kwds**
+    that are known to be used by another scheme in the config (*context_kwds*),
+    but are NOT supported by handler specified by **record**.
+    """
+    if not kwds:
+        return
+    for key in context_kwds.difference(record.context_kwds):
+        kwds.pop(key, None)
+
+def _identify_record_metered(identify_record, metrics, hash, category, required=True):
+    """
+    helper for :class:`_ContextState` -- wraps ``_CryptConfig.identify_record()``,
+    recording any hashes which can't be identified with :class:`ContextMetrics`.
+    """
+    try:
+        record = identify_record(hash, category, required)
+    except ValueError:
+        metrics._identify_miss(category)
+        raise
+    if record is None:
+        metrics._identify_miss(category)
+    return record
+
+class _ContextState(object):
+    """
+    all the state :class:`CryptContext` derives from a single :class:`_CryptConfig`.
+
+    This is kept in a single object, so installing a new configuration
+    (e.g. via :meth:`CryptContext.load`, or a :class:`ConfigWatcher` reload)
+    is a single assignment. Each call reads the state once, and uses it throughout;
+    so it sees either the old configuration or the new one, never a mix of the two.
+    """
+    __slots__ = ("config", "get_record", "identify_record", "strip_unused",
+                 "cache_scope", "dummy_hashes", "verify_latency")
+
+    #: source of unique cache_scope values
+    _counter = itertools.count()
+
+    def __init__(self, config, dummy_secret, calibrate_dummy_verify=False, metrics=None):
+        self.config = config
+        # NOTE: copy of config methods, stored here for speed.
+        self.get_record = config.get_record
+        # NOTE: all hash identification goes through this (including by get_or_identify_record()),
+        #       so it's the one place that identify misses need to be recorded.
+        if metrics is None:
+            self.identify_record = config.identify_record
+        else:
+            self.identify_record = partial(_identify_record_metered, config.identify_record, metrics)
+        # NOTE: as optimization, this is None if there are no context kwds.
+        if config.context_kwds:
+            self.strip_unused = partial(_strip_unused_context_kwds, config.context_kwds)
+        else:
+            self.strip_unused = None
+        # token passed to VerifyCache, so entries added under a previous state
+        # can't be returned once this one has been installed.
+        self.cache_scope = next(self._counter).to_bytes(8, "big")
+        self.dummy_hashes = _DummyHashes(config, dummy_secret)
+        # dict mapping category -> moving average of verify() time, used to calibrate
+        # dummy_verify() (None if calibration is disabled)
+        self.verify_latency = {} if calibrate_dummy_verify else None
+
+    def get_or_identify_record(self, hash, scheme=None, category=None):
+        """return record based on scheme, or failing that, by identifying hash"""
+        if scheme:
+            if not isinstance(hash, unicode_or_bytes):
+                raise ExpectedStringError(hash, "hash")
+            return self.get_record(scheme, category)
+        else:
+            # hash typecheck handled by identify_record()
+            return self.identify_record(hash, category)
+
+#: methods whose handler calls are subject to admission control (see CryptContext._call_handler)
+_admitted_methods = frozenset(["hash", "verify", "verify_and_update", "dummy_verify"])
+
+#: methods whose handler calls are timed to calibrate dummy_verify() (see CryptContext._call_handler)
+_calibrated_methods = frozenset(["verify", "verify_and_update"])
+
 #=============================================================================
 # main CryptContext class
 #=============================================================================
@@ -704,20 +2192,73 @@ class CryptContext(object):
 
     # XXX: add wrap/unwrap callback hooks so app can mutate hash format?
 
-    # XXX: add method for detecting and warning user about schemes
-    #      which don't have any good distinguishing marks?
-    #      or greedy ones (unix_disabled, plaintext) which are not listed at the end?
+    # XXX: add method for detecting and warning user about schemes
+    #      which don't have any good distinguishing marks?
+    #      or greedy ones (unix_disabled, plaintext) which are not listed at the end?
+
+    #===================================================================
+    # instance attrs
+    #===================================================================
+
+    # _ContextState instance derived from current config (None until first loaded).
+    # NOTE: this is always replaced as a whole, never modified in place (see _set_config).
+    _state = None
+
+    # whether dummy_verify() calibration was requested
+    _calibrate_dummy_verify = False
+
+    # executor used by the async methods (None means use event loop's default)
+    _executor = None
+
+    # max number of hashes the async methods will run concurrently (None means no limit)
+    _max_concurrency = None
+
+    # (loop, semaphore) used by async methods to enforce _max_concurrency,
+    # created on demand by _get_async_semaphore()
+    _async_semaphore = None
+
+    # VerifyCache instance used by verify() (None if disabled)
+    _verify_cache = None
+
+    # AdmissionControl instance used to limit concurrent hashes (None if disabled)
+    _admission = None
+
+    # ConfigWatcher instance keeping config in sync w/ file (None if not watching)
+    _watcher = None
+
+    # ContextMetrics instance recording usage statistics (None if disabled)
+    _metrics = None
+
+    # NOTE: the following provide access to parts of the current _state,
+    #       for code which only needs one of them. anything which needs
+    #       more than one should read _state once, and use that throughout.
+
+    @property
+    def _config(self):
+        """_CryptConfig instance holding current parsed config"""
+        state = self._state
+        return None if state is None else state.config
+
+    @property
+    def _get_record(self):
+        return self._state.get_record
+
+    @property
+    def _identify_record(self):
+        return self._state.identify_record
 
-    #===================================================================
-    # instance attrs
-    #===================================================================
+    @property
+    def _strip_unused_context_kwds(self):
+        return self._state.strip_unused
 
-    # _CryptConfig instance holding current parsed config
-    _config = None
+    @property
+    def _dummy_hashes(self):
+        """_DummyHashes instance used by dummy_verify()"""
+        return self._state.dummy_hashes
 
-    # copy of _config methods, stored in CryptContext instance for speed.
-    _get_record = None
-    _identify_record = None
+    @property
+    def _verify_latency(self):
+        return self._state.verify_latency
 
     #===================================================================
     # secondary constructors
@@ -774,7 +2315,8 @@ class CryptContext(object):
         return self
 
     @classmethod
-    def from_path(cls, path, section="passlib", encoding="utf-8"):
+    def from_path(cls, path, section="passlib", encoding="utf-8", snapshot_path=None,
+                  watch=False, watch_interval=5):
         """create new CryptContext instance from an INI-formatted file.
 
         this functions exactly the same as :meth:`from_string`,
@@ -796,12 +2338,90 @@ class CryptContext(object):
             new CryptContext instance, configured based on the parameters
             stored in the file *path*.
 
+        :type snapshot_path: str
+        :param snapshot_path:
+            optional path to a snapshot file (see :meth:`to_snapshot`).
+            If the snapshot exists and was compiled from the current contents of *path*
+            by the current version of Passlib, the context is restored from it.
+            Otherwise the config file is loaded normally, and a fresh snapshot
+            is written to *snapshot_path* for next time.
+
+            .. versionadded:: 1.8
+
+        :type watch: bool
+        :param watch:
+            If ``True``, the returned context will keep itself in sync with *path*:
+            a background thread checks the file every *watch_interval* seconds (default 5),
+            and reloads the configuration whenever it changes.
+            Invalid configurations are logged & ignored, leaving the current policy in place.
+            If *snapshot_path* is set, it's used & kept up to date by each reload as well.
+            See :class:`ConfigWatcher` for details.
+
+            .. versionadded:: 1.8
+
         .. versionadded:: 1.6
 
         .. seealso:: :meth:`from_string` for an equivalent usage example.
         """
+        if not watch:
+            return cls._from_path(path, section, encoding, snapshot_path)
+        # NOTE: reading signature before loading, so any change made
+        #       while loading will be picked up by the first check.
+        signature = _stat_signature(path)
+        self = cls._from_path(path, section, encoding, snapshot_path)
+        self._watcher = ConfigWatcher(self, path, section, encoding, watch_interval,
+                                      signature=signature, snapshot_path=snapshot_path)
+        self._watcher.start()
+        return self
+
+    @classmethod
+    def _from_path(cls, path, section, encoding, snapshot_path):
+        """helper for from_path() -- load context from file (or snapshot)"""
+        if snapshot_path is None:
+            self = cls(_autoload=False)
+            self.load_path(path, section=section, encoding=encoding)
+            return self
+        with open(path, "rb") as fh:
+            source = fh.read()
+        try:
+            with open(snapshot_path, "rb") as fh:
+                return cls.from_snapshot(fh.read(), source=source, section=section)
+        except (OSError, ValueError) as err:
+            log.debug("rebuilding context snapshot %r: %s", snapshot_path, err)
+        self = cls(_autoload=False)
+        kwds = self._parse_ini_stream(StringIO(source.decode(encoding)), section, path)
+        self.load(kwds)
+        try:
+            self._write_snapshot(snapshot_path, source, section)
+        except OSError as err:
+            log.warning("unable to write context snapshot %r: %s", snapshot_path, err)
+        return self
+
+    @classmethod
+    def from_snapshot(cls, data, source=None, section="passlib"):
+        """restore CryptContext instance from a snapshot created by :meth:`to_snapshot`.
+
+        :type data: bytes
+        :arg data:
+            snapshot contents.
+
+        :type source: str, bytes, or None
+        :param source:
+            If provided, the snapshot is only accepted if it was created
+            from this INI-formatted config (and *section*).
+
+        :raises ValueError:
+            if the snapshot is malformed, was created by a different version
+            of Passlib, or doesn't match *source*.
+
+        :returns:
+            new :class:`CryptContext` instance.
+
+        .. versionadded:: 1.8
+        """
+        state = _parse_snapshot(data, source, section)
         self = cls(_autoload=False)
-        self.load_path(path, section=section, encoding=encoding)
+        self._set_config(_CryptConfig._from_state(state))
         return self
 
     def copy(self, **kwds):
@@ -835,11 +2455,24 @@ class CryptContext(object):
         """
         # XXX: it would be faster to store ref to self._config,
         #      but don't want to share config objects til sure
-        #      can rely on them being immutable.
-        other = CryptContext(_autoload=False)
-        other.load(self)
+        #      can rely on them being immutable. instead, new config is derived
+        #      from ours, which reuses any records whose options haven't changed.
+        cache = self._verify_cache
+        if cache is not None:
+            # NOTE: not sharing cache, since copy may have different config
+            cache = VerifyCache(cache.max_size, cache.ttl)
+        other = CryptContext(executor=self._executor,
+                             max_concurrency=self._max_concurrency,
+                             verify_cache=cache,
+                             admission=self._admission,
+                             calibrate_dummy_verify=self._calibrate_dummy_verify,
+                             metrics=self._metrics,
+                             _autoload=False)
+        source = dict(self._config.iter_config(resolve=True))
         if kwds:
-            other.load(kwds, update=True)
+            parse = self._parse_config_key
+            source.update((parse(key), value) for key, value in kwds.items())
+        other._set_config(_CryptConfig(source, parent=self._config))
         return other
 
     def using(self, **kwds):
@@ -853,10 +2486,39 @@ class CryptContext(object):
     #===================================================================
     def __init__(self, schemes=None,
                  # keyword only...
-                 _autoload=True, **kwds):
+                 executor=None, max_concurrency=None, verify_cache=None, admission=None,
+                 calibrate_dummy_verify=False, metrics=None, _autoload=True, **kwds):
         # XXX: add ability to make flag certain contexts as immutable,
         #      e.g. the builtin passlib ones?
         # XXX: add a name or import path for the contexts, to help out repr?
+        # NOTE: 'executor', 'max_concurrency', 'verify_cache', 'admission',
+        #       'calibrate_dummy_verify', and 'metrics' aren't part of the (serializable) configuration.
+        if isinstance(executor, str) and executor != "process":
+            raise ValueError("unknown executor: %r" % (executor,))
+        if max_concurrency is not None:
+            if not isinstance(max_concurrency, int):
+                raise ExpectedTypeError(max_concurrency, "int or None", "max_concurrency")
+            if max_concurrency < 1:
+                raise ValueError("max_concurrency must be >= 1")
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        if verify_cache is True:
+            verify_cache = VerifyCache()
+        elif verify_cache is False:
+            verify_cache = None
+        elif verify_cache is not None and not isinstance(verify_cache, VerifyCache):
+            raise ExpectedTypeError(verify_cache, "VerifyCache, bool, or None", "verify_cache")
+        self._verify_cache = verify_cache
+        if calibrate_dummy_verify:
+            self._calibrate_dummy_verify = True
+        if metrics is not None:
+            if not isinstance(metrics, ContextMetrics):
+                raise ExpectedTypeError(metrics, "ContextMetrics or None", "metrics")
+            self._metrics = metrics
+        if admission is not None:
+            if not isinstance(admission, AdmissionControl):
+                raise ExpectedTypeError(admission, "AdmissionControl or None", "admission")
+            self._admission = admission
         if schemes is not None:
             kwds['schemes'] = schemes
         if _autoload:
@@ -998,17 +2660,22 @@ class CryptContext(object):
         #-----------------------------------------------------------
         # compile into _CryptConfig instance, and update state
         #-----------------------------------------------------------
-        config = _CryptConfig(source)
-        self._config = config
-        self._reset_dummy_verify()
-        self._get_record = config.get_record
-        self._identify_record = config.identify_record
-        if config.context_kwds:
-            # (re-)enable method for this instance (in case ELSE clause below ran last load).
-            self.__dict__.pop("_strip_unused_context_kwds", None)
-        else:
-            # disable method for this instance, it's not needed.
-            self._strip_unused_context_kwds = None
+        # NOTE: passing current config as parent, so unchanged records are reused.
+        self._set_config(_CryptConfig(source, parent=self._config))
+
+    def _set_config(self, config):
+        """helper for load() -- install new _CryptConfig instance, and reset derived state"""
+        state = _ContextState(config, self._dummy_secret, self._calibrate_dummy_verify,
+                              self._metrics)
+        # NOTE: all derived state is installed w/ this single assignment (see _ContextState).
+        #       caches are only flushed afterwards; and any verify() still running under
+        #       the old state adds its result using the old state's cache_scope,
+        #       so it can't be returned for the new one.
+        self._state = state
+        if self._verify_cache is not None:
+            # NOTE: hashes verified under old config may not be valid under new one.
+            self._verify_cache.clear()
+        self._reset_process_pool()
 
     @staticmethod
     def _parse_config_key(ckey):
@@ -1245,6 +2912,47 @@ class CryptContext(object):
         return tuple(handler for handler in self._config.handlers
                      if not _is_handler_registered(handler))
 
+    @property
+    def verify_cache(self):
+        """
+        :class:`VerifyCache` instance used by this context, or ``None`` if caching
+        is not enabled (see the ``verify_cache`` constructor keyword).
+
+        .. versionadded:: 1.8
+        """
+        return self._verify_cache
+
+    @property
+    def admission(self):
+        """
+        :class:`AdmissionControl` instance used by this context, or ``None`` if
+        admission control is not enabled (see the ``admission`` constructor keyword).
+
+        .. versionadded:: 1.8
+        """
+        return self._admission
+
+    @property
+    def metrics(self):
+        """
+        :class:`ContextMetrics` instance recording statistics for this context,
+        or ``None`` if metrics are not enabled (see the ``metrics`` constructor keyword).
+
+        .. versionadded:: 1.8
+        """
+        return self._metrics
+
+    @property
+    def watcher(self):
+        """
+        :class:`ConfigWatcher` instance keeping this context in sync with its config file,
+        or ``None`` if it wasn't created via ``from_path(..., watch=True)``.
+        Its attributes report how many reloads have succeeded / failed, and how long they took.
+
+        .. versionadded:: 1.8
+        """
+        return self._watcher
+
     @property
     def context_kwds(self):
         """
@@ -1373,6 +3081,168 @@ class CryptContext(object):
                 ) % ", ".join(repr(handler.name) for handler in unregistered))
         return buf.getvalue()
 
+    def to_snapshot(self, source=None, section="passlib"):
+        """serialize the compiled configuration to a snapshot,
+        which can be restored via :meth:`from_snapshot`.
+
+        Unlike :meth:`to_string`, snapshots store the configuration
+        in its already normalized form, along with the settings of each scheme's
+        custom handler; so restoring one skips INI parsing, option validation,
+        and the ``handler.using()`` calls that were done when this context was first loaded.
+        Snapshots are tied to the version of Passlib which created them.
+
+        :type source: str, bytes, or None
+        :param source:
+            optional INI-formatted config that this context was loaded from.
+            If provided, a digest of it is stored in the snapshot,
+            so :meth:`from_snapshot` can reject the snapshot once the config changes.
+
+        :returns:
+            snapshot as :class:`!bytes`.
+
+        :raises RuntimeError:
+            if the context uses handlers which aren't registered with Passlib.
+
+        .. versionadded:: 1.8
+        """
+        unregistered = self._get_unregistered_handlers()
+        if unregistered:
+            raise RuntimeError("can't create snapshot of context using unregistered handlers: %s" %
+                               ", ".join(repr(handler.name) for handler in unregistered))
+        info = dict(
+            format=_SNAPSHOT_FORMAT,
+            passlib=__version__,
+            source=None if source is None else _snapshot_digest(source, section),
+            state=self._config._get_state(),
+        )
+        return json.dumps(info, sort_keys=True).encode("utf-8")
+
+    def _write_snapshot(self, path, source, section):
+        """helper for from_path() -- atomically write snapshot to specified path"""
+        data = self.to_snapshot(source, section)
+        tmp = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    #===================================================================
+    # cost tuning
+    #===================================================================
+    def autotune(self, target_ms=350, concurrency=1, category=None, schemes=None):
+        """Measure the context's hashes on the current host, and return a copy
+        with their cost settings adjusted to reach the target time.
+
+        For each scheme, the tunable cost setting (``default_rounds`` for most hashes,
+        ``memory_cost`` for :class:`~passlib.hash.argon2`, and ``default_rounds`` plus
+        ``block_size`` for :class:`~passlib.hash.scrypt`) is adjusted until the median
+        :meth:`verify` time is as close to *target_ms* as possible.
+        Any ``min_rounds`` / ``max_rounds`` limits in the current configuration are honored.
+        The result can be saved via :meth:`to_string`, or from the command line
+        using ``python -m passlib.tune``.
+
+        :param target_ms:
+            target time per hash, in milliseconds. defaults to 350.
+
+        :param concurrency:
+            number of hashes to run in parallel while measuring, to approximate
+            the load the application will be running under. defaults to 1.
+
+        :param category:
+            optional :ref:`user category <user-categories>` to tune.
+            if specified, the new settings will only apply to that category.
+
+        :param schemes:
+            optional list of schemes to tune.
+            defaults to all the schemes which aren't deprecated.
+
+        :returns:
+            new :class:`!CryptContext` instance, as if created via :meth:`copy`.
+
+        .. note::
+
+            This will take a few seconds per scheme, since it has to
+            run the hashes repeatedly at around the target cost.
+
+        .. versionadded:: 1.8
+        """
+        from passlib.tune import tune_handler
+        if not isinstance(target_ms, num_types):
+            raise ExpectedTypeError(target_ms, "int or float", "target_ms")
+        if not isinstance(concurrency, int):
+            raise ExpectedTypeError(concurrency, "int", "concurrency")
+        settings = {}
+        render_key = self._render_config_key
+        for scheme in (schemes or self.schemes()):
+            record = self._get_record(scheme, category)
+            if schemes is None and record.deprecated:
+                continue
+            if hasattr(record, "has_backend") and not record.has_backend():
+                warn("autotune(): skipping %r, since it has no backends available" % (scheme,),
+                     exc.PasslibRuntimeWarning)
+                continue
+            result = tune_handler(record, target_ms / 1000, concurrency)
+            for key, value in result.items():
+                settings[render_key((category, scheme, key))] = value
+        return self.copy(**settings)
+
+    #===================================================================
+    # hash inventory
+    #===================================================================
+    def analyze(self, hashes, category=None, workers=None, chunk_size=10000,
+                estimate_cost=True):
+        """Survey a collection of existing hashes, reporting how many of them
+        :meth:`needs_update` would flag under the current configuration.
+
+        Each hash is identified & parsed (no secrets are needed), and counted
+        by scheme, ident, and rounds. This is useful for previewing the effect
+        of a policy change against a database dump before deploying it.
+        The same is available from the command line via ``python -m passlib.analyze``.
+
+        :arg hashes:
+            iterable of hash strings. This is consumed lazily,
+            so it may be a generator reading from a file, database cursor, etc.
+
+        :param category:
+            optional :ref:`user category <user-categories>` to check the hashes against.
+
+        :type workers: int or None
+        :param workers:
+            If set, the hashes will be split into chunks of *chunk_size*
+            and classified using a pool of this many worker processes
+            (this requires all the context's handlers to be registered).
+            No more than ``2 * workers`` chunks will be in flight at any one time,
+            so memory use stays bounded no matter how many hashes there are.
+
+        :param chunk_size:
+            number of hashes sent to a worker at a time. defaults to 10000.
+
+        :param estimate_cost:
+            if ``True`` (the default), the time it takes to generate a hash
+            with the category's default scheme is measured, and used to
+            estimate the cost of rehashing all the flagged hashes.
+
+        :returns:
+            a :class:`~passlib.analyze.HashInventory` instance.
+            Hashes which don't belong to any of the context's schemes,
+            or which are malformed, are counted rather than raising an error.
+
+        .. versionadded:: 1.8
+        """
+        from passlib.analyze import analyze_hashes
+        if workers is not None:
+            if not isinstance(workers, int):
+                raise ExpectedTypeError(workers, "int or None", "workers")
+            if workers < 1:
+                raise ValueError("workers must be >= 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        return analyze_hashes(self, hashes, category, workers, chunk_size, estimate_cost)
+
     # XXX: is this useful enough to enable?
     ##def write_to_path(self, path, section="passlib", update=False):
     ##    "write to INI file"
@@ -1399,35 +3269,24 @@ class CryptContext(object):
     #       instance stored in self._config, and are retrieved
     #       via get_record() and identify_record().
     #
-    #       _get_record() and _identify_record() are references
-    #       to _config methods of the same name,
-    #       stored in CryptContext for speed.
+    #       references to those methods are stored in the _ContextState
+    #       for speed; and each call reads self._state only once, so
+    #       it's unaffected by the config being replaced part way through.
 
     def _get_or_identify_record(self, hash, scheme=None, category=None):
         """return record based on scheme, or failing that, by identifying hash"""
-        if scheme:
-            if not isinstance(hash, unicode_or_bytes):
-                raise ExpectedStringError(hash, "hash")
-            return self._get_record(scheme, category)
-        else:
-            # hash typecheck handled by identify_record()
-            return self._identify_record(hash, category)
+        return self._state.get_or_identify_record(hash, scheme, category)
 
-    def _strip_unused_context_kwds(self, kwds, record):
+    def _get_verify_cache(self, scheme, kwds):
         """
-        helper which removes any context keywords from **kwds**
-        that are known to be used by another scheme in this context,
-        but are NOT supported by handler specified by **record**.
-
-        .. note::
-            as optimization, load() will set this method to None on a per-instance basis
-            if there are no context kwds.
+        return verify cache that should be used for a verify() call,
+        or ``None`` if it's disabled, or shouldn't be used for this call.
         """
-        if not kwds:
-            return
-        unused_kwds = self._config.context_kwds.difference(record.context_kwds)
-        for key in unused_kwds:
-            kwds.pop(key, None)
+        cache = self._verify_cache
+        if cache is not None and (scheme is not None or kwds):
+            # NOTE: only caching the common case, where result depends on secret & hash alone
+            return None
+        return cache
 
     def needs_update(self, hash, scheme=None, category=None, secret=None):
         """Check if hash needs to be replaced for some reason,
@@ -1495,8 +3354,10 @@ class CryptContext(object):
             warn("CryptContext.needs_update(): 'scheme' keyword is deprecated as of "
                  "Passlib 1.7, and will be removed in Passlib 2.0",
                  DeprecationWarning)
-        record = self._get_or_identify_record(hash, scheme, category)
-        return record.deprecated or record.needs_update(hash, secret=secret)
+        state = self._state
+        record = state.get_or_identify_record(hash, scheme, category)
+        return self._call_handler("needs_update", state, record, category,
+                                  _record_needs_update, record, hash, secret=secret)
 
     @deprecated_method(deprecated="1.6", removed="2.0", replacement="CryptContext.needs_update()")
     def hash_needs_update(self, hash, scheme=None, category=None):
@@ -1518,8 +3379,9 @@ class CryptContext(object):
             This method will be removed in version 2.0, and should only
             be used for compatibility with Passlib 1.3 - 1.6.
         """
-        record = self._get_record(scheme, category)
-        strip_unused = self._strip_unused_context_kwds
+        state = self._state
+        record = state.get_record(scheme, category)
+        strip_unused = state.strip_unused
         if strip_unused:
             strip_unused(settings, record)
         return record.genconfig(**settings)
@@ -1533,8 +3395,9 @@ class CryptContext(object):
             This method will be removed in version 2.0, and should only
             be used for compatibility with Passlib 1.3 - 1.6.
         """
-        record = self._get_or_identify_record(config, scheme, category)
-        strip_unused = self._strip_unused_context_kwds
+        state = self._state
+        record = state.get_or_identify_record(config, scheme, category)
+        strip_unused = state.strip_unused
         if strip_unused:
             strip_unused(kwds, record)
         return record.genhash(secret, config, **kwds)
@@ -1634,11 +3497,20 @@ class CryptContext(object):
             warn("CryptContext.hash(): 'scheme' keyword is deprecated as of "
                  "Passlib 1.7, and will be removed in Passlib 2.0",
                  DeprecationWarning)
-        record = self._get_record(scheme, category)
-        strip_unused = self._strip_unused_context_kwds
+        return self._hash(secret, scheme, category, kwds)
+
+    def _hash(self, secret, scheme, category, kwds, offload=False):
+        """
+        implementation of :meth:`hash`.
+        if *offload* is set, the hash is run in the process pool (if executor="process").
+        """
+        state = self._state
+        record = state.get_record(scheme, category)
+        strip_unused = state.strip_unused
         if strip_unused:
             strip_unused(kwds, record)
-        return record.hash(secret, **kwds)
+        func = self._get_handler_func("hash", record, category, offload)
+        return self._call_handler("hash", state, record, category, func, secret, **kwds)
 
     @deprecated_method(deprecated="1.7", removed="2.0", replacement="CryptContext.hash()")
     def encrypt(self, *args, **kwds):
@@ -1721,13 +3593,34 @@ class CryptContext(object):
         if hash is None:
             # convenience feature -- let apps pass in hash=None when user
             # isn't found / has no hash; useful because it invokes dummy_verify()
-            self.dummy_verify()
+            self.dummy_verify(category)
             return False
-        record = self._get_or_identify_record(hash, scheme, category)
-        strip_unused = self._strip_unused_context_kwds
+        return self._verify(secret, hash, scheme, category, kwds)
+
+    def _verify(self, secret, hash, scheme, category, kwds, state=None, record=None, func=None):
+        """
+        implementation of :meth:`verify` (after hash=None has been handled).
+        *state* & *record* may be passed in if the caller has already identified the hash;
+        and *func* may be passed in to use in place of ``record.verify()``
+        (e.g. as returned by :meth:`_get_handler_func`).
+        """
+        if state is None:
+            state = self._state
+        cache = self._get_verify_cache(scheme, kwds)
+        if cache is not None and cache.lookup(secret, hash, state.cache_scope):
+            return True
+        if record is None:
+            record = state.get_or_identify_record(hash, scheme, category)
+        strip_unused = state.strip_unused
         if strip_unused:
             strip_unused(kwds, record)
-        return record.verify(secret, hash, **kwds)
+        verified = self._call_handler("verify", state, record, category, func or record.verify,
+                                      secret, hash, **kwds)
+        if not verified:
+            return False
+        if cache is not None:
+            cache.add(secret, hash, state.cache_scope)
+        return True
 
     def verify_and_update(self, secret, hash, scheme=None, category=None, **kwds):
         """verify password and re-hash the password if needed, all in a single call.
@@ -1800,27 +3693,397 @@ class CryptContext(object):
         if hash is None:
             # convenience feature -- let apps pass in hash=None when user
             # isn't found / has no hash; useful because it invokes dummy_verify()
-            self.dummy_verify()
+            self.dummy_verify(category)
             return False, None
-        record = self._get_or_identify_record(hash, scheme, category)
-        strip_unused = self._strip_unused_context_kwds
+        return self._verify_and_update(secret, hash, scheme, category, kwds)
+
+    def _verify_and_update(self, secret, hash, scheme, category, kwds, state=None, record=None,
+                           offload=False):
+        """
+        implementation of :meth:`verify_and_update` (after hash=None has been handled).
+        *state* & *record* may be passed in if the caller has already identified the hash.
+        if *offload* is set, the hashes are run in the process pool (if executor="process").
+        """
+        if state is None:
+            state = self._state
+        if record is None:
+            record = state.get_or_identify_record(hash, scheme, category)
+        strip_unused = state.strip_unused
         if strip_unused and kwds:
             clean_kwds = kwds.copy()
             strip_unused(clean_kwds, record)
         else:
             clean_kwds = kwds
-        # XXX: if record is default scheme, could extend PasswordHash
-        #      api to combine verify & needs_update to single call,
-        #      potentially saving some round-trip parsing.
-        #      but might make these codepaths more complex...
-        if not record.verify(secret, hash, **clean_kwds):
-            return False, None
-        elif record.deprecated or record.needs_update(hash, secret=secret):
+        cache = self._get_verify_cache(scheme, kwds)
+        if cache is not None and cache.lookup(secret, hash, state.cache_scope):
+            needs_update = record.needs_update(hash, secret=secret)
+        else:
+            # NOTE: handlers derived from GenericHandler offer a combined
+            #       verify_and_needs_update() call, which only parses the hash once.
+            func = self._get_handler_func("verify_and_needs_update", record, category, offload)
+            verified, needs_update = self._call_handler("verify_and_update", state, record, category,
+                                                        func, secret, hash, **clean_kwds)
+            if not verified:
+                return False, None
+            if cache is not None:
+                cache.add(secret, hash, state.cache_scope)
+        if record.deprecated or needs_update:
             # NOTE: we re-hash with default scheme, not current one.
-            return True, self.hash(secret, category=category, **kwds)
+            if cache is not None:
+                cache.invalidate(hash)
+            return True, self._hash(secret, None, category, kwds.copy(), offload)
         else:
             return True, None
 
+    #===================================================================
+    # bulk verification
+    #===================================================================
+
+    def verify_many(self, pairs, category=None, workers=None, **kwds):
+        """verify a sequence of ``(secret, hash)`` pairs.
+
+        This is a helper for bulk jobs (e.g. re-checking a large set of
+        credentials after a policy audit), which would otherwise have to
+        call :meth:`verify` in a loop. Each hash is identified just as
+        :meth:`verify` would, the per-scheme keyword handling is resolved
+        once per scheme rather than once per pair, and the actual
+        verification work can be spread across a thread pool.
+        Each pair still goes through the context's verify cache,
+        admission control, and metrics (if configured), just like :meth:`verify`.
+
+        :type pairs: iterable
+        :arg pairs:
+            iterable of ``(secret, hash)`` tuples. This is consumed lazily,
+            so it may be a generator of arbitrary length.
+
+            if a hash is ``None``, it will be treated as "never verifying";
+            though unlike :meth:`verify`, :meth:`dummy_verify` will *not* be invoked.
+
+        :type category: str or None
+        :param category:
+            Optional :ref:`user category <user-categories>` string,
+            used for all the pairs (see :meth:`verify`).
+
+        :type workers: int or None
+        :param workers:
+            If set to an integer greater than 1, pairs will be verified
+            using a pool of this many threads. No more than ``2 * workers``
+            pairs will be in flight at any one time, so memory use stays bounded
+            no matter how long *pairs* is.
+
+            .. note::
+
+                This only provides a speedup for backends which release
+                the GIL while hashing, such as :mod:`hashlib`'s pbkdf2,
+                the `bcrypt <https://pypi.python.org/pypi/bcrypt>`_ library,
+                and `argon2_cffi <https://pypi.python.org/pypi/argon2_cffi>`_.
+                Pure-python backends will run no faster than the default,
+                unless the context was created with ``executor="process"``,
+                in which case the context's process pool is used instead
+                (and *workers* is ignored).
+
+        :param \\*\\*kwds:
+            All additional keywords are passed to the appropriate handler,
+            and should match its :attr:`~passlib.ifc.PasswordHash.context_kwds`.
+
+        :returns:
+            iterator which yields ``True`` or ``False`` for each pair,
+            in the same order as *pairs*.
+
+        :raises TypeError, ValueError:
+            For the same reasons as :meth:`verify`; raised when the result
+            for the offending pair is reached.
+
+        .. versionadded:: 1.8
+        """
+        if workers is not None:
+            if isinstance(workers, bool) or not isinstance(workers, int):
+                raise ExpectedTypeError(workers, "int or None", "workers")
+            if workers < 1:
+                raise ValueError("workers must be >= 1")
+        jobs = self._iter_verify_jobs(pairs, category, kwds)
+        return self._run_verify_jobs(jobs, category, workers or 1)
+
+    def _iter_verify_jobs(self, pairs, category, kwds):
+        """
+        helper for :meth:`verify_many` --
+        identifies each hash, and yields a job for each pair: a callable which runs
+        it through :meth:`_verify` (so the verify cache, admission control, and metrics
+        all apply, as with :meth:`verify`). yields ``None`` for pairs that should never verify,
+        and the exception instead for hashes which can't be identified (so it can be raised once reached).
+        """
+        state = self._state
+        identify_record = state.identify_record
+        strip_unused = state.strip_unused
+        offload = self._executor == "process"
+        record_state = {}
+        for secret, hash in pairs:
+            if hash is None:
+                yield None
+                continue
+            try:
+                # hash typecheck handled by identify_record()
+                record = identify_record(hash, category)
+            except (TypeError, ValueError) as err:
+                yield err
+                continue
+            try:
+                verify, clean_kwds = record_state[record]
+            except KeyError:
+                clean_kwds = kwds.copy()
+                if strip_unused:
+                    strip_unused(clean_kwds, record)
+                if offload:
+                    verify = self._get_handler_func("verify", record, category, True)
+                else:
+                    verify = _get_bulk_verify(record, clean_kwds)
+                record_state[record] = verify, clean_kwds
+            yield partial(self._verify, secret, hash, None, category, clean_kwds,
+                          state, record, verify)
+
+    def _run_verify_jobs(self, jobs, category, workers):
+        """
+        helper for :meth:`verify_many` --
+        runs verify jobs (using thread pool if requested), yielding results in order.
+        """
+        if self._executor == "process":
+            # NOTE: jobs will hand off the actual hashing to the process pool,
+            #       so just need enough threads to keep all of its workers busy.
+            self._get_executor()
+            workers = self._process_pool_size
+        if workers == 1:
+            for job in jobs:
+                if job is None:
+                    yield False
+                elif isinstance(job, Exception):
+                    raise job
+                else:
+                    yield job()
+            return
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(workers)
+        pending = deque()
+        limit = 2 * workers
+        try:
+            for job in jobs:
+                if job is None or isinstance(job, Exception):
+                    # NOTE: errors are queued along w/ the results, so that results
+                    #       for any earlier pairs are still yielded before it's raised.
+                    pending.append(job)
+                else:
+                    pending.append(pool.submit(job))
+                if len(pending) >= limit:
+                    yield _get_pending_result(pending.popleft())
+            while pending:
+                yield _get_pending_result(pending.popleft())
+        finally:
+            pool.shutdown()
+
+    #===================================================================
+    # handler calls
+    #===================================================================
+    def _call_handler(self, method, state, record, category, func, *args, **kwds):
+        """
+        invoke ``func(*args, **kwds)`` -- the call to *record* which does the actual
+        hashing for *method* (one of the public method names).
+
+        all the hashing done by the public methods (including the asyncio versions,
+        and :meth:`verify_many`) goes through here, so this is the one place
+        where admission control, metrics, and dummy_verify() calibration are applied.
+        """
+        if state.verify_latency is not None and method in _calibrated_methods:
+            func = partial(self._call_timed, state, category, func)
+        metrics = self._metrics
+        if metrics is not None:
+            # NOTE: wrapped inside admission control, so time spent queued isn't counted.
+            func = partial(metrics._call, method, record, category, func)
+        admission = self._admission
+        if admission is not None and method in _admitted_methods:
+            with admission.admit():
+                return func(*args, **kwds)
+        return func(*args, **kwds)
+
+    def _get_handler_func(self, name, record, category, offload=False):
+        """
+        return ``record.<name>`` (see :func:`_get_record_method`), for passing to :meth:`_call_handler`.
+        if *offload* is set and executor="process", this instead returns a function
+        which runs the call in the process pool, and waits for the result.
+        """
+        if offload and self._executor == "process":
+            return partial(_process_pool_call, self._get_executor(), name, record.name, category)
+        return _get_record_method(record, name)
+
+    #===================================================================
+    # executor support
+    #===================================================================
+
+    # NOTE: the async methods & verify_many() hand off the expensive calls
+    #       to an executor. if executor="process" was requested,
+    #       a process pool is created on demand, whose workers each load
+    #       their own copy of this context's configuration (via an initializer);
+    #       so only the scheme name, secret, hash, etc need to be sent to them.
+    #       the rest of the call (including _call_handler()) still runs in a thread
+    #       of this process, which waits for the worker's result.
+
+    #: process pool created by _get_executor() when executor="process"
+    _process_pool = None
+
+    #: number of workers in _process_pool
+    _process_pool_size = None
+
+    def _get_executor(self):
+        """
+        return executor which offloaded calls should be run in
+        (``None`` means use the event loop's default executor).
+        """
+        executor = self._executor
+        if executor == "process":
+            executor = self._process_pool
+            if executor is None:
+                executor = self._create_process_pool()
+        return executor
+
+    def _create_process_pool(self):
+        """create process pool, and start spinning up its workers"""
+        unregistered = self._get_unregistered_handlers()
+        if unregistered:
+            raise RuntimeError("executor='process' requires all handlers to be "
+                               "registered with passlib.registry: %s" %
+                               ", ".join(repr(handler.name) for handler in unregistered))
+        from concurrent.futures import ProcessPoolExecutor
+        with _process_pool_lock:
+            pool = self._process_pool
+            if pool is not None:
+                return pool
+            size = self._max_concurrency or os.cpu_count() or 1
+            pool = ProcessPoolExecutor(size, initializer=_process_worker_init,
+                                       initargs=(self.to_dict(),))
+            self._process_pool_size = size
+            self._process_pool = pool
+        # go ahead and start the workers, so they're warm before the first real request.
+        # NOTE: doing this outside of lock, since workers may be forked from this thread.
+        for _ in range(size):
+            pool.submit(_process_worker_ping)
+        return pool
+
+    def _reset_process_pool(self):
+        """shut down process pool (if any), e.g. since configuration has changed"""
+        if self._process_pool is None:
+            return
+        with _process_pool_lock:
+            pool = self._process_pool
+            self._process_pool = self._process_pool_size = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    #===================================================================
+    # asyncio interface
+    #===================================================================
+
+    # NOTE: the following methods mirror hash() / verify() / etc,
+    #       running the same implementation in a thread from the configured executor
+    #       (or the event loop's default one), so the event loop isn't blocked while hashing.
+    #       if executor="process", that thread hands off the hashing itself to the process pool.
+
+    def _get_async_semaphore(self, loop):
+        """
+        return semaphore used to enforce max_concurrency for specified loop
+        (or ``None`` if there's no limit).
+        """
+        if self._max_concurrency is None:
+            return None
+        value = self._async_semaphore
+        if value is None or value[0] is not loop:
+            import asyncio
+            value = self._async_semaphore = (loop, asyncio.Semaphore(self._max_concurrency))
+        return value[1]
+
+    async def _run_async(self, func, *args):
+        """
+        helper for the async methods --
+        runs ``func(*args)`` in a thread, subject to the max_concurrency limit.
+        """
+        loop = _get_running_loop()
+        executor = self._executor
+        if executor == "process":
+            # NOTE: func will offload to process pool itself (see _get_handler_func)
+            executor = None
+        call = partial(func, *args)
+        semaphore = self._get_async_semaphore(loop)
+        if semaphore is None:
+            return await loop.run_in_executor(executor, call)
+        async with semaphore:
+            return await loop.run_in_executor(executor, call)
+
+    async def ahash(self, secret, scheme=None, category=None, **kwds):
+        """asyncio version of :meth:`hash`.
+
+        This takes the same arguments and returns the same result as :meth:`!hash`,
+        but runs the actual hashing in the context's *executor*,
+        so that the event loop isn't blocked.
+
+        .. versionadded:: 1.8
+        """
+        if scheme is not None:
+            warn("CryptContext.ahash(): 'scheme' keyword is deprecated as of "
+                 "Passlib 1.7, and will be removed in Passlib 2.0",
+                 DeprecationWarning)
+        return await self._run_async(self._hash, secret, scheme, category, kwds, True)
+
+    async def averify(self, secret, hash, scheme=None, category=None, **kwds):
+        """asyncio version of :meth:`verify`.
+
+        This takes the same arguments and returns the same result as :meth:`!verify`,
+        but runs the actual verification in the context's *executor*,
+        so that the event loop isn't blocked.
+
+        .. versionadded:: 1.8
+        """
+        if scheme is not None:
+            warn("CryptContext.averify(): 'scheme' keyword is deprecated as of "
+                 "Passlib 1.7, and will be removed in Passlib 2.0",
+                 DeprecationWarning)
+        if hash is None:
+            # convenience feature -- see verify()
+            await self.adummy_verify(category)
+            return False
+        state = self._state
+        record = state.get_or_identify_record(hash, scheme, category)
+        func = self._get_handler_func("verify", record, category, True)
+        return await self._run_async(self._verify, secret, hash, scheme, category, kwds,
+                                     state, record, func)
+
+    async def averify_and_update(self, secret, hash, scheme=None, category=None, **kwds):
+        """asyncio version of :meth:`verify_and_update`.
+
+        This takes the same arguments and returns the same result as :meth:`!verify_and_update`,
+        but runs the verification (and any re-hashing) in the context's *executor*,
+        so that the event loop isn't blocked.
+
+        .. versionadded:: 1.8
+        """
+        if scheme is not None:
+            warn("CryptContext.averify_and_update(): 'scheme' keyword is deprecated as of "
+                 "Passlib 1.7, and will be removed in Passlib 2.0",
+                 DeprecationWarning)
+        if hash is None:
+            # convenience feature -- see verify()
+            await self.adummy_verify(category)
+            return False, None
+        state = self._state
+        record = state.get_or_identify_record(hash, scheme, category)
+        return await self._run_async(self._verify_and_update, secret, hash, scheme, category, kwds,
+                                     state, record, True)
+
+    async def adummy_verify(self, category=None):
+        """asyncio version of :meth:`dummy_verify`.
+
+        .. versionadded:: 1.8
+        """
+        # NOTE: running all of dummy_verify() in executor, so that the one-time
+        #       cost of generating the dummy hash doesn't block the event loop either.
+        return await self._run_async(self._dummy_verify, category, True)
+
     #===================================================================
     # missing-user helper
     #===================================================================
@@ -1828,20 +4091,56 @@ class CryptContext(object):
     #: secret used for dummy_verify()
     _dummy_secret = "too many secrets"
 
-    @memoized_property
-    def _dummy_hash(self):
+    #: weight given to each new sample when updating _verify_latency
+    _latency_weight = 0.1
+
+    def _call_timed(self, state, category, func, *args, **kwds):
         """
-        precalculated hash for dummy_verify() to use
+        call ``func(*args, **kwds)``, and fold time it took into
+        the verify latency estimate for category (used by dummy_verify)
         """
-        return self.hash(self._dummy_secret)
-
-    def _reset_dummy_verify(self):
+        start = timer()
+        result = func(*args, **kwds)
+        elapsed = timer() - start
+        latency = state.verify_latency
+        # NOTE: unconfigured categories share estimate for None, same as _DummyHashes
+        category = state.dummy_hashes.norm_category(category)
+        prev = latency.get(category)
+        latency[category] = elapsed if prev is None else (prev + self._latency_weight * (elapsed - prev))
+        return result
+
+    def prepare_dummy_verify(self, categories=None, background=True):
         """
-        flush memoized values used by dummy_verify()
+        Precalculate the hashes used by :meth:`dummy_verify`,
+        so the first call for each category doesn't pay that cost on a live request.
+
+        :param categories:
+            list of categories to prepare.
+            Defaults to ``None`` (the default category) plus all categories in the configuration.
+
+        :param background:
+            if ``True`` (the default), the hashes are calculated in a background (daemon) thread,
+            which is returned. Otherwise they're calculated before returning ``None``.
+
+        Otherwise each hash is calculated by the first :meth:`!dummy_verify` call which needs it.
+        The hashes are discarded when the configuration changes, so this should be called
+        again after :meth:`load` or :meth:`update` (:class:`ConfigWatcher` does this itself
+        after a reload, if the hashes had been prepared beforehand).
+        :meth:`warmup` also calls this.
+
+        .. versionadded:: 1.8
         """
-        type(self)._dummy_hash.clear_cache(self)
+        hashes = self._dummy_hashes
+        if not background:
+            hashes.build(categories)
+            return None
+        thread = threading.Thread(target=hashes.build, args=(categories,),
+                                  name="passlib-dummy-verify")
+        thread.daemon = True
+        thread.start()
+        return thread
 
-    def dummy_verify(self):
+    def dummy_verify(self, category=None):
         """
         Helper that applications can call when user wasn't found,
         in order to simulate time it would take to hash a password.
@@ -1849,11 +4148,148 @@ class CryptContext(object):
         Runs verify() against a dummy hash, to simulate verification
         of a real account password.
 
+        :type category: str or None
+        :param category:
+            Optional :ref:`user category <user-categories>`.
+            The dummy hash will be generated using the default scheme &
+            settings for this category, so it takes as long as
+            verifying a real account in that category would.
+            (Categories which aren't configured share the hash for the default category).
+
+        Each dummy hash is calculated the first time it's needed;
+        :meth:`prepare_dummy_verify` (or :meth:`warmup`) can be used to do this up front,
+        so a live request doesn't have to pay that cost.
+
+        If the context was created with ``calibrate_dummy_verify=True``,
+        this will additionally pad out the call to match the average time
+        that :meth:`verify` & :meth:`verify_and_update` have been taking for the category.
+        This accounts for older hashes which were created with different costs.
+
         .. versionadded:: 1.7
+
+        .. versionchanged:: 1.8
+            Added the *category* keyword, and support for calibration.
+        """
+        return self._dummy_verify(category)
+
+    def _dummy_verify(self, category, offload=False):
+        """
+        implementation of :meth:`dummy_verify`.
+        if *offload* is set, the hash is run in the process pool (if executor="process").
         """
-        self.verify(self._dummy_secret, self._dummy_hash)
+        start = timer()
+        state = self._state
+        hashes = state.dummy_hashes
+        hash = hashes.get_hash(category)
+        # NOTE: calling record directly, so this bypasses the verify cache
+        record = state.identify_record(hash, category)
+        func = self._get_handler_func("verify", record, category, offload)
+        self._call_handler("dummy_verify", state, record, category, func, self._dummy_secret, hash)
+        latency = state.verify_latency
+        if latency:
+            remaining = latency.get(hashes.norm_category(category), 0) - (timer() - start)
+            if remaining > 0:
+                time.sleep(remaining)
         return False
 
+    #===================================================================
+    # warmup
+    #===================================================================
+    def warmup(self, categories=None, background=True):
+        """Do all the one-time setup which would otherwise happen on the first few requests.
+
+        This builds the records & hash identification tables for each category,
+        loads the backend for each scheme (which may involve importing
+        external libraries, and running test hashes), precalculates the hashes
+        used by :meth:`dummy_verify`, and (if ``executor="process"``) starts the process pool.
+        It's intended to be called from e.g. a pre-fork hook, or before reporting
+        a worker as ready.
+
+        :param categories:
+            list of categories to prepare.
+            Defaults to ``None`` (the default category) plus all categories in the configuration.
+
+        :param background:
+            if ``True`` (the default), the work is done in a background (daemon) thread,
+            and a :class:`concurrent.futures.Future` is returned which will resolve to the report.
+            Otherwise the work is done before returning the report.
+
+        :returns:
+            dict reporting how long each step took (in seconds)::
+
+                {
+                    "records": 0.001,  # building records & identify tables
+                    "backends": {"bcrypt": 0.05, "sha256_crypt": 0.0},  # loading each scheme's backend
+                    "dummy_verify": 0.3,  # precalculating dummy_verify() hashes
+                    "process_pool": 0.0,  # starting process pool
+                    "errors": {},  # maps scheme -> message, for backends which failed to load
+                    "elapsed": 0.351,  # total
+                }
+
+        .. versionadded:: 1.8
+        """
+        config = self._config
+        if categories is None:
+            categories = (None,) + config.categories
+        if not background:
+            return self._warmup(config, categories)
+        from concurrent.futures import Future
+        future = Future()
+        future.set_running_or_notify_cancel()
+        def run():
+            try:
+                future.set_result(self._warmup(config, categories))
+            except BaseException as err:
+                future.set_exception(err)
+        thread = threading.Thread(target=run, name="passlib-warmup")
+        thread.daemon = True
+        thread.start()
+        return future
+
+    def _warmup(self, config, categories):
+        """helper for warmup() -- does actual work, returns report"""
+        start = timer()
+        report = dict(backends={}, errors={})
+
+        # build records, record lists & identify tables
+        for category in categories:
+            config._get_identify_index(category)
+            for scheme in config.schemes:
+                config.get_record(scheme, category)
+            config.get_record(None, category)
+        report["records"] = timer() - start
+
+        # load backends
+        for handler in config.handlers:
+            if not hasattr(handler, "get_backend"):
+                continue
+            name = handler.name
+            begin = timer()
+            try:
+                handler.get_backend()
+            except exc.MissingBackendError as err:
+                report["errors"][name] = str(err)
+            report["backends"][name] = timer() - begin
+
+        # precalculate dummy hashes
+        begin = timer()
+        self.prepare_dummy_verify(categories, background=False)
+        report["dummy_verify"] = timer() - begin
+
+        # start process pool
+        report["process_pool"] = 0
+        if self._executor == "process":
+            begin = timer()
+            pool = self._get_executor()
+            # NOTE: waiting on one ping per worker, so they're all spun up.
+            pings = [pool.submit(_process_worker_ping) for _ in range(self._process_pool_size)]
+            for ping in pings:
+                ping.result()
+            report["process_pool"] = timer() - begin
+
+        report["elapsed"] = timer() - start
+        return report
+
     #===================================================================
     # disabled hash support
     #===================================================================
@@ -1920,6 +4356,50 @@ class CryptContext(object):
     # eoc
     #===================================================================
 
+#=============================================================================
+# asyncio support
+#=============================================================================
+def _get_running_loop():
+    """return event loop the calling coroutine is running in"""
+    import asyncio
+    try:
+        get_running_loop = asyncio.get_running_loop
+    except AttributeError:
+        # python < 3.7 -- get_event_loop() returns the running loop when called from a coroutine
+        return asyncio.get_event_loop()
+    return get_running_loop()
+
+#=============================================================================
+# process pool support
+#=============================================================================
+
+#: lock held while creating / destroying CryptContext process pools
+_process_pool_lock = threading.Lock()
+
+#: CryptContext instance used by process pool worker (see _process_worker_init)
+_worker_context = None
+
+def _process_worker_init(config):
+    """initializer for CryptContext's process pool -- loads worker's copy of context"""
+    global _worker_context
+    _worker_context = CryptContext(**config)
+
+def _process_worker_ping():
+    """no-op job used to spin up process pool workers ahead of time"""
+    return _worker_context is not None
+
+def _process_worker_call(method, scheme, category, args, kwds):
+    """run ``record.<method>(*args, **kwds)`` within process pool worker"""
+    record = _worker_context._get_record(scheme, category)
+    return _get_record_method(record, method)(*args, **kwds)
+
+def _process_pool_call(pool, method, scheme, category, *args, **kwds):
+    """
+    run ``record.<method>(*args, **kwds)`` in process pool, and wait for result
+    (see :meth:`CryptContext._get_handler_func`)
+    """
+    return pool.submit(_process_worker_call, method, scheme, category, args, kwds).result()
+
 class LazyCryptContext(CryptContext):
     """CryptContext subclass which doesn't load handlers until needed.
 
@@ -41,6 +41,31 @@ class InternalBackendError(RuntimeError):
     """
 
 
+class OverloadError(RuntimeError):
+    """
+    Error raised by :class:`~passlib.context.AdmissionControl` when a hash
+    can't be started because too many are already running or waiting.
+
+    .. attribute:: reason
+
+        ``"queue_full"`` if the call was rejected immediately because the wait queue was full,
+        or ``"timeout"`` if it waited in the queue past its deadline.
+
+    .. versionadded:: 1.8
+    """
+
+    reason = None
+
+    def __init__(self, reason, msg=None):
+        self.reason = reason
+        if msg is None:
+            if reason == "timeout":
+                msg = "timed out waiting for hashing capacity"
+            else:
+                msg = "too many hashes already running or waiting"
+        RuntimeError.__init__(self, msg)
+
+
 class PasswordValueError(ValueError):
     """
     Error raised if a password can't be hashed / verified for various reasons.
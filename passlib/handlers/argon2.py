@@ -393,6 +393,14 @@ class _Argon2Common(uh.SubclassBackendMixin, uh.ParallelismMixin,
 
     @classmethod
     def from_string(cls, hash):
+        return cls(**cls._parse_settings(hash))
+
+    @classmethod
+    def _parse_settings(cls, hash):
+        """
+        helper for from_string() & _parse_many() --
+        parses hash into dict of constructor keywords.
+        """
         # NOTE: assuming hash will be str, or use ascii-compatible encoding.
         # TODO: switch to working w/ str
         if isinstance(hash, str):
@@ -407,7 +415,7 @@ class _Argon2Common(uh.SubclassBackendMixin, uh.ParallelismMixin,
                     "keyid", "data", "salt", "digest")
         if keyid:
             raise NotImplementedError("argon2 'keyid' parameter not supported")
-        return cls(
+        return dict(
             type=type.decode("ascii"),
             version=int(version) if version else 0x10,
             memory_cost=int(memory_cost),
@@ -443,6 +451,16 @@ class _Argon2Common(uh.SubclassBackendMixin, uh.ParallelismMixin,
             bascii_to_str(b64s_encode(self.checksum)),
         )
 
+    #: columns returned by parse_many()
+    _column_names = ("type", "version", "memory_cost", "rounds", "parallelism",
+                     "salt", "data", "checksum")
+
+    @classmethod
+    def _parse_many(cls, hashes):
+        parse = cls._parse_settings
+        columns = uh.collect_columns(cls._column_names, (parse(hash) for hash in hashes))
+        return cls._norm_many(columns)
+
     #===================================================================
     # init
     #===================================================================
@@ -496,6 +514,30 @@ class _Argon2Common(uh.SubclassBackendMixin, uh.ParallelismMixin,
     # parameter guards
     #-------------------------------------------------------------------
 
+    @classmethod
+    def _norm_many(cls, columns):
+        # validate argon2-specific columns, for GenericHandler._norm_many()
+        for name, norm in [("type", cls._norm_type),
+                           ("version", cls._norm_version),
+                           ("memory_cost", cls._norm_memory_cost)]:
+            values = columns.get(name)
+            if values is not None:
+                columns[name] = [norm(value) for value in values]
+        for value in columns.get("data") or ():
+            if value is not None and not isinstance(value, bytes):
+                raise uh.exc.ExpectedTypeError(value, "bytes", "data")
+
+        # NOTE: checksum size varies per hash (see __init__), so just checking type,
+        #       rather than having GenericHandler check it against .checksum_size
+        checksums = columns.pop("checksum", None)
+        columns = super()._norm_many(columns)
+        if checksums is not None:
+            for value in checksums:
+                if value is not None and not isinstance(value, bytes):
+                    raise uh.exc.ExpectedTypeError(value, "bytes", "checksum")
+            columns["checksum"] = checksums
+        return columns
+
     @classmethod
     def _norm_type(cls, value):
         # type check
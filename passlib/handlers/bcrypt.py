@@ -23,10 +23,10 @@ _bcrypt = None # dynamically imported by _load_backend_bcrypt()
 _builtin_bcrypt = None  # dynamically imported by _load_backend_builtin()
 from passlib.crypto.digest import compile_hmac
 from passlib.exc import PasslibHashWarning, PasslibSecurityWarning, PasslibSecurityError
-from passlib.utils import safe_crypt, repeat_string, to_bytes, parse_version, \
-                          rng, getrandstr, test_crypt, to_unicode, \
+from passlib.utils import consteq, safe_crypt, repeat_string, to_bytes, parse_version, \
+                          rng, getrandstr, test_crypt, to_unicode, probe_cache, \
                           utf8_truncate, utf8_repeat_string, crypt_accepts_bytes
-from passlib.utils.binary import bcrypt64
+from passlib.utils.binary import bcrypt64, BCRYPT_CHARS
 import passlib.utils.handlers as uh
 
 # local
@@ -270,22 +270,65 @@ class _BcryptCommon(uh.SubclassBackendMixin, uh.TruncateMixin, uh.HasManyIdents,
     # appended to HasManyBackends' "no backends available" error message
     _no_backend_suggestion = " -- recommend you install one (e.g. 'pip install bcrypt')"
 
+    #: attributes set by _detect_workarounds(), which are stored in the probe cache
+    _workaround_attrs = ("_lacks_20_support", "_has_2a_wraparound_bug",
+                         "_lacks_2y_support", "_lacks_2b_support", "_fallback_ident")
+
     @classmethod
-    def _finalize_backend_mixin(mixin_cls, backend, dryrun):
+    def _finalize_backend_mixin(mixin_cls, backend, dryrun, version=None):
         """
         helper called by from backend mixin classes' _load_backend_mixin() --
         invoked after backend imports have been loaded, and performs
         feature detection & testing common to all backends.
+
+        the results are stored in :data:`passlib.utils.probe_cache` (if enabled),
+        keyed by backend name & *version*.
         """
-        #----------------------------------------------------------------
-        # setup helpers
-        #----------------------------------------------------------------
         assert mixin_cls is bcrypt._backend_mixin_map[backend], \
             "_configure_workarounds() invoked from wrong class"
 
         if mixin_cls._workrounds_initialized:
             return True
 
+        attrs = mixin_cls._workaround_attrs
+
+        def detect():
+            mixin_cls._detect_workarounds(backend)
+            return dict((attr, getattr(mixin_cls, attr)) for attr in attrs)
+
+        name = "bcrypt:%s" % backend
+        if version:
+            name += ":%s" % version
+        flags = probe_cache.get(name, detect)
+        if not isinstance(flags, dict) or set(flags) != set(attrs):  # pragma: no cover -- sanity check
+            flags = detect()
+        for attr in attrs:
+            setattr(mixin_cls, attr, flags[attr])
+
+        if mixin_cls._has_2a_wraparound_bug and backend != "os_crypt":
+            # installed library has the bug -- want to let users know,
+            # so they can upgrade it to something better (e.g. bcrypt cffi library)
+            warn("passlib.hash.bcrypt: Your installation of the %r backend is vulnerable to "
+                 "the bsd wraparound bug, "
+                 "and should be upgraded or replaced with another backend "
+                 "(enabling workaround for now)." % backend,
+                 uh.exc.PasslibSecurityWarning)
+
+        # set flag so we don't have to run this again
+        mixin_cls._workrounds_initialized = True
+        return True
+
+    @classmethod
+    def _detect_workarounds(mixin_cls, backend):
+        """
+        helper for _finalize_backend_mixin() -- runs the test hashes
+        which detect which workarounds the backend needs (setting the
+        corresponding ``_workaround_attrs`` on the mixin class),
+        and raises an error if the backend is broken or insecure.
+        """
+        #----------------------------------------------------------------
+        # setup helpers
+        #----------------------------------------------------------------
         verify = mixin_cls.verify
 
         err_types = (ValueError, uh.exc.MissingBackendError)
@@ -411,19 +454,11 @@ class _BcryptCommon(uh.SubclassBackendMixin, uh.TruncateMixin, uh.HasManyIdents,
         else:
             assert_lacks_8bit_bug(IDENT_2A)
             if detect_wrap_bug(IDENT_2A):
-                if backend == "os_crypt":
-                    # don't make this a warning for os crypt (e.g. openbsd);
-                    # they'll have proper 2b implementation which will be used for new hashes.
-                    # so even if we didn't have a workaround, this bug wouldn't be a concern.
-                    log.debug("%r backend has $2a$ bsd wraparound bug, enabling workaround", backend)
-                else:
-                    # installed library has the bug -- want to let users know,
-                    # so they can upgrade it to something better (e.g. bcrypt cffi library)
-                    warn("passlib.hash.bcrypt: Your installation of the %r backend is vulnerable to "
-                         "the bsd wraparound bug, "
-                         "and should be upgraded or replaced with another backend "
-                         "(enabling workaround for now)." % backend,
-                         uh.exc.PasslibSecurityWarning)
+                # NOTE: _finalize_backend_mixin() issues a warning about this for all
+                #       backends except os crypt (e.g. openbsd); since they'll have proper
+                #       2b implementation which will be used for new hashes.
+                #       so even if we didn't have a workaround, this bug wouldn't be a concern.
+                log.debug("%r backend has $2a$ bsd wraparound bug, enabling workaround", backend)
                 mixin_cls._has_2a_wraparound_bug = True
 
         #----------------------------------------------------------------
@@ -461,10 +496,6 @@ class _BcryptCommon(uh.SubclassBackendMixin, uh.TruncateMixin, uh.HasManyIdents,
             assert_lacks_8bit_bug(IDENT_2B)
             assert_lacks_wrap_bug(IDENT_2B)
 
-        # set flag so we don't have to run this again
-        mixin_cls._workrounds_initialized = True
-        return True
-
     #===================================================================
     # digest calculation
     #===================================================================
@@ -615,7 +646,7 @@ class _BcryptBackend(_BcryptCommon):
             version = '<unknown>'
 
         log.debug("detected 'bcrypt' backend, version %r", version)
-        return mixin_cls._finalize_backend_mixin(name, dryrun)
+        return mixin_cls._finalize_backend_mixin(name, dryrun, version=version)
 
     # # TODO: would like to implementing verify() directly,
     # #       to skip need for parsing hash strings.
@@ -841,6 +872,65 @@ class bcrypt(_NoBackend, _BcryptCommon):
         "builtin": _BuiltinBackend,
     }
 
+    #=============================================================================
+    # compiled verify() fast path
+    #=============================================================================
+
+    @classmethod
+    def _compile_verify(cls):
+        # NOTE: variants such as bcrypt_sha256 use a different format & digest,
+        #       so they have to go through the regular path.
+        for base in cls.__mro__:
+            if base is bcrypt:
+                break
+            if any(key in base.__dict__ for key in ("from_string", "_parse_ident",
+                                                    "_calc_checksum", "_norm_digest_args")):
+                return None
+        backend = cls.get_backend()
+        if backend not in cls.backends:
+            return None
+        min_rounds = cls.min_rounds
+        max_rounds = cls.max_rounds
+        norm_digest_args = cls._norm_digest_args
+        # NOTE: only matches canonical hashes -- in particular, salts & checksums whose
+        #       padding bits aren't zeroed go through from_string(), so it can issue warnings.
+        idents = [ident for ident in cls.ident_values if ident != IDENT_2X]
+        match = re.compile(r"^(%s)([0-9]{2})\$([./A-Za-z0-9]{21}[%s])([./A-Za-z0-9]{30}[%s])$" %
+                           ("|".join(re.escape(ident) for ident in idents),
+                            re.escape(cls.final_salt_chars), re.escape(BCRYPT_CHARS[::4]))).match
+
+        def verify(secret, hash):
+            if isinstance(hash, bytes):
+                try:
+                    hash = hash.decode("ascii")
+                except UnicodeDecodeError:
+                    return None
+            m = match(hash)
+            if not m:
+                return None
+            ident, rounds, salt, chk = m.groups()
+            rounds = int(rounds)
+            if not (min_rounds <= rounds <= max_rounds):
+                return None
+            secret, ident = norm_digest_args(secret, ident)
+            config = u"%s%02d$%s" % (ident, rounds, salt)
+            if backend == "bcrypt":
+                result = _bcrypt.hashpw(secret, config.encode("ascii")).decode("ascii")
+            elif backend == "os_crypt":
+                result = safe_crypt(secret, config)
+                if result is None:
+                    # let regular path handle errors
+                    return None
+            else:
+                result = config + _builtin_bcrypt(secret, ident[1:-1], salt.encode("ascii"),
+                                                  rounds).decode("ascii")
+            if not result.startswith(config) or len(result) != len(config) + 31:
+                # let regular path report CryptBackendError
+                return None
+            return consteq(result[-31:], chk)
+
+        return verify
+
     #=============================================================================
     # eoc
     #=============================================================================
@@ -1046,6 +1136,9 @@ class bcrypt_sha256(_wrapped_bcrypt):
         hash = template % (self.ident.strip(_UDOLLAR), self.rounds, self.salt, self.checksum)
         return hash
 
+    #: columns returned by parse_many() (adds wrapper version)
+    _column_names = ("salt", "rounds", "ident", "version", "checksum")
+
     #===================================================================
     # init
     #===================================================================
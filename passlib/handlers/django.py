@@ -70,6 +70,16 @@ class DjangoSaltedHash(uh.HasSalt, uh.GenericHandler):
     def to_string(self):
         return uh.render_mc2(self.ident, self.salt, self.checksum)
 
+    @classmethod
+    def _parse_many(cls, hashes):
+        salts, chks = uh.parse_mc2_many(hashes, cls.ident, handler=cls)
+        return cls._norm_many(dict(salt=salts, checksum=chks))
+
+    @classmethod
+    def _render_many(cls, columns):
+        columns = cls._norm_many(columns)
+        return uh.render_mc2_many(cls.ident, columns['salt'], columns['checksum'])
+
 # NOTE: only used by PBKDF2
 class DjangoVariableHash(uh.HasRounds, DjangoSaltedHash):
     """base class providing common code for django hashes w/ variable rounds"""
@@ -85,6 +95,17 @@ class DjangoVariableHash(uh.HasRounds, DjangoSaltedHash):
     def to_string(self):
         return uh.render_mc3(self.ident, self.rounds, self.salt, self.checksum)
 
+    @classmethod
+    def _parse_many(cls, hashes):
+        rounds, salts, chks = uh.parse_mc3_many(hashes, cls.ident, handler=cls)
+        return cls._norm_many(dict(rounds=rounds, salt=salts, checksum=chks))
+
+    @classmethod
+    def _render_many(cls, columns):
+        columns = cls._norm_many(columns)
+        return uh.render_mc3_many(cls.ident, columns['rounds'], columns['salt'],
+                                  columns['checksum'])
+
 class django_salted_sha1(DjangoSaltedHash):
     """This class implements Django's Salted SHA1 hash, and follows the :ref:`password-hash-api`.
 
@@ -214,6 +214,16 @@ class _MD5_Common(uh.HasSalt, uh.GenericHandler):
     def to_string(self):
         return uh.render_mc2(self.ident, self.salt, self.checksum)
 
+    @classmethod
+    def _parse_many(cls, hashes):
+        salts, chks = uh.parse_mc2_many(hashes, cls.ident, handler=cls)
+        return cls._norm_many(dict(salt=salts, checksum=chks))
+
+    @classmethod
+    def _render_many(cls, columns):
+        columns = cls._norm_many(columns)
+        return uh.render_mc2_many(cls.ident, columns['salt'], columns['checksum'])
+
     # _calc_checksum() - provided by subclass
 
     #===================================================================
@@ -6,9 +6,10 @@
 from binascii import hexlify, unhexlify
 from base64 import b64encode, b64decode
 import logging; log = logging.getLogger(__name__)
+import re
 # site
 # pkg
-from passlib.utils import to_unicode
+from passlib.utils import consteq, to_unicode
 from passlib.utils.binary import ab64_decode, ab64_encode
 from passlib.utils.compat import str_to_bascii
 from passlib.crypto.digest import pbkdf2_hmac
@@ -73,10 +74,63 @@ class Pbkdf2DigestHandler(uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum, uh.Gen
         chk = ab64_encode(self.checksum).decode("ascii")
         return uh.render_mc3(self.ident, self.rounds, salt, chk)
 
+    @classmethod
+    def _parse_many(cls, hashes):
+        rounds, salts, chks = uh.parse_mc3_many(hashes, cls.ident, handler=cls)
+        salts = [ab64_decode(salt.encode("ascii")) for salt in salts]
+        chks = [ab64_decode(chk.encode("ascii")) if chk else None for chk in chks]
+        return cls._norm_many(dict(rounds=rounds, salt=salts, checksum=chks))
+
+    @classmethod
+    def _render_many(cls, columns):
+        columns = cls._norm_many(columns)
+        salts = [ab64_encode(salt).decode("ascii") for salt in columns['salt']]
+        chks = [ab64_encode(chk).decode("ascii") if chk else None for chk in columns['checksum']]
+        return uh.render_mc3_many(cls.ident, columns['rounds'], salts, chks)
+
     def _calc_checksum(self, secret):
         # NOTE: pbkdf2_hmac() will encode secret & salt using UTF8
         return pbkdf2_hmac(self._digest, secret, self.salt, self.rounds, self.checksum_size)
 
+    @classmethod
+    def _compile_verify(cls):
+        if (cls.from_string.__func__ is not Pbkdf2DigestHandler.from_string.__func__ or
+                cls._calc_checksum is not Pbkdf2DigestHandler._calc_checksum):
+            return None
+        digest = cls._digest
+        checksum_size = cls.checksum_size
+        min_rounds = cls.min_rounds
+        max_rounds = cls.max_rounds
+        min_salt_size = cls.min_salt_size
+        max_salt_size = cls.max_salt_size
+        # NOTE: only matches canonical hashes, everything else goes through from_string()
+        match = re.compile(r"^%s([1-9][0-9]*)\$([./A-Za-z0-9]*)\$([./A-Za-z0-9]{%d})$" %
+                           (re.escape(cls.ident), cls.encoded_checksum_size)).match
+
+        def verify(secret, hash):
+            if isinstance(hash, bytes):
+                try:
+                    hash = hash.decode("ascii")
+                except UnicodeDecodeError:
+                    return None
+            m = match(hash)
+            if not m:
+                return None
+            rounds, salt, chk = m.groups()
+            rounds = int(rounds)
+            if not (min_rounds <= rounds <= max_rounds):
+                return None
+            try:
+                salt = ab64_decode(salt.encode("ascii"))
+                chk = ab64_decode(chk.encode("ascii"))
+            except (ValueError, TypeError):
+                return None
+            if not (min_salt_size <= len(salt) <= max_salt_size) or len(chk) != checksum_size:
+                return None
+            return consteq(pbkdf2_hmac(digest, secret, salt, rounds, checksum_size), chk)
+
+        return verify
+
 def create_pbkdf2_hash(hash_name, digest_size, rounds=12000, ident=None, module=__name__):
     """create new Pbkdf2DigestHandler subclass for a specific hash"""
     name = 'pbkdf2_' + hash_name
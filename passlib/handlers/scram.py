@@ -275,6 +275,15 @@ class scram(uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum, uh.GenericHandler):
         )
         return '$scram$%d$%s$%s' % (self.rounds, salt, chk_str)
 
+    @classmethod
+    def _render_many(cls, columns):
+        # NOTE: constructor won't accept 'algs' along with a checksum (which implies them),
+        #       so only passing it through for config strings.
+        columns = dict(columns)
+        columns["algs"] = [None if chk else algs
+                           for algs, chk in zip(columns["algs"], columns["checksum"])]
+        return super()._render_many(columns)
+
     #===================================================================
     # variant constructor
     #===================================================================
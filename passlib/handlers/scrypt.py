@@ -184,6 +184,12 @@ class scrypt(uh.ParallelismMixin, uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum
         else:
             raise uh.exc.InvalidHashError(cls)
 
+    @classmethod
+    def _parse_many(cls, hashes):
+        parse = cls.parse
+        columns = uh.collect_columns(cls._column_names, (parse(hash) for hash in hashes))
+        return cls._norm_many(columns)
+
     #
     # passlib's format:
     #   $scrypt$ln=<logN>,r=<r>,p=<p>$<salt>[$<digest>]
@@ -314,6 +320,15 @@ class scrypt(uh.ParallelismMixin, uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum
         # NOTE: if hash contains invalid complex constraint, relying on error
         #       being raised by scrypt call in _calc_checksum()
 
+    @classmethod
+    def _norm_many(cls, columns):
+        # validate block_size column, for GenericHandler._norm_many()
+        values = columns.get("block_size")
+        if values is not None:
+            norm = cls._norm_block_size
+            columns["block_size"] = [norm(value) for value in values]
+        return super()._norm_many(columns)
+
     @classmethod
     def _norm_block_size(cls, block_size, relaxed=False):
         return uh.norm_integer(cls, block_size, min=1, param="block_size", relaxed=relaxed)
@@ -88,6 +88,17 @@ class sha1_crypt(uh.HasManyBackends, uh.HasRounds, uh.HasSalt, uh.GenericHandler
         chk = None if config else self.checksum
         return uh.render_mc3(self.ident, self.rounds, self.salt, chk)
 
+    @classmethod
+    def _parse_many(cls, hashes):
+        rounds, salts, chks = uh.parse_mc3_many(hashes, cls.ident, handler=cls)
+        return cls._norm_many(dict(rounds=rounds, salt=salts, checksum=chks))
+
+    @classmethod
+    def _render_many(cls, columns):
+        columns = cls._norm_many(columns)
+        return uh.render_mc3_many(cls.ident, columns['rounds'], columns['salt'],
+                                  columns['checksum'])
+
     #===================================================================
     # backend
     #===================================================================
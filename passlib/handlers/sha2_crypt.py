@@ -5,9 +5,10 @@
 # core
 import hashlib
 import logging; log = logging.getLogger(__name__)
+import re
 # site
 # pkg
-from passlib.utils import safe_crypt, test_crypt, \
+from passlib.utils import consteq, safe_crypt, test_crypt, \
                           repeat_string, to_unicode
 from passlib.utils.binary import h64
 import passlib.utils.handlers as uh
@@ -390,6 +391,57 @@ class _SHA2_Common(uh.HasManyBackends, uh.HasRounds, uh.HasSalt,
         return _raw_sha2_crypt(secret, self.salt, self.rounds,
                                self._cdb_use_512)
 
+    #---------------------------------------------------------------
+    # compiled verify() fast path
+    #---------------------------------------------------------------
+    @classmethod
+    def _compile_verify(cls):
+        if (cls.from_string.__func__ is not _SHA2_Common.from_string.__func__ or
+                cls._calc_checksum is not _SHA2_Common._calc_checksum):
+            return None
+        backend = cls.get_backend()
+        if backend not in ("os_crypt", "builtin"):
+            return None
+        use_os_crypt = (backend == "os_crypt")
+        ident = cls.ident
+        checksum_size = cls.checksum_size
+        min_rounds = cls.min_rounds
+        max_rounds = cls.max_rounds
+        use_512 = cls._cdb_use_512
+        # NOTE: only matches canonical hashes, everything else goes through from_string()
+        match = re.compile(r"^%s(?:rounds=([1-9][0-9]*)\$)?([./0-9A-Za-z]{%d,%d})\$([./0-9A-Za-z]{%d})$" %
+                           (re.escape(ident), cls.min_salt_size, cls.max_salt_size,
+                            checksum_size)).match
+
+        def verify(secret, hash):
+            if isinstance(hash, bytes):
+                try:
+                    hash = hash.decode("ascii")
+                except UnicodeDecodeError:
+                    return None
+            m = match(hash)
+            if not m:
+                return None
+            rounds, salt, chk = m.groups()
+            if rounds is None:
+                rounds = 5000
+            else:
+                rounds = int(rounds)
+                if not (min_rounds <= rounds <= max_rounds):
+                    return None
+            if use_os_crypt:
+                result = safe_crypt(secret, hash[:-checksum_size])
+                if result is None or not result.startswith(ident) or \
+                        result[-checksum_size-1] != _UDOLLAR:
+                    # let regular path handle fallback & errors
+                    return None
+                result = result[-checksum_size:]
+            else:
+                result = _raw_sha2_crypt(secret, salt, rounds, use_512)
+            return consteq(result, chk)
+
+        return verify
+
     #===================================================================
     # eoc
     #===================================================================
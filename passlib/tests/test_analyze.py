@@ -0,0 +1,70 @@
+"""passlib.tests -- tests for passlib.analyze"""
+#=============================================================================
+# imports
+#=============================================================================
+# core
+from io import StringIO
+import json
+import logging; log = logging.getLogger(__name__)
+from unittest import mock
+# site
+# pkg
+from passlib.context import CryptContext
+from passlib.tests.utils import TestCase
+# local
+__all__ = [
+    "AnalyzeTest",
+]
+
+#=============================================================================
+# tests
+#=============================================================================
+class AnalyzeTest(TestCase):
+    """test passlib.analyze"""
+    descriptionPrefix = "passlib.analyze"
+
+    def test_main(self):
+        """main()"""
+        from passlib.analyze import main
+        from passlib.hash import md5_crypt, sha256_crypt
+
+        config = self.mktemp()
+        with open(config, "w") as fh:
+            fh.write(CryptContext(["sha256_crypt", "md5_crypt"], deprecated=["md5_crypt"],
+                                  sha256_crypt__min_rounds=2000).to_string())
+
+        path = self.mktemp()
+        with open(path, "w") as fh:
+            fh.write("alice:%s\n" % sha256_crypt.using(rounds=1000).hash("test"))
+            fh.write("bob:%s\n" % sha256_crypt.using(rounds=2000).hash("test"))
+            fh.write("\n")
+            fh.write("carol:%s\n" % md5_crypt.hash("test"))
+            fh.write("dave:*\n")
+
+        # json output
+        with mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            self.assertEqual(main("-c", config, "-f", "1", "--json", "--no-cost", path), 0)
+        result = json.loads(stdout.getvalue())
+        self.assertEqual(result["total"], 4)
+        self.assertEqual(result["unknown"], 1)
+        self.assertEqual(result["needs_update"], 2)
+        self.assertIs(result["rehash_cost"], None)
+        self.assertEqual(result["counts"], [
+            dict(scheme="md5_crypt", ident=None, rounds=None, count=1),
+            dict(scheme="sha256_crypt", ident=None, rounds=1000, count=1),
+            dict(scheme="sha256_crypt", ident=None, rounds=2000, count=1),
+        ])
+
+        # text output, reading from stdin
+        with open(path) as fh:
+            data = "".join(line.partition(":")[2] for line in fh)
+        with mock.patch("sys.stdin", StringIO(data)), \
+             mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            self.assertEqual(main("-c", config, "-j", "2"), 0)
+        output = stdout.getvalue()
+        self.assertTrue(output.startswith("4 hashes: 2 needs update, 1 unknown, 0 malformed\n"))
+        self.assertIn("estimated rehash cost", output)
+
+#=============================================================================
+# eof
+#=============================================================================
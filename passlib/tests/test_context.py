@@ -290,6 +290,346 @@ sha512_crypt__min_rounds = 45000
         self.assertEqual(cc1.to_dict(), self.sample_1_dict)
         self.assertEqual(cc4.to_dict(), self.sample_12_dict)
 
+    def test_04_copy_incremental(self):
+        """test copy() reuses unchanged records"""
+        cc1 = CryptContext(["sha256_crypt", "md5_crypt", "des_crypt"],
+                           sha256_crypt__default_rounds=5000,
+                           admin__sha256_crypt__default_rounds=6000)
+        cc1.identify("$1$abc$")
+        get = lambda cc, scheme, cat=None: cc._config.get_record(scheme, cat)
+
+        # changing default scheme should reuse everything
+        cc2 = cc1.copy(default="md5_crypt")
+        self.assertEqual(cc2.default_scheme(), "md5_crypt")
+        for scheme in cc1.schemes():
+            self.assertIs(get(cc2, scheme), get(cc1, scheme))
+        self.assertIs(get(cc2, "sha256_crypt", "admin"), get(cc1, "sha256_crypt", "admin"))
+        self.assertIs(cc2._config._get_identify_index(None),
+                      cc1._config._get_identify_index(None))
+
+        # changing a scheme's settings should only rebuild that scheme's records
+        cc3 = cc1.copy(sha256_crypt__default_rounds=7000)
+        self.assertIsNot(get(cc3, "sha256_crypt"), get(cc1, "sha256_crypt"))
+        self.assertEqual(get(cc3, "sha256_crypt").default_rounds, 7000)
+        self.assertIs(get(cc3, "sha256_crypt", "admin"), get(cc1, "sha256_crypt", "admin"))
+        self.assertIs(get(cc3, "md5_crypt"), get(cc1, "md5_crypt"))
+        self.assertIsNot(cc3._config._get_identify_index(None),
+                         cc1._config._get_identify_index(None))
+        self.assertEqual(cc3.identify(cc3.hash("test")), "sha256_crypt")
+
+        # deprecating a scheme should rebuild its record
+        cc4 = cc1.copy(deprecated=["des_crypt"])
+        self.assertTrue(get(cc4, "des_crypt").deprecated)
+        self.assertFalse(get(cc1, "des_crypt").deprecated)
+        self.assertIs(get(cc4, "md5_crypt"), get(cc1, "md5_crypt"))
+
+        # same for update()
+        record = get(cc1, "md5_crypt")
+        cc1.update(sha256_crypt__default_rounds=8000)
+        self.assertIs(get(cc1, "md5_crypt"), record)
+        self.assertEqual(get(cc1, "sha256_crypt").default_rounds, 8000)
+
+        # ambiguous prefixes shouldn't be re-checked unless schemes change
+        from passlib.context import _CryptConfig
+        checks = []
+        orig_check = _CryptConfig._check_identify_prefixes
+        def check_prefixes(config):
+            checks.append(config.schemes)
+            return orig_check(config)
+        self.patchAttr(_CryptConfig, "_check_identify_prefixes", check_prefixes)
+        with self.assertLogs("passlib.context", "DEBUG") as logs:
+            cc5 = CryptContext(["cta_pbkdf2_sha1", "dlitz_pbkdf2_sha1"])
+        self.assertIn("'dlitz_pbkdf2_sha1' hashes may be misidentified", logs.output[0])
+        cc5.copy(cta_pbkdf2_sha1__default_rounds=1000)
+        self.assertEqual(len(checks), 1)
+        cc5.copy(schemes=["cta_pbkdf2_sha1", "dlitz_pbkdf2_sha1", "des_crypt"])
+        self.assertEqual(len(checks), 2)
+
+    def test_04_record_interning(self):
+        """test contexts w/ same settings share records"""
+        import gc
+        from passlib import context as mod
+        kwds = dict(schemes=["sha256_crypt", "md5_crypt"],
+                    sha256_crypt__default_rounds=5123,
+                    admin__sha256_crypt__default_rounds=6123)
+        cc1 = CryptContext(**kwds)
+        cc2 = CryptContext(**kwds)
+        get = lambda cc, scheme, cat=None: cc._config.get_record(scheme, cat)
+        self.assertIs(get(cc1, "sha256_crypt"), get(cc2, "sha256_crypt"))
+        self.assertIs(get(cc1, "sha256_crypt", "admin"), get(cc2, "sha256_crypt", "admin"))
+        self.assertIs(cc1._config._get_record_list("admin"), cc2._config._get_record_list("admin"))
+        self.assertIs(cc1._config._get_identify_index(None), cc2._config._get_identify_index(None))
+
+        # records don't depend on category
+        cc3 = CryptContext(["sha256_crypt", "md5_crypt"], sha256_crypt__default_rounds=6123)
+        self.assertIs(get(cc3, "sha256_crypt"), get(cc1, "sha256_crypt", "admin"))
+
+        # different settings, or deprecation, shouldn't be shared
+        cc4 = CryptContext(["sha256_crypt", "md5_crypt"], sha256_crypt__default_rounds=5124)
+        self.assertIsNot(get(cc4, "sha256_crypt"), get(cc1, "sha256_crypt"))
+        self.assertIs(get(cc4, "md5_crypt"), get(cc1, "md5_crypt"))
+        cc5 = CryptContext(**dict(kwds, deprecated=["md5_crypt"]))
+        self.assertIsNot(get(cc5, "md5_crypt"), get(cc1, "md5_crypt"))
+        self.assertTrue(get(cc5, "md5_crypt").deprecated)
+        self.assertFalse(get(cc1, "md5_crypt").deprecated)
+
+        # public using() should still return a new class each time
+        using = lambda: hash.sha256_crypt.using(relaxed=True, default_rounds=5123)
+        self.assertIsNot(using(), get(cc1, "sha256_crypt"))
+        self.assertIsNot(using(), using())
+
+        # recently used entries should be kept alive, even once unused
+        # NOTE: takes a couple of passes, since record list & record classes are cyclic
+        def has_entry():
+            for _ in range(3):
+                gc.collect()
+            return any(key[2] == (("default_rounds", int, 5123),)
+                       for key in list(mod._record_cache.keys()))
+        del cc1, cc2, cc3, cc4, cc5
+        self.assertTrue(has_entry())
+        record = mod._record_cache[next(key for key in list(mod._record_cache.keys())
+                                        if key[2] == (("default_rounds", int, 5123),))]
+        self.assertIs(get(CryptContext(**kwds), "sha256_crypt"), record)
+        del record
+
+        # ... but should be discarded once they drop out of recently used list
+        self.patchAttr(mod, "_max_recent_records", 0)
+        CryptContext(["md5_crypt"])
+        self.assertFalse(has_entry())
+
+    def test_05_snapshot(self):
+        """test to_snapshot() / from_snapshot()"""
+        cc1 = CryptContext(**self.sample_1_dict)
+
+        # round trip
+        data = cc1.to_snapshot()
+        self.assertIsInstance(data, bytes)
+        cc2 = CryptContext.from_snapshot(data)
+        self.assertEqual(cc2.to_dict(), self.sample_1_dict)
+        h = cc2.hash("test")
+        self.assertTrue(cc1.verify("test", h))
+
+        # source digest is checked
+        source = self.sample_1_unicode
+        data = cc1.to_snapshot(source)
+        self.assertEqual(CryptContext.from_snapshot(data, source=source).to_dict(),
+                         self.sample_1_dict)
+        self.assertEqual(CryptContext.from_snapshot(data, source=source.encode("utf-8")).to_dict(),
+                         self.sample_1_dict)
+        self.assertRaises(ValueError, CryptContext.from_snapshot, data, source=source + "\n#")
+        self.assertRaises(ValueError, CryptContext.from_snapshot, data, source=source,
+                          section="other")
+
+        # passlib version is checked
+        data = data.replace(b'"passlib": "', b'"passlib": "0.')
+        self.assertRaises(ValueError, CryptContext.from_snapshot, data)
+
+        # malformed data
+        self.assertRaises(ValueError, CryptContext.from_snapshot, b"")
+        self.assertRaises(ValueError, CryptContext.from_snapshot, b"{}")
+        self.assertRaises(TypeError, CryptContext.from_snapshot, None)
+
+        # unregistered handlers rejected
+        self.assertRaises(RuntimeError, CryptContext([DelayHash]).to_snapshot)
+
+    def test_05_snapshot_records(self):
+        """test from_snapshot() restores records w/o calling using()"""
+        import json
+        from collections import OrderedDict
+        import weakref
+        from passlib import context as mod
+        cc1 = CryptContext(**self.sample_1_dict)
+        data = cc1.to_snapshot()
+
+        # patch out record cache, and record builder
+        self.patchAttr(mod, "_record_cache", weakref.WeakValueDictionary())
+        self.patchAttr(mod, "_recent_records", OrderedDict())
+        built = []
+        orig_build = mod._CryptConfig._build_record
+        def build_record(handler, deprecated, settings):
+            built.append(handler.name)
+            return orig_build(handler, deprecated, settings)
+        self.patchAttr(mod._CryptConfig, "_build_record", staticmethod(build_record))
+
+        # records should be restored from their attrs
+        cc2 = CryptContext.from_snapshot(data)
+        self.assertEqual(built, [])
+        self.assertEqual(cc2.to_dict(), self.sample_1_dict)
+        for key, r1 in cc1._config._records.items():
+            r2 = cc2._config._records[key]
+            self.assertIsNot(r2, r1)
+            self.assertEqual(r2.__name__, r1.__name__)
+            self.assertEqual(r2.__bases__, r1.__bases__)
+            self.assertIs(r2._Context__orig_handler, r1._Context__orig_handler)
+            self.assertEqual(r2.deprecated, r1.deprecated)
+            self.assertEqual(getattr(r2, "default_rounds", None),
+                             getattr(r1, "default_rounds", None))
+        self.assertTrue(cc1.verify("test", cc2.hash("test", scheme="bsdi_crypt")))
+        self.assertEqual(cc2.handler("bsdi_crypt").default_rounds, 25001)
+
+        # restored context should produce the same snapshot
+        self.assertEqual(cc2.to_snapshot(), data)
+
+        # records w/o stored attrs should fall back to using()
+        info = json.loads(data.decode("utf-8"))
+        for entry in info["state"]["records"]:
+            if entry[0] == "sha512_crypt":
+                entry[3] = None
+        self.patchAttr(mod, "_record_cache", weakref.WeakValueDictionary())
+        cc3 = CryptContext.from_snapshot(json.dumps(info).encode("utf-8"))
+        self.assertEqual(built, ["sha512_crypt"])
+        self.assertEqual(cc3.handler("sha512_crypt").min_desired_rounds, 40000)
+
+        # malformed state should be rejected
+        info["state"]["records"] = [[1]]
+        self.assertRaises(ValueError, CryptContext.from_snapshot, json.dumps(info).encode("utf-8"))
+
+    def test_06_from_path_snapshot(self):
+        """test from_path() with snapshot_path"""
+        path = self.mktemp()
+        snapshot_path = self.mktemp()
+        set_file(path, self.sample_1_unicode)
+
+        # invalid snapshot file should be replaced
+        set_file(snapshot_path, "garbage")
+        ctx = CryptContext.from_path(path, snapshot_path=snapshot_path)
+        self.assertEqual(ctx.to_dict(), self.sample_1_dict)
+        with open(snapshot_path, "rb") as fh:
+            data = fh.read()
+        self.assertEqual(CryptContext.from_snapshot(data, source=self.sample_1_unicode).to_dict(),
+                         self.sample_1_dict)
+
+        # valid snapshot should be used as-is
+        ctx = CryptContext.from_path(path, snapshot_path=snapshot_path)
+        self.assertEqual(ctx.to_dict(), self.sample_1_dict)
+        with open(snapshot_path, "rb") as fh:
+            self.assertEqual(fh.read(), data)
+
+        # changes to source config should invalidate snapshot
+        set_file(path, self.sample_1_unicode.replace("default = md5_crypt", "default = des_crypt"))
+        ctx = CryptContext.from_path(path, snapshot_path=snapshot_path)
+        self.assertEqual(ctx.default_scheme(), "des_crypt")
+        with open(snapshot_path, "rb") as fh:
+            self.assertNotEqual(fh.read(), data)
+
+    def test_07_from_path_watch(self):
+        """test from_path() with watch=True"""
+        path = self.mktemp()
+        set_file(path, self.sample_1_unicode)
+        ctx = CryptContext.from_path(path, watch=True, watch_interval=3600)
+        self.addCleanup(ctx.watcher.stop)
+        watcher = ctx.watcher
+        self.assertTrue(watcher.running)
+        self.assertEqual(ctx.to_dict(), self.sample_1_dict)
+        self.assertIs(CryptContext.from_path(path).watcher, None)
+        self.assertIs(ctx.copy().watcher, None)
+
+        # unchanged file shouldn't be reloaded
+        self.assertFalse(watcher.check())
+        self.assertEqual((watcher.reloads, watcher.failures), (0, 0))
+
+        # changed file should be reloaded
+        h1 = ctx.hash("test")
+        set_file(path, self.sample_1_unicode.replace("default = md5_crypt",
+                                                     "default = bsdi_crypt"))
+        self.assertTrue(watcher.check())
+        self.assertEqual(ctx.default_scheme(), "bsdi_crypt")
+        self.assertEqual((watcher.reloads, watcher.failures), (1, 0))
+        self.assertGreaterEqual(watcher.last_latency, 0)
+        self.assertTrue(ctx.verify("test", h1))
+        self.assertFalse(watcher.check())
+
+        # dummy_verify() hashes should be re-prepared by reload, if they were before
+        self.assertEqual(len(ctx._dummy_hashes), 0)
+        ctx.prepare_dummy_verify(background=False)
+        set_file(path, self.sample_1_unicode.replace("default = md5_crypt",
+                                                     "default = des_crypt"))
+        self.assertTrue(watcher.check())
+        self.assertEqual(ctx.identify(ctx._dummy_hashes[None]), "des_crypt")
+        set_file(path, self.sample_1_unicode.replace("default = md5_crypt",
+                                                     "default = bsdi_crypt"))
+        self.assertTrue(watcher.check())
+        self.assertEqual(ctx.default_scheme(), "bsdi_crypt")
+
+        # invalid config should be rejected, keeping current policy
+        set_file(path, self.sample_1_unicode.replace("default = md5_crypt",
+                                                     "default = no_such_crypt"))
+        self.assertFalse(watcher.check())
+        self.assertEqual(ctx.default_scheme(), "bsdi_crypt")
+        self.assertEqual((watcher.reloads, watcher.failures), (3, 1))
+        self.assertIsInstance(watcher.last_error, KeyError)
+        # ... and not retried until file changes again
+        self.assertFalse(watcher.check())
+        self.assertEqual(watcher.failures, 1)
+
+        # same for missing file
+        os.remove(path)
+        self.assertFalse(watcher.check())
+        self.assertFalse(watcher.check())
+        self.assertEqual((watcher.reloads, watcher.failures), (3, 2))
+        self.assertIsInstance(watcher.last_error, OSError)
+        self.assertEqual(ctx.default_scheme(), "bsdi_crypt")
+
+        # replacement file should be picked up
+        tmp = self.mktemp()
+        set_file(tmp, self.sample_1_unicode)
+        os.replace(tmp, path)
+        self.assertTrue(watcher.check())
+        self.assertEqual(ctx.to_dict(), self.sample_1_dict)
+        self.assertIs(watcher.last_error, None)
+
+        # background thread should pick up changes
+        watcher.stop()
+        self.assertFalse(watcher.running)
+        watcher.interval = 0.01
+        watcher.start()
+        set_file(path, self.sample_1_unicode.replace("default = md5_crypt",
+                                                     "default = sha512_crypt"))
+        end = tick() + 5
+        while watcher.reloads < 5 and tick() < end:
+            time.sleep(0.01)
+        self.assertEqual(ctx.default_scheme(), "sha512_crypt")
+
+        # bad params
+        self.assertRaises(ValueError, CryptContext.from_path, path, watch=True, watch_interval=0)
+        self.assertRaises(OSError, CryptContext.from_path, path + ".missing", watch=True)
+
+    def test_08_from_path_watch_snapshot(self):
+        """test from_path() with watch=True and snapshot_path"""
+        path = self.mktemp()
+        snapshot_path = self.mktemp()
+        set_file(path, self.sample_1_unicode)
+        ctx = CryptContext.from_path(path, snapshot_path=snapshot_path,
+                                     watch=True, watch_interval=3600)
+        self.addCleanup(ctx.watcher.stop)
+        watcher = ctx.watcher
+        self.assertEqual(watcher.snapshot_path, snapshot_path)
+
+        # reload should rewrite snapshot
+        source = self.sample_1_unicode.replace("default = md5_crypt", "default = bsdi_crypt")
+        set_file(path, source)
+        self.assertTrue(watcher.check())
+        self.assertEqual(ctx.default_scheme(), "bsdi_crypt")
+        with open(snapshot_path, "rb") as fh:
+            snapshot = fh.read()
+        self.assertEqual(CryptContext.from_snapshot(snapshot, source=source).to_dict(),
+                         ctx.to_dict())
+
+        # reload should use snapshot if it matches new contents
+        # (snapshot written w/ different policy, so it's clear which was loaded)
+        other = ctx.copy(default="des_crypt")
+        set_file(snapshot_path, other.to_snapshot(self.sample_1_unicode))
+        set_file(path, self.sample_1_unicode)
+        self.assertTrue(watcher.check())
+        self.assertEqual(ctx.default_scheme(), "des_crypt")
+
+        # failure to write snapshot shouldn't affect reload
+        watcher.snapshot_path = os.path.join(snapshot_path + ".missing", "snapshot")
+        set_file(path, source)
+        self.assertTrue(watcher.check())
+        self.assertEqual(ctx.default_scheme(), "bsdi_crypt")
+        self.assertIs(watcher.last_error, None)
+
     def test_09_repr(self):
         """test repr()"""
         cc1 = CryptContext(**self.sample_1_dict)
@@ -1070,6 +1410,45 @@ sha512_crypt__min_rounds = 45000
         # bad category values
         self.assertRaises(TypeError, cc.identify, None, category=1)
 
+    def test_44_identify_dispatch(self):
+        """test identify() prefix dispatch table"""
+        schemes = ["ldap_md5", "md5_crypt", "ldap_md5_crypt", "sha256_crypt",
+                   "des_crypt", "hex_md5", "django_salted_md5"]
+        cc = CryptContext(schemes, sha256_crypt__default_rounds=1000)
+
+        # hashes should identify the same as checking each handler in turn
+        handlers = [get_crypt_handler(name) for name in schemes]
+        for scheme in schemes:
+            h = cc.handler(scheme).hash("test")
+            expected = next(handler.name for handler in handlers if handler.identify(h))
+            self.assertEqual(cc.identify(h), expected)
+            self.assertEqual(cc.identify(h.encode("ascii")), expected)
+            self.assertEqual(cc.identify(h, category="admin"), expected)
+
+        # handlers w/o a prefix should still be checked in order
+        self.assertEqual(cc.identify("9" * 13), "des_crypt")
+        self.assertEqual(cc.identify("9" * 32), "hex_md5")
+        self.assertIs(cc.identify("$9$abc"), None)
+        self.assertIs(cc.identify(""), None)
+
+        # ambiguous prefixes should fall back to linear scan, w/o warning
+        with self.assertWarningList([]):
+            cc = CryptContext(["cta_pbkdf2_sha1", "md5_crypt", "dlitz_pbkdf2_sha1"])
+        records, prefix_map = cc._config._get_identify_index(None)[:2]
+        self.assertEqual(prefix_map["$p5k2$"], [0, 1, 2])
+        self.assertEqual(prefix_map["$1$"], [1])
+        h = get_crypt_handler("dlitz_pbkdf2_sha1").hash("test")
+        self.assertEqual(cc.identify(h), "cta_pbkdf2_sha1")
+
+        # ... including master_context, which should still include all its schemes
+        from passlib.apps import master_context
+        self.assertEqual(master_context.handler("dlitz_pbkdf2_sha1").name, "dlitz_pbkdf2_sha1")
+        handlers = [master_context.handler(name) for name in master_context.schemes()]
+        for h in [h, get_crypt_handler("cta_pbkdf2_sha1").hash("test"),
+                  get_crypt_handler("md5_crypt").hash("test")]:
+            expected = next(handler.name for handler in handlers if handler.identify(h))
+            self.assertEqual(master_context.identify(h), expected)
+
     def test_45_verify(self):
         """test verify() scheme kwd"""
         handlers = ["md5_crypt", "des_crypt", "bsdi_crypt"]
@@ -1220,6 +1599,18 @@ sha512_crypt__min_rounds = 45000
         self.assertTrue(ok)
         self.assertIs(new_hash, None)
 
+        # check right password, hash below min rounds (via combined single-parse check)
+        from passlib.hash import sha256_crypt
+        h3 = sha256_crypt.using(rounds=1000).hash("password")
+        self.assertEqual(cc.handler("sha256_crypt").verify_and_needs_update("password", h3),
+                         (True, True))
+        self.assertEqual(cc.handler("sha256_crypt").verify_and_needs_update("wrongpass", h3),
+                         (False, False))
+        ok, new_hash = cc.verify_and_update("password", h3)
+        self.assertTrue(ok)
+        self.assertTrue(cc.verify("password", new_hash))
+        self.assertFalse(cc.needs_update(new_hash))
+
         #--------------------------------------------------------------
         # border cases
         #--------------------------------------------------------------
@@ -1250,6 +1641,71 @@ sha512_crypt__min_rounds = 45000
         # bad category values
         self.assertRaises(TypeError, cc.verify_and_update, 'secret', refhash, category=1)
 
+    def test_47_verify_many(self):
+        """test verify_many() method"""
+        cc = CryptContext(["sha256_crypt", "md5_crypt", "des_crypt"],
+                          sha256_crypt__default_rounds=1000)
+        h1 = cc.hash("test")
+        h2 = cc.handler("md5_crypt").hash("test")
+        h3 = cc.handler("des_crypt").hash("other")
+        pairs = [("test", h1), ("test", h2), ("test", h3), ("other", h3),
+                 ("other", h1), ("test", None)]
+        expected = [True, True, False, True, False, False]
+
+        # results should match verify(), in same order as input
+        for workers in [None, 1, 3]:
+            result = cc.verify_many(iter(pairs), workers=workers)
+            self.assertEqual(list(result), expected)
+            self.assertEqual(list(cc.verify_many(pairs * 5, workers=workers)), expected * 5)
+
+        # errors raised when offending pair is reached
+        for workers in [None, 3]:
+            result = cc.verify_many([("test", h1), ("test", "$9$abc")], workers=workers)
+            self.assertRaises(ValueError, list, result)
+            self.assertRaises(TypeError, list, cc.verify_many([("test", 1)], workers=workers))
+
+            # results for earlier pairs (including ones already submitted to pool)
+            # should be yielded before error is raised
+            result = cc.verify_many([("test", h1), ("test", h2), ("test", "$9$abc"),
+                                     ("test", h3)], workers=workers)
+            self.assertTrue(next(result))
+            self.assertTrue(next(result))
+            self.assertRaises(ValueError, next, result)
+
+        # compiled verify fast path should be looked up once per scheme, not once per pair
+        handler = cc.handler("sha256_crypt")
+        calls = []
+        orig = handler._get_compiled_verify
+        def wrapper():
+            calls.append(1)
+            return orig()
+        self.patchAttr(handler, "_get_compiled_verify", wrapper)
+        self.assertEqual(list(cc.verify_many([("test", h1), ("other", h1)] * 5)),
+                         [True, False] * 5)
+        self.assertEqual(len(calls), 1)
+
+        # should go through verify cache, metrics & admission control like verify()
+        from passlib.context import AdmissionControl, ContextMetrics, VerifyCache
+        for workers in [1, 3]:
+            metrics = ContextMetrics()
+            ac = AdmissionControl()
+            cache = VerifyCache()
+            cc2 = CryptContext(["sha256_crypt", "md5_crypt"], sha256_crypt__default_rounds=1000,
+                               metrics=metrics, admission=ac, verify_cache=cache)
+            self.assertTrue(cc2.verify("test", h1))
+            self.assertEqual(list(cc2.verify_many([("test", h1), ("test", h2), ("other", h2)],
+                                                  workers=workers)), [True, True, False])
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(ac.admitted, 3)
+            series = dict((entry["scheme"], (entry["calls"], entry["failures"]))
+                          for entry in metrics.snapshot()["series"])
+            self.assertEqual(series, {"sha256_crypt": (1, 0), "md5_crypt": (2, 1)})
+
+        # bad workers values
+        self.assertRaises(ValueError, cc.verify_many, pairs, workers=0)
+        self.assertRaises(TypeError, cc.verify_many, pairs, workers="2")
+        self.assertRaises(TypeError, cc.verify_many, pairs, workers=True)
+
     def test_48_context_kwds(self):
         """hash(), verify(), and verify_and_update() -- discard unused context keywords"""
 
@@ -1552,6 +2008,89 @@ sha512_crypt__min_rounds = 45000
         self.assertEqual(min(seen), lower, "vary_rounds had wrong lower limit:")
         self.assertEqual(max(seen), upper, "vary_rounds had wrong upper limit:")
 
+    #===================================================================
+    # autotune()
+    #===================================================================
+    def test_autotune(self):
+        """test autotune() method"""
+        cc = CryptContext(["sha256_crypt", "md5_crypt", "sha512_crypt"],
+                          deprecated=["sha512_crypt"],
+                          sha256_crypt__min_rounds=1000,
+                          sha256_crypt__max_rounds=2000,
+                          sha512_crypt__default_rounds=5000)
+
+        # tunes non-deprecated schemes, honoring limits
+        result = cc.autotune(target_ms=1000)
+        self.assertIsNot(result, cc)
+        self.assertEqual(result.to_dict(), dict(cc.to_dict(), sha256_crypt__default_rounds=2000))
+
+        # explicit schemes & category
+        result = cc.autotune(target_ms=.001, category="admin", schemes=["sha512_crypt"])
+        self.assertEqual(result.to_dict(), dict(cc.to_dict(),
+                                                admin__sha512_crypt__default_rounds=1000))
+
+        # bad params
+        self.assertRaises(TypeError, cc.autotune, target_ms="1")
+        self.assertRaises(TypeError, cc.autotune, concurrency="1")
+        self.assertRaises(ValueError, cc.autotune, target_ms=0)
+
+    def test_analyze(self):
+        """test analyze() method"""
+        from passlib.hash import ldap_md5_crypt, md5_crypt, sha256_crypt
+        cc = CryptContext(["sha256_crypt", "ldap_md5_crypt", "md5_crypt"],
+                          deprecated=["md5_crypt"],
+                          sha256_crypt__default_rounds=2000,
+                          sha256_crypt__min_rounds=1500,
+                          admin__sha256_crypt__min_rounds=3000,
+                          admin__sha256_crypt__default_rounds=3000)
+        h1 = sha256_crypt.using(rounds=1000).hash("test")
+        h2 = sha256_crypt.using(rounds=2000).hash("test")
+        h3 = md5_crypt.hash("test")
+        h4 = ldap_md5_crypt.hash("test")
+        hashes = [h1, h2, h2, h3, h4, "$5$rounds=zz$abc$def", "bogus"]
+
+        def check(result):
+            self.assertEqual(result.total, 7)
+            self.assertEqual(result.unknown, 1)
+            self.assertEqual(result.malformed, 1)
+            self.assertEqual(result.counts, {
+                ("sha256_crypt", None, 1000): 1,
+                ("sha256_crypt", None, 2000): 2,
+                ("md5_crypt", None, None): 1,
+                ("ldap_md5_crypt", None, None): 1,
+            })
+            self.assertEqual(result.by_scheme, {"sha256_crypt": 3, "md5_crypt": 1,
+                                                "ldap_md5_crypt": 1})
+            self.assertEqual(result.by_rounds[("sha256_crypt", 2000)], 2)
+
+        # inline, streaming from generator
+        result = cc.analyze(iter(hashes), estimate_cost=False)
+        check(result)
+        self.assertEqual(result.stale, {("sha256_crypt", None, 1000): 1,
+                                        ("md5_crypt", None, None): 1})
+        self.assertEqual(result.needs_update, 2)
+        self.assertIs(result.rehash_cost, None)
+        self.assertIn("2 needs update", result.to_string())
+        self.assertEqual(result.to_dict()["stale"][0],
+                         dict(scheme="md5_crypt", ident=None, rounds=None, count=1))
+
+        # category & cost estimate
+        result = cc.analyze(hashes, category="admin")
+        check(result)
+        self.assertEqual(result.needs_update, 4)
+        self.assertGreater(result.hash_cost, 0)
+        self.assertAlmostEqual(result.rehash_cost, 4 * result.hash_cost)
+
+        # worker processes
+        result = cc.analyze(iter(hashes), workers=2, chunk_size=2, estimate_cost=False)
+        check(result)
+        self.assertEqual(result.needs_update, 2)
+
+        # bad params
+        self.assertRaises(TypeError, cc.analyze, hashes, workers="1")
+        self.assertRaises(ValueError, cc.analyze, hashes, workers=0)
+        self.assertRaises(ValueError, cc.analyze, hashes, chunk_size=0)
+
     #===================================================================
     # dummy_verify()
     #===================================================================
@@ -1572,6 +2111,645 @@ sha512_crypt__min_rounds = 45000
         # TODO: test dummy_verify() invoked by .verify() when hash is None,
         #       and same for .verify_and_update()
 
+    def test_dummy_verify_category(self):
+        """dummy_verify() -- per-category hashes"""
+        from passlib.context import VerifyCache
+        from passlib.hash import sha256_crypt
+
+        ctx = CryptContext(["sha256_crypt", "md5_crypt"],
+                           sha256_crypt__default_rounds=1000,
+                           admin__sha256_crypt__default_rounds=2000,
+                           staff__context__default="md5_crypt")
+        self.assertFalse(ctx.dummy_verify())
+        self.assertFalse(ctx.dummy_verify("admin"))
+        self.assertFalse(ctx.dummy_verify("staff"))
+        self.assertFalse(ctx.dummy_verify("unknown"))
+        hashes = ctx._dummy_hashes
+        self.assertEqual(sha256_crypt.from_string(hashes[None]).rounds, 1000)
+        self.assertEqual(sha256_crypt.from_string(hashes["admin"]).rounds, 2000)
+        self.assertEqual(ctx.identify(hashes["staff"]), "md5_crypt")
+
+        # unconfigured categories share hash for None, rather than growing the dict
+        self.assertEqual(sorted(hashes, key=str), [None, "admin", "staff"])
+
+        # prepare_dummy_verify()
+        ctx.update(admin__sha256_crypt__default_rounds=3000)
+        self.assertIsNot(ctx._dummy_hashes, hashes)
+        self.assertIs(ctx.prepare_dummy_verify(background=False), None)
+        self.assertEqual(sorted(ctx._dummy_hashes, key=str), [None, "admin", "staff"])
+        self.assertEqual(sha256_crypt.from_string(ctx._dummy_hashes["admin"]).rounds, 3000)
+        ctx.update(admin__sha256_crypt__default_rounds=2000)
+        thread = ctx.prepare_dummy_verify(["admin"])
+        thread.join()
+        self.assertEqual(sha256_crypt.from_string(ctx._dummy_hashes["admin"]).rounds, 2000)
+
+        # contexts w/ same settings should share hashes
+        other = ctx.copy()
+        other.prepare_dummy_verify(background=False)
+        self.assertEqual(other._dummy_hashes["admin"], ctx._dummy_hashes["admin"])
+
+        # hashes shouldn't be built unless requested
+        ctx.update(admin__sha256_crypt__default_rounds=4000)
+        time.sleep(0.1)
+        self.assertEqual(len(ctx._dummy_hashes), 0)
+        self.assertFalse(ctx.dummy_verify("admin"))
+        self.assertEqual(sha256_crypt.from_string(ctx._dummy_hashes["admin"]).rounds, 4000)
+
+        # no lock should be held while hashing (e.g. so a fork mid-hash can't deadlock)
+        hashes = ctx._dummy_hashes
+        self.assertFalse(hasattr(hashes, "lock"))
+        orig_get_record = hashes.config.get_record
+        def get_record(scheme, category):
+            record = orig_get_record(scheme, category)
+            if category == "staff":
+                # simulate another thread finishing first
+                hashes.setdefault("staff", "first")
+            return record
+        self.patchAttr(hashes.config, "get_record", get_record)
+        self.assertEqual(hashes.get_hash("staff"), "first")
+
+        # dummy_verify() shouldn't be sped up by the verify cache
+        calls = []
+
+        class CountingHash(DelayHash):
+            def _calc_checksum(self, secret):
+                calls.append(secret)
+                return super()._calc_checksum(secret)
+
+        ctx = CryptContext([CountingHash], verify_cache=VerifyCache())
+        ctx.dummy_verify()
+        del calls[:]
+        ctx.dummy_verify()
+        ctx.dummy_verify()
+        self.assertEqual(len(calls), 2)
+
+    def test_dummy_verify_calibrate(self):
+        """dummy_verify() -- calibrate_dummy_verify option"""
+        import passlib.context as mod
+        expected = 0.05
+
+        # NOTE: using fake clock, so timings are exact
+        clock = [1000.0]
+        def sleep(secs):
+            clock[0] += secs
+        self.patchAttr(mod, "timer", lambda: clock[0])
+        self.patchAttr(mod.time, "sleep", sleep)
+
+        class SlowHash(DelayHash):
+            name = "slow_hash"
+            _hash_prefix = u"$y$"
+
+            def _calc_checksum(self, secret):
+                sleep(expected)
+                return super()._calc_checksum(secret)
+
+        def time_dummy_verify(*args):
+            start = clock[0]
+            self.assertFalse(ctx.dummy_verify(*args))
+            return clock[0] - start
+
+        # default hash is fast, but legacy hashes in db are slow
+        ctx = CryptContext([DelayHash, SlowHash], admin__context__default="delay_hash",
+                           calibrate_dummy_verify=True)
+        self.assertEqual(ctx._verify_latency, {})
+        self.assertEqual(ctx.copy()._verify_latency, {})
+        ctx.prepare_dummy_verify(background=False)
+        self.assertEqual(time_dummy_verify(), 0)
+
+        legacy = SlowHash.hash("test")
+        self.assertTrue(ctx.verify("test", legacy))
+        self.assertEqual(ctx.verify_and_update("test", legacy)[0], True)
+        self.assertAlmostEqual(ctx._verify_latency[None], expected, delta=1e-9)
+        self.assertAlmostEqual(time_dummy_verify(), expected, delta=1e-9)
+
+        # latency is tracked per-category
+        self.assertEqual(time_dummy_verify("admin"), 0)
+        self.assertTrue(ctx.verify("test", legacy, category="admin"))
+        self.assertAlmostEqual(time_dummy_verify("admin"), expected, delta=1e-9)
+
+        # ... but unconfigured categories share estimate for None
+        self.assertTrue(ctx.verify("test", legacy, category="other"))
+        self.assertAlmostEqual(time_dummy_verify("other"), expected, delta=1e-9)
+        self.assertEqual(sorted(ctx._verify_latency, key=str), [None, "admin"])
+
+        # not tracked unless enabled
+        ctx = CryptContext([DelayHash, SlowHash])
+        self.assertTrue(ctx.verify("test", legacy))
+        self.assertIs(ctx._verify_latency, None)
+
+    #===================================================================
+    # metrics
+    #===================================================================
+    def test_metrics(self):
+        """metrics support"""
+        from passlib.context import ContextMetrics
+        from passlib.hash import md5_crypt
+
+        metrics = ContextMetrics(buckets=[10, .001])
+        self.assertEqual(metrics.buckets, (.001, 10))
+        cc = CryptContext(["sha256_crypt", "md5_crypt"], deprecated=["md5_crypt"],
+                          sha256_crypt__default_rounds=1000, metrics=metrics)
+        self.assertIs(cc.metrics, metrics)
+        self.assertIs(cc.copy().metrics, metrics)
+        self.assertIs(CryptContext(["md5_crypt"]).metrics, None)
+
+        h1 = cc.hash("test")
+        self.assertTrue(cc.verify("test", h1))
+        self.assertFalse(cc.verify("wrong", h1))
+        self.assertFalse(cc.verify("test", None, category="admin"))
+        self.assertTrue(cc.verify_and_update("test", md5_crypt.hash("test"))[1])
+        self.assertEqual(cc.verify_and_update("wrong", h1), (False, None))
+        self.assertRaises(ValueError, cc.verify, "test", "bogus")
+        self.assertIs(cc.identify("bogus", category="admin"), None)
+        self.assertRaises(TypeError, cc.hash, None)
+        self.assertTrue(cc.needs_update(md5_crypt.hash("test")))
+        self.assertFalse(cc.needs_update(h1))
+        self.assertRaises(ValueError, cc.needs_update, "bogus", category="admin")
+
+        data = metrics.snapshot()
+        self.assertEqual(data["identify_misses"], {"": 1, "admin": 2})
+        series = dict(((entry["method"], entry["scheme"], entry["category"]), entry)
+                      for entry in data["series"])
+        self.assertEqual(sorted(series), [
+            ("dummy_verify", "sha256_crypt", "admin"),
+            ("hash", "sha256_crypt", None),
+            ("needs_update", "md5_crypt", None),
+            ("needs_update", "sha256_crypt", None),
+            ("verify", "sha256_crypt", None),
+            ("verify_and_update", "md5_crypt", None),
+            ("verify_and_update", "sha256_crypt", None),
+        ])
+        def counts(key):
+            entry = series[key]
+            return entry["calls"], entry["failures"], entry["errors"], entry["needs_update"]
+        # NOTE: hash() also includes rehash by verify_and_update(), and failed call
+        self.assertEqual(counts(("hash", "sha256_crypt", None)), (3, 0, 1, 0))
+        self.assertEqual(counts(("verify", "sha256_crypt", None)), (2, 1, 0, 0))
+        self.assertEqual(counts(("verify_and_update", "md5_crypt", None)), (1, 0, 0, 1))
+        self.assertEqual(counts(("verify_and_update", "sha256_crypt", None)), (1, 1, 0, 0))
+        self.assertEqual(counts(("dummy_verify", "sha256_crypt", "admin")), (1, 0, 0, 0))
+        self.assertEqual(counts(("needs_update", "md5_crypt", None)), (1, 0, 0, 1))
+        self.assertEqual(counts(("needs_update", "sha256_crypt", None)), (1, 0, 0, 0))
+        entry = series["verify", "sha256_crypt", None]
+        self.assertEqual(entry["backend"], cc.handler("sha256_crypt").get_backend())
+        buckets = entry["latency"]["buckets"]
+        self.assertEqual([bound for bound, _ in buckets], [.001, 10, "+Inf"])
+        self.assertEqual(buckets[-1][1], 2)
+        self.assertGreater(entry["latency"]["sum"], 0)
+
+        # prometheus export
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE passlib_calls_total counter\n", text)
+        self.assertIn('passlib_calls_total{backend="%s",category="",method="verify",'
+                      'scheme="sha256_crypt"} 2\n' % entry["backend"], text)
+        self.assertIn('passlib_duration_seconds_bucket{backend="%s",category="",le="+Inf",'
+                      'method="verify",scheme="sha256_crypt"} 2\n' % entry["backend"], text)
+        self.assertIn('passlib_identify_misses_total{category="admin"} 2\n', text)
+        self.assertTrue(metrics.to_prometheus(prefix="app").startswith("# HELP app_calls_total"))
+
+        # metrics & admission control should share one hook, rather than shadowing methods
+        from passlib.context import AdmissionControl
+        ac = AdmissionControl()
+        cc2 = cc.copy()
+        cc2._admission = ac
+        self.assertFalse(set(cc2.__dict__).intersection(["hash", "verify", "_verify",
+                                                         "verify_and_update", "dummy_verify"]))
+        metrics.reset()
+        self.assertTrue(cc2.verify("test", h1))
+        self.assertEqual(ac.admitted, 1)
+        self.assertEqual([entry["calls"] for entry in metrics.snapshot()["series"]], [1])
+
+        # hash should only be identified once per call
+        calls = []
+        orig_identify = cc._identify_record
+        def identify_record(hash, category=None, *args):
+            calls.append(hash)
+            return orig_identify(hash, category, *args)
+        self.patchAttr(cc._state, "identify_record", identify_record)
+        self.assertTrue(cc.verify("test", h1))
+        self.assertEqual(cc.verify_and_update("test", h1), (True, None))
+        self.assertEqual(calls, [h1, h1])
+
+        # reset
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), dict(series=[], identify_misses={}))
+
+        # bad params
+        self.assertRaises(TypeError, CryptContext, ["md5_crypt"], metrics=True)
+        self.assertRaises(ValueError, ContextMetrics, buckets=[])
+        self.assertRaises(ValueError, ContextMetrics, buckets=[0, 1])
+
+    #===================================================================
+    # warmup()
+    #===================================================================
+    def test_warmup(self):
+        """warmup() method"""
+        class NoBackendHash(uh.HasManyBackends, DelayHash):
+            name = "no_backend_hash"
+            _hash_prefix = u"$z$"
+            backends = ("missing",)
+
+            @classmethod
+            def _load_backend_missing(cls):
+                return False
+
+        ctx = CryptContext(["sha256_crypt", "md5_crypt", NoBackendHash],
+                           sha256_crypt__default_rounds=1000,
+                           admin__context__default="md5_crypt")
+
+        # foreground
+        report = ctx.warmup(background=False)
+        self.assertEqual(sorted(report), ["backends", "dummy_verify", "elapsed",
+                                          "errors", "process_pool", "records"])
+        self.assertEqual(sorted(report["backends"]), ["md5_crypt", "no_backend_hash",
+                                                      "sha256_crypt"])
+        self.assertEqual(list(report["errors"]), ["no_backend_hash"])
+        self.assertGreaterEqual(report["elapsed"], report["dummy_verify"])
+        self.assertEqual(sorted(ctx._dummy_hashes, key=str), [None, "admin"])
+        self.assertEqual(ctx.identify(ctx._dummy_hashes["admin"]), "md5_crypt")
+        self.assertIn("admin", ctx._config._identify_indexes)
+
+        # background
+        ctx.update(sha256_crypt__default_rounds=2000)
+        future = ctx.warmup(categories=["admin"])
+        report = future.result(timeout=30)
+        self.assertIn("admin", ctx._dummy_hashes)
+        self.assertEqual(report["process_pool"], 0)
+
+        # process pool
+        ctx = CryptContext(["sha256_crypt", "md5_crypt"], executor="process", max_concurrency=2)
+        self.addCleanup(ctx._reset_process_pool)
+        ctx.warmup(background=False)
+        self.assertIsNot(ctx._process_pool, None)
+
+    #===================================================================
+    # verify cache
+    #===================================================================
+    def test_verify_cache(self):
+        """verify_cache support"""
+        from passlib.context import VerifyCache
+
+        calls = []
+
+        class CountingHash(DelayHash):
+            def _calc_checksum(self, secret):
+                calls.append(secret)
+                return super()._calc_checksum(secret)
+
+        class OtherHash(CountingHash):
+            name = "other_hash"
+            _hash_prefix = u"$y$"
+
+        cache = VerifyCache(max_size=2, ttl=60)
+        cc = CryptContext([OtherHash, CountingHash], verify_cache=cache,
+                          deprecated=["delay_hash"])
+        self.assertIs(cc.verify_cache, cache)
+        h1 = OtherHash.hash("test")
+        h2 = OtherHash.hash("test2")
+        del calls[:]
+
+        # successful verify should be cached
+        self.assertTrue(cc.verify("test", h1))
+        self.assertTrue(cc.verify("test", h1))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # failures shouldn't be cached
+        self.assertFalse(cc.verify("wrong", h1))
+        self.assertFalse(cc.verify("wrong", h1))
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(cache), 1)
+
+        # plaintext shouldn't be stored
+        for key, (_, tag) in cache._entries.items():
+            self.assertNotIn(b"test", key + tag)
+
+        # LRU eviction
+        h3 = OtherHash.hash("test3")
+        self.assertTrue(cc.verify("test2", h2))
+        self.assertTrue(cc.verify("test", h1))
+        self.assertTrue(cc.verify("test3", h3))
+        self.assertEqual(len(cache), 2)
+        del calls[:]
+        self.assertTrue(cc.verify("test", h1))
+        self.assertTrue(cc.verify("test2", h2))
+        self.assertEqual(calls, ["test2"])
+
+        # explicit invalidation
+        cache.invalidate(h1)
+        del calls[:]
+        self.assertTrue(cc.verify("test", h1))
+        self.assertEqual(calls, ["test"])
+
+        # verify_and_update() should invalidate replaced hash
+        h_old = CountingHash.hash("test")
+        self.assertTrue(cc.verify("test", h_old))
+        ok, h_new = cc.verify_and_update("test", h_old)
+        self.assertTrue(ok)
+        self.assertEqual(cc.identify(h_new), "other_hash")
+        del calls[:]
+        self.assertTrue(cc.verify("test", h_old))
+        self.assertEqual(calls, ["test"])
+
+        # changing config should clear cache
+        cc.update(deprecated=[])
+        self.assertEqual(len(cache), 0)
+
+        # ... and results from calls still running under old config shouldn't be used
+        state = cc._state
+        cc.update(deprecated=["delay_hash"])
+        self.assertIsNot(cc._state, state)
+        self.assertTrue(cc._verify("test", h1, None, None, {}, state=state))
+        self.assertEqual(len(cache), 1)
+        del calls[:]
+        self.assertTrue(cc.verify("test", h1))
+        self.assertEqual(calls, ["test"])
+        self.assertTrue(cc.verify("test", h1))
+        self.assertEqual(calls, ["test"])
+
+        # ttl should be honored
+        cc = CryptContext([OtherHash], verify_cache=VerifyCache(ttl=0.05))
+        self.assertTrue(cc.verify("test", h1))
+        del calls[:]
+        self.assertTrue(cc.verify("test", h1))
+        self.assertEqual(calls, [])
+        quicksleep(0.1)
+        self.assertTrue(cc.verify("test", h1))
+        self.assertEqual(calls, ["test"])
+
+        # copy() should get separate cache with same settings
+        other = cc.copy()
+        self.assertIsNot(other.verify_cache, cc.verify_cache)
+        self.assertEqual(other.verify_cache.ttl, 0.05)
+
+        # disabled by default
+        self.assertIs(CryptContext([OtherHash]).verify_cache, None)
+        self.assertIsInstance(CryptContext([OtherHash], verify_cache=True).verify_cache,
+                              VerifyCache)
+
+        # bad values
+        self.assertRaises(TypeError, CryptContext, [OtherHash], verify_cache=10)
+        self.assertRaises(ValueError, VerifyCache, max_size=0)
+        self.assertRaises(ValueError, VerifyCache, ttl=0)
+
+    #===================================================================
+    # admission control
+    #===================================================================
+    def test_admission_control(self):
+        """admission control support"""
+        import threading
+        from passlib.context import AdmissionControl
+        from passlib.exc import OverloadError
+
+        gate = threading.Event()
+        gate.set()
+        calls = []
+
+        class GateHash(DelayHash):
+            def _calc_checksum(self, secret):
+                calls.append(secret)
+                gate.wait()
+                return super()._calc_checksum(secret)
+
+        def wait_for(func):
+            end = tick() + 5
+            while not func():
+                if tick() > end:
+                    self.fail("timed out waiting for condition")
+                time.sleep(.001)
+
+        ac = AdmissionControl(max_inflight=1, max_queue=2)
+        cc = CryptContext([GateHash], admission=ac, deprecated=["auto"])
+        self.assertIs(cc.admission, ac)
+        h = GateHash.hash("t1")
+        del calls[:]
+
+        self.assertEqual(cc.verify_and_update("t1", h)[0], True)
+        self.assertEqual(ac.admitted, 1)
+        self.assertEqual(ac.inflight, 0)
+
+        # re-hash by verify_and_update() should be admitted separately (and not deadlock)
+        ac2 = AdmissionControl(max_inflight=1)
+        cc2 = CryptContext([GateHash, "md5_crypt"], default="md5_crypt",
+                           deprecated=[GateHash.name], admission=ac2)
+        self.assertTrue(cc2.verify_and_update("t1", h)[1])
+        self.assertEqual(ac2.admitted, 2)
+
+        # needs_update() shouldn't need admitting
+        self.assertTrue(cc2.needs_update(h))
+        self.assertEqual(ac2.admitted, 2)
+
+        # hold the only slot
+        gate.clear()
+        del calls[:]
+        threads = []
+        def run(secret, priority=None):
+            def target():
+                with ac.options(priority=priority):
+                    cc.verify(secret, h)
+            thread = threading.Thread(target=target)
+            thread.start()
+            threads.append(thread)
+        run("t1")
+        wait_for(lambda: ac.inflight == 1 and calls)
+
+        # timed out waiting for slot
+        with ac.options(timeout=.01):
+            self.assertRaises(OverloadError, cc.verify, "t1", h)
+        self.assertEqual(ac.timed_out, 1)
+        self.assertEqual(ac.queue_depth, 0)
+
+        # queue up background call, then interactive one
+        run("t2", "background")
+        wait_for(lambda: ac.queue_depth == 1)
+        run("t3")
+        wait_for(lambda: ac.queue_depth == 2)
+
+        # queue full -- should fail immediately
+        try:
+            cc.hash("t4")
+        except OverloadError as err:
+            self.assertEqual(err.reason, "queue_full")
+        else:
+            self.fail("OverloadError not raised")
+        self.assertEqual(ac.rejected, 1)
+
+        # release -- interactive call should run before background one
+        gate.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, ["t1", "t3", "t2"])
+        self.assertEqual((ac.inflight, ac.queue_depth, ac.admitted), (0, 0, 4))
+
+        # copy shares admission control
+        self.assertIs(cc.copy().admission, ac)
+
+        # bad values
+        self.assertRaises(ValueError, AdmissionControl, max_inflight=0)
+        self.assertRaises(ValueError, AdmissionControl, max_queue=-1)
+        self.assertRaises(ValueError, AdmissionControl, timeout=-1)
+        self.assertRaises(TypeError, AdmissionControl, max_inflight="1")
+        self.assertRaises(TypeError, CryptContext, admission=True)
+        self.assertRaises(ValueError, ac.options(priority="bogus").__enter__)
+
+    #===================================================================
+    # asyncio interface
+    #===================================================================
+    def run_async(self, coro):
+        """helper to run coroutine in a fresh event loop"""
+        import asyncio
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_async_methods(self):
+        """ahash() / averify() / averify_and_update() / adummy_verify()"""
+        cc = CryptContext(["sha256_crypt", "md5_crypt"], deprecated=["md5_crypt"],
+                          sha256_crypt__default_rounds=1000)
+        h_old = cc.handler("md5_crypt").hash("test")
+
+        async def main():
+            h = await cc.ahash("test")
+            self.assertEqual(cc.identify(h), "sha256_crypt")
+            self.assertTrue(await cc.averify("test", h))
+            self.assertFalse(await cc.averify("wrong", h))
+            self.assertFalse(await cc.averify("test", None))
+            self.assertEqual(await cc.averify_and_update("test", h), (True, None))
+            self.assertEqual(await cc.averify_and_update("wrong", h_old), (False, None))
+            self.assertEqual(await cc.averify_and_update("test", None), (False, None))
+            ok, new_hash = await cc.averify_and_update("test", h_old)
+            self.assertTrue(ok)
+            self.assertTrue(cc.verify("test", new_hash))
+            self.assertFalse(cc.needs_update(new_hash))
+            self.assertFalse(await cc.adummy_verify())
+            try:
+                await cc.averify("test", "$9$abc")
+            except ValueError:
+                pass
+            else:
+                self.fail("expected ValueError for unknown hash")
+        self.run_async(main())
+
+    def test_async_guarded(self):
+        """async methods go through verify cache, metrics & admission control"""
+        import asyncio
+        from passlib.context import AdmissionControl, ContextMetrics, VerifyCache
+
+        calls = []
+
+        class CountingHash(DelayHash):
+            def _calc_checksum(self, secret):
+                calls.append(secret)
+                return super()._calc_checksum(secret)
+
+        metrics = ContextMetrics()
+        ac = AdmissionControl()
+        cache = VerifyCache()
+        cc = CryptContext([CountingHash], metrics=metrics, admission=ac, verify_cache=cache)
+        h = CountingHash.hash("test")
+        del calls[:]
+
+        async def main():
+            self.assertTrue(await cc.averify("test", h))
+            self.assertTrue(await cc.averify("test", h))
+            self.assertEqual(await cc.averify_and_update("test", h), (True, None))
+            await cc.ahash("test")
+            self.assertFalse(await cc.adummy_verify())
+        self.run_async(main())
+
+        # second averify() & averify_and_update() should have been served from cache
+        # (adummy_verify() accounts for two calls, since the dummy hash is generated first)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual(ac.admitted, 3)
+        series = dict((entry["method"], entry["calls"])
+                      for entry in metrics.snapshot()["series"])
+        self.assertEqual(series, dict(verify=1, hash=1, dummy_verify=1))
+
+        # should fall back to get_event_loop() if get_running_loop() isn't available (py < 3.7)
+        orig = asyncio.get_running_loop
+        del asyncio.get_running_loop
+        try:
+            self.assertTrue(self.run_async(cc.averify("test", h)))
+        finally:
+            asyncio.get_running_loop = orig
+
+    def test_async_max_concurrency(self):
+        """async methods honor executor & max_concurrency"""
+        from concurrent.futures import ThreadPoolExecutor
+        import asyncio
+        import threading
+
+        state = dict(active=0, peak=0)
+        lock = threading.Lock()
+
+        class CountingHash(DelayHash):
+            delay = 0.02
+
+            def _calc_checksum(self, secret):
+                with lock:
+                    state['active'] += 1
+                    state['peak'] = max(state['peak'], state['active'])
+                try:
+                    return super()._calc_checksum(secret)
+                finally:
+                    with lock:
+                        state['active'] -= 1
+
+        executor = ThreadPoolExecutor(4)
+        self.addCleanup(executor.shutdown)
+        cc = CryptContext([CountingHash], executor=executor, max_concurrency=2)
+
+        # settings should be preserved by copy()
+        other = cc.copy()
+        self.assertIs(other._executor, executor)
+        self.assertEqual(other._max_concurrency, 2)
+
+        async def main():
+            return await asyncio.gather(*[cc.ahash("test") for _ in range(6)])
+        result = self.run_async(main())
+        self.assertEqual(len(result), 6)
+        self.assertEqual(state['peak'], 2)
+
+        # bad values
+        self.assertRaises(ValueError, CryptContext, ["md5_crypt"], max_concurrency=0)
+        self.assertRaises(TypeError, CryptContext, ["md5_crypt"], max_concurrency="2")
+
+    def test_process_executor(self):
+        """executor='process' support"""
+        cc = CryptContext(["sha256_crypt", "md5_crypt"],
+                          sha256_crypt__default_rounds=1000,
+                          executor="process", max_concurrency=2)
+        self.addCleanup(cc._reset_process_pool)
+        h1 = cc.hash("test")
+        h2 = cc.handler("md5_crypt").hash("test")
+
+        # verify_many() should use process pool
+        pairs = [("test", h1), ("wrong", h1), ("test", h2), ("test", None)]
+        self.assertEqual(list(cc.verify_many(pairs * 3)), [True, False, True, False] * 3)
+        self.assertIsNot(cc._process_pool, None)
+
+        # async methods should use process pool
+        async def main():
+            self.assertTrue(await cc.averify("test", h2))
+            self.assertFalse(await cc.adummy_verify())
+            return await cc.ahash("test")
+        self.assertEqual(cc.identify(self.run_async(main())), "sha256_crypt")
+
+        # changing config should restart pool w/ new config
+        cc.update(default="md5_crypt")
+        self.assertIs(cc._process_pool, None)
+        self.assertEqual(cc.identify(self.run_async(cc.ahash("test"))), "md5_crypt")
+
+        # handlers need to be registered
+        cc = CryptContext([DelayHash], executor="process")
+        self.assertRaises(RuntimeError, list, cc.verify_many([("test", DelayHash.hash("test"))]))
+
+        # bad executor values
+        self.assertRaises(ValueError, CryptContext, ["md5_crypt"], executor="fork")
+
     #===================================================================
     # feature tests
     #===================================================================
@@ -691,6 +691,14 @@ class _ldap_md5_crypt_test(HandlerCase):
 ldap_md5_crypt_os_crypt_test =_ldap_md5_crypt_test.create_backend_case("os_crypt")
 ldap_md5_crypt_builtin_test =_ldap_md5_crypt_test.create_backend_case("builtin")
 
+class _ldap_md5_crypt_compiled_test(_ldap_md5_crypt_test):
+    # NOTE: checks class generated by PrefixWrapper.compile() acts the same as the wrapper
+    handler = hash.ldap_md5_crypt.compile()
+
+# create test cases for specific backends
+ldap_md5_crypt_compiled_os_crypt_test = _ldap_md5_crypt_compiled_test.create_backend_case("os_crypt")
+ldap_md5_crypt_compiled_builtin_test = _ldap_md5_crypt_compiled_test.create_backend_case("builtin")
+
 class _ldap_sha1_crypt_test(HandlerCase):
     # NOTE: this isn't for testing the hash (see ldap_md5_crypt note)
     # but as a self-test of the os_crypt patching code in HandlerCase.
@@ -1198,6 +1206,9 @@ class bsd_nthash_test(HandlerCase):
             '$3$$7f8fe03093cc84b267b109625f6bbfxb',
     ]
 
+class bsd_nthash_compiled_test(bsd_nthash_test):
+    handler = hash.bsd_nthash.compile()
+
 #=============================================================================
 # oracle 10 & 11
 #=============================================================================
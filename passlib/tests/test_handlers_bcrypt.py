@@ -360,6 +360,34 @@ class _bcrypt_test(HandlerCase):
         self.assertTrue(bcrypt.needs_update(BAD1))
         self.assertFalse(bcrypt.needs_update(GOOD1))
 
+    def test_probe_cache(self):
+        """backend workaround detection uses probe cache"""
+        from passlib.utils import probe_cache
+        bcrypt = self.handler
+        backend = bcrypt.get_backend()
+        mixin_cls = bcrypt._backend_mixin_map[backend]
+        flags = dict((attr, getattr(mixin_cls, attr)) for attr in mixin_cls._workaround_attrs)
+
+        # point global cache at temp file
+        orig_path = probe_cache.path
+        self.addCleanup(probe_cache.set_path, orig_path)
+        probe_cache.set_path(self.mktemp())
+
+        # first load should run detection, and store results
+        self.patchAttr(mixin_cls, "_workrounds_initialized", False)
+        self.assertTrue(mixin_cls._finalize_backend_mixin(backend, False))
+        self.assertTrue(mixin_cls._workrounds_initialized)
+
+        # later loads should reuse them, w/o running detection
+        def detect(backend):
+            raise AssertionError("shouldn't be called")
+        self.patchAttr(mixin_cls, "_detect_workarounds", classmethod(detect))
+        mixin_cls._workrounds_initialized = False
+        probe_cache.set_path(probe_cache.path)  # discard in-memory results
+        self.assertTrue(mixin_cls._finalize_backend_mixin(backend, False))
+        for attr, value in flags.items():
+            self.assertEqual(getattr(mixin_cls, attr), value, attr)
+
     #===================================================================
     # eoc
     #===================================================================
@@ -0,0 +1,80 @@
+"""passlib.tests -- tests for passlib.tune"""
+#=============================================================================
+# imports
+#=============================================================================
+# core
+from io import StringIO
+import logging; log = logging.getLogger(__name__)
+from unittest import mock
+# site
+# pkg
+from passlib.context import CryptContext
+from passlib.tests.utils import TestCase
+# local
+__all__ = [
+    "TuneTest",
+]
+
+#=============================================================================
+# tests
+#=============================================================================
+class TuneTest(TestCase):
+    """test passlib.tune"""
+    descriptionPrefix = "passlib.tune"
+
+    def test_tune_handler(self):
+        """tune_handler()"""
+        from passlib.tune import tune_handler
+        from passlib.hash import des_crypt, md5_crypt, scrypt, sha256_crypt
+
+        # linear rounds
+        result = tune_handler(sha256_crypt, target=.005)
+        self.assertEqual(list(result), ["default_rounds"])
+        self.assertGreaterEqual(result["default_rounds"], sha256_crypt.min_rounds)
+
+        # honors min / max limits of handler
+        handler = sha256_crypt.using(min_rounds=1000, max_rounds=2000)
+        self.assertEqual(tune_handler(handler, target=10), {"default_rounds": 2000})
+        self.assertEqual(tune_handler(handler, target=1e-6), {"default_rounds": 1000})
+
+        # log2 rounds + block size
+        result = tune_handler(scrypt.using(rounds=8), target=.005)
+        self.assertEqual(sorted(result), ["block_size", "default_rounds"])
+
+        # no tunable settings
+        self.assertEqual(tune_handler(des_crypt, target=.005), {})
+        self.assertEqual(tune_handler(md5_crypt, target=.005), {})
+
+        # sticks w/ last good value if measuring fails (e.g. exceeding memory limits)
+        handler = sha256_crypt.using(min_rounds=1000, max_rounds=10000, default_rounds=2000)
+        with mock.patch("passlib.tune._measure", side_effect=[.001, MemoryError("too big")]):
+            self.assertEqual(tune_handler(handler, target=.002), {"default_rounds": 4000})
+
+        # bad params
+        self.assertRaises(ValueError, tune_handler, sha256_crypt, target=0)
+        self.assertRaises(ValueError, tune_handler, sha256_crypt, concurrency=0)
+
+    def test_main(self):
+        """main()"""
+        from passlib.tune import main
+
+        path = self.mktemp()
+        with open(path, "w") as fh:
+            fh.write(CryptContext(["sha256_crypt", "des_crypt"],
+                                  sha256_crypt__max_rounds=2000).to_string())
+
+        # tune config file
+        with mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            self.assertEqual(main("-c", path, "-t", "1000", "-j", "2"), 0)
+        ctx = CryptContext.from_string(stdout.getvalue())
+        self.assertEqual(ctx.schemes(), ("sha256_crypt", "des_crypt"))
+        self.assertEqual(ctx.to_dict()["sha256_crypt__default_rounds"], 2000)
+
+        # write to file
+        output = self.mktemp()
+        self.assertEqual(main("-c", path, "-t", "1000", "-o", output), 0)
+        self.assertEqual(CryptContext.from_path(output).to_dict(), ctx.to_dict())
+
+#=============================================================================
+# eof
+#=============================================================================
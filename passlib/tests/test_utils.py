@@ -4,6 +4,8 @@
 #=============================================================================
 # core
 from functools import partial
+import os
+from unittest import skipUnless
 import warnings
 # site
 # pkg
@@ -136,6 +138,89 @@ class MiscTest(TestCase):
         # NOTE: decoding this due to py3 bytes
         self.assertEqual(sorted(set(x.decode("ascii"))), [u'a',u'b',u'c'])
 
+    def test_entropy_pool(self):
+        """EntropyPool"""
+        from passlib.utils import EntropyPool, getrandstr, getrandbytes
+
+        # make source deterministic, and count calls
+        source_rng = self.getRandom()
+        calls = []
+        def source(count):
+            calls.append(count)
+            return bytes(source_rng.getrandbits(8) for _ in range(count))
+        pool = EntropyPool(chunk_size=256, source=source)
+
+        # small requests should be served from buffer
+        a = getrandbytes(pool, 10)
+        b = getrandbytes(pool, 10)
+        self.assertIsInstance(a, bytes)
+        self.assertEqual(len(a), 10)
+        self.assertNotEqual(a, b)
+        self.assertEqual(calls, [256])
+
+        # buffer should be refilled once exhausted
+        self.assertEqual(len(getrandbytes(pool, 250)), 250)
+        self.assertEqual(calls, [256, 256])
+
+        # large requests should go straight to source
+        self.assertEqual(len(getrandbytes(pool, 1000)), 1000)
+        self.assertEqual(calls, [256, 256, 1000])
+
+        # pid change (e.g. after fork) should discard buffer
+        del calls[:]
+        pool._pid = -1
+        getrandbytes(pool, 1)
+        self.assertEqual(calls, [256])
+
+        # getrandstr() w/ charset evenly dividing 256
+        charset = u"./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+        x = getrandstr(pool, charset, 200)
+        self.assertIsInstance(x, str)
+        self.assertEqual(len(x), 200)
+        self.assertTrue(set(x) <= set(charset))
+
+        # getrandstr() w/ other charsets (uses rejection sampling)
+        x = getrandstr(pool, u"abc", 100)
+        self.assertIsInstance(x, str)
+        self.assertEqual(sorted(set(x)), [u"a", u"b", u"c"])
+        x = getrandstr(pool, b"abc", 100)
+        self.assertIsInstance(x, bytes)
+        self.assertEqual(sorted(set(x.decode("ascii"))), [u"a", u"b", u"c"])
+
+        # getrandstr() w/ charset not mappable from bytes (uses generic code)
+        x = getrandstr(pool, u"\u2603\u2604", 32)
+        self.assertEqual(sorted(set(x)), [u"\u2603", u"\u2604"])
+
+        # random.Random api
+        for k in [1, 7, 8, 9, 64, 100]:
+            self.assertTrue(0 <= pool.getrandbits(k) < 1 << k)
+        self.assertEqual(pool.getrandbits(0), 0)
+        self.assertRaises(ValueError, pool.getrandbits, -1)
+        self.assertTrue(0 <= pool.random() < 1)
+        self.assertTrue(5 <= pool.randint(5, 10) <= 10)
+
+    @skipUnless(hasattr(os, "fork"), "requires os.fork()")
+    def test_entropy_pool_fork(self):
+        """EntropyPool after fork()"""
+        from passlib.utils import EntropyPool
+        pool = EntropyPool()
+        pool.randbytes(1)
+        rfd, wfd = os.pipe()
+        pid = os.fork()
+        if not pid:
+            try:
+                os.write(wfd, pool.randbytes(16))
+            finally:
+                os._exit(0)
+        os.close(wfd)
+        try:
+            child = os.read(rfd, 16)
+        finally:
+            os.close(rfd)
+            os.waitpid(pid, 0)
+        self.assertEqual(len(child), 16)
+        self.assertNotEqual(child, pool.randbytes(16))
+
     def test_generate_password(self):
         """generate_password()"""
         from passlib.utils import generate_password
@@ -169,6 +254,11 @@ class MiscTest(TestCase):
         from passlib.utils import has_crypt, safe_crypt, test_crypt
         from passlib.registry import get_supported_os_crypt_schemes, get_crypt_handler
 
+        # disable probe cache, so test_crypt() reflects the patched crypt() below
+        from passlib.utils import probe_cache
+        self.addCleanup(probe_cache.set_path, probe_cache.path)
+        probe_cache.set_path(None)
+
         # test everything is disabled
         supported = get_supported_os_crypt_schemes()
         if not has_crypt:
@@ -250,6 +340,98 @@ class MiscTest(TestCase):
         finally:
             mod._crypt = orig
 
+    def test_probe_cache(self):
+        """test ProbeCache"""
+        import json
+        from passlib.utils import ProbeCache
+
+        calls = []
+        def probe():
+            calls.append(1)
+            return True
+
+        # disabled cache should always run probe
+        cache = ProbeCache()
+        self.assertIs(cache.path, None)
+        self.assertTrue(cache.get("test", probe))
+        self.assertTrue(cache.get("test", probe))
+        self.assertEqual(len(calls), 2)
+        cache.clear()
+
+        # enabled cache should only run probe once (empty file is ignored)
+        path = self.mktemp()
+        cache = ProbeCache(path)
+        del calls[:]
+        self.assertTrue(cache.get("test", probe))
+        self.assertTrue(cache.get("test", probe))
+        self.assertEqual(len(calls), 1)
+
+        # result should be persisted for other instances
+        self.assertTrue(ProbeCache(path).get("test", probe))
+        self.assertEqual(len(calls), 1)
+
+        # errors should be propagated, and not cached
+        def bad_probe():
+            raise RuntimeError("broken backend")
+        self.assertRaises(RuntimeError, cache.get, "bad", bad_probe)
+        self.assertRaises(RuntimeError, ProbeCache(path).get, "bad", bad_probe)
+
+        # cache from a different environment should be discarded
+        with open(path) as fh:
+            data = json.load(fh)
+        self.assertEqual(data['results'], dict(test=True))
+        data['key'][0] = "0.0"
+        with open(path, "w") as fh:
+            json.dump(data, fh)
+        self.assertTrue(ProbeCache(path).get("test", probe))
+        self.assertEqual(len(calls), 2)
+
+        # cache whose sanity check doesn't match should be discarded
+        with open(path) as fh:
+            data = json.load(fh)
+        data['check'] = "xxx"
+        with open(path, "w") as fh:
+            json.dump(data, fh)
+        self.assertTrue(ProbeCache(path).get("test", probe))
+        self.assertEqual(len(calls), 3)
+
+        # clear() should remove file & force re-probe
+        cache = ProbeCache(path)
+        cache.clear()
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(cache.get("test", probe))
+        self.assertEqual(len(calls), 4)
+
+        # test env var parsing
+        self.patchAttr(os, "environ", dict(os.environ))
+        os.environ.pop("PASSLIB_PROBE_CACHE", None)
+        self.assertIs(ProbeCache.from_environ().path, None)
+        os.environ["PASSLIB_PROBE_CACHE"] = "0"
+        self.assertIs(ProbeCache.from_environ().path, None)
+        os.environ["PASSLIB_PROBE_CACHE"] = "default"
+        self.assertEqual(ProbeCache.from_environ().path, ProbeCache.default_path())
+        os.environ["PASSLIB_PROBE_CACHE"] = path
+        self.assertEqual(ProbeCache.from_environ().path, path)
+
+    def test_probe_cache_test_crypt(self):
+        """test test_crypt() uses probe cache"""
+        from passlib.utils import has_crypt, test_crypt, probe_cache
+        import passlib.utils as mod
+        if not has_crypt:
+            raise self.skipTest("crypt.crypt() not available")
+        orig_path = probe_cache.path
+        self.addCleanup(probe_cache.set_path, orig_path)
+        probe_cache.set_path(self.mktemp())
+
+        # should reuse stored result, even though crypt() result changed
+        self.assertTrue(test_crypt("test", "aaqPiZY5xR5l."))
+        self.patchAttr(mod, "_crypt", lambda secret, hash: None)
+        self.assertTrue(test_crypt("test", "aaqPiZY5xR5l."))
+
+        # clearing cache should force new probe
+        probe_cache.clear()
+        self.assertFalse(test_crypt("test", "aaqPiZY5xR5l."))
+
     def test_consteq(self):
         """test consteq()"""
         # NOTE: this test is kind of over the top, but that's only because
@@ -429,6 +429,100 @@ class SkeletonTest(TestCase):
         self.assertRaises(ValueError, d1.set_backend, 'c')
         self.assertRaises(ValueError, d1.has_backend, 'c')
 
+    def test_42_fastest_backend(self):
+        """test HasManyBackends.set_backend('fastest')"""
+        import time
+
+        class d1(uh.HasManyBackends, uh.StaticHandler):
+            name = 'test_42_fastest_backend'
+            checksum_chars = u'abc'
+            checksum_size = 1
+            backends = ("a", "b", "c")
+
+            _enable_c = False
+
+            @classmethod
+            def _load_backend_a(cls):
+                cls._set_calc_checksum_backend(cls._calc_checksum_a)
+                return True
+
+            @classmethod
+            def _load_backend_b(cls):
+                cls._set_calc_checksum_backend(cls._calc_checksum_b)
+                return True
+
+            @classmethod
+            def _load_backend_c(cls):
+                if cls._enable_c:
+                    cls._set_calc_checksum_backend(cls._calc_checksum_c)
+                return cls._enable_c
+
+            def _calc_checksum_a(self, secret):
+                time.sleep(0.002)
+                return u'a'
+
+            def _calc_checksum_b(self, secret):
+                seen.append(d1.get_backend())
+                return u'b'
+
+            def _calc_checksum_c(self, secret):
+                return u'c'
+
+        # measurements shouldn't change active backend, even while running
+        seen = []
+        d1.set_backend("a")
+        timings = d1.get_backend_timings()
+        self.assertEqual(sorted(timings), ["a", "b", "c"])
+        self.assertGreater(timings["a"], timings["b"])
+        self.assertIs(timings["c"], None)
+        self.assertEqual(d1.get_backend(), "a")
+        self.assertTrue(seen)
+        self.assertEqual(set(seen), set(["a"]))
+
+        # should pick fastest backend
+        self.assertTrue(d1.has_backend("fastest"))
+        self.assertEqual(d1.get_backend(), "a")
+        self.assertEqual(d1.set_backend("fastest"), "b")
+        self.assertEqual(d1.get_backend(), "b")
+
+        # results should be cached until refreshed
+        d1._enable_c = True
+        self.assertIs(d1.get_backend_timings()["c"], None)
+        self.assertIsNot(d1.get_backend_timings(refresh=True)["c"], None)
+        self.assertEqual(d1.get_backend(), "b")
+
+    def test_43_backend_timings_rounds(self):
+        """test get_backend_timings() scales measurements up to default rounds"""
+        from passlib.hash import bcrypt, sha256_crypt
+
+        calls = []
+        def fake_measure(handler, concurrency, samples):
+            calls.append(handler.default_rounds)
+            if handler.rounds_cost == "log2":
+                return 2 ** handler.default_rounds * 1e-4
+            return handler.default_rounds * 1e-6
+        self.addCleanup(uh._backend_timings.clear)
+        self.patchAttr(uh, "_measure", fake_measure)
+
+        # linear rounds
+        timings = sha256_crypt.get_backend_timings(refresh=True)
+        self.assertTrue(calls)
+        self.assertLess(max(calls), sha256_crypt.default_rounds)
+        for secs in timings.values():
+            if secs is not None:
+                self.assertAlmostEqual(secs, sha256_crypt.default_rounds * 1e-6)
+
+        # log2 rounds -- backend mixin shouldn't be swapped out on the real class
+        del calls[:]
+        bases = bcrypt.__bases__
+        timings = bcrypt.get_backend_timings(refresh=True)
+        self.assertIs(bcrypt.__bases__, bases)
+        if any(secs is not None for secs in timings.values()):
+            self.assertLess(max(calls), bcrypt.default_rounds)
+        for secs in timings.values():
+            if secs is not None:
+                self.assertAlmostEqual(secs, 2 ** bcrypt.default_rounds * 1e-4)
+
     def test_50_norm_ident(self):
         """test GenericHandler + HasManyIdents"""
         # setup helpers
@@ -471,6 +565,169 @@ class SkeletonTest(TestCase):
         d1.default_ident = None
         self.assertRaises(AssertionError, norm_ident, use_defaults=True)
 
+    #===================================================================
+    # parse cache
+    #===================================================================
+    def test_60_parse_cache(self):
+        """test enable_parse_cache()"""
+        from passlib import hash
+
+        # NOTE: using() subclass, so global handler isn't affected
+        handler = hash.sha256_crypt.using(rounds=1000)
+        self.assertIs(handler.parse_cache, None)
+        h1 = handler.hash("test")
+        h2 = handler.hash("other")
+
+        cache = handler.enable_parse_cache(max_size=1)
+        self.assertIsInstance(cache, uh.ParseCache)
+        self.assertIs(handler.parse_cache, cache)
+        self.assertIs(hash.sha256_crypt.parse_cache, None)
+
+        # first parse is a miss, following ones hit
+        self.assertTrue(handler.verify("test", h1))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertFalse(handler.verify("wrong", h1))
+        self.assertFalse(handler.needs_update(h1))
+        self.assertEqual(handler.verify_and_needs_update("test", h1), (True, False))
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+        self.assertEqual(cache.hit_rate, 0.75)
+        self.assertEqual(handler.parsehash(h1), hash.sha256_crypt.parsehash(h1))
+
+        # lru eviction
+        self.assertTrue(handler.verify("other", h2))
+        self.assertEqual(len(cache), 1)
+        self.assertTrue(handler.verify("test", h1))
+        self.assertEqual(cache.misses, 3)
+
+        # errors aren't cached
+        self.assertRaises(ValueError, handler.verify, "test", "$5$rounds=01000$abc$def")
+        self.assertRaises(ValueError, handler.verify, "test", "$5$rounds=01000$abc$def")
+        self.assertEqual(cache.misses, 5)
+
+        # disable
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+        handler.disable_parse_cache()
+        self.assertIs(handler.parse_cache, None)
+        self.assertTrue(handler.verify("test", h1))
+
+        # handlers w/ context kwds aren't cached
+        self.assertIs(hash.postgres_md5.using().enable_parse_cache(), None)
+
+        # bad max_size
+        self.assertRaises(ValueError, uh.ParseCache, 0)
+        self.assertRaises(TypeError, uh.ParseCache, "1")
+
+    def test_62_compiled_verify(self):
+        """test _compile_verify() fast path"""
+        calls = []
+
+        class d1(uh.HasManyBackends, uh.GenericHandler):
+            name = 'd1'
+            setting_kwds = ()
+            _hash_prefix = u"_"
+            checksum_chars = u"ab"
+            backends = ("a", "b")
+
+            @classmethod
+            def from_string(cls, hash):
+                if hash not in (u"_a", u"_b"):
+                    raise ValueError("bad hash")
+                return cls(checksum=hash[1])
+
+            @classmethod
+            def _load_backend_a(cls):
+                cls._set_calc_checksum_backend(cls._calc_checksum_a)
+                return True
+
+            @classmethod
+            def _load_backend_b(cls):
+                cls._set_calc_checksum_backend(cls._calc_checksum_a)
+                return True
+
+            def _calc_checksum_a(self, secret):
+                return u"a"
+
+            @classmethod
+            def _compile_verify(cls):
+                backend = cls.get_backend()
+                calls.append(backend)
+                def verify(secret, hash):
+                    # only handles "_a", defers everything else
+                    return (backend == "a") if hash == u"_a" else None
+                return verify
+
+        # fast path used when it returns a result, regular path otherwise
+        self.assertTrue(d1.verify("x", u"_a"))
+        self.assertFalse(d1.verify("x", u"_b"))
+        self.assertRaises(ValueError, d1.verify, "x", u"_c")
+        self.assertEqual(calls, ["a"])
+
+        # recompiled when backend changes
+        d1.set_backend("b")
+        self.assertFalse(d1.verify("x", u"_a"))
+        self.assertEqual(calls, ["a", "b"])
+
+        # using() subclasses compile their own copy
+        handler = d1.using()
+        self.assertFalse(handler.verify("x", u"_a"))
+        self.assertEqual(calls, ["a", "b", "b"])
+
+        # not used when parse cache is enabled
+        handler.enable_parse_cache()
+        self.assertTrue(handler.verify("x", u"_a"))
+
+    def test_64_parse_many(self):
+        """test parse_mc2_many() / parse_mc3_many() & parse_many()"""
+        # parse_mc2_many()
+        salts, chks = uh.parse_mc2_many([u"$x$abc$def", b"$x$ghi", u"$x$jkl$"], u"$x$")
+        self.assertEqual(salts, [u"abc", u"ghi", u"jkl"])
+        self.assertEqual(chks, [u"def", None, None])
+        self.assertEqual(uh.render_mc2_many(u"$x$", salts, chks),
+                         [u"$x$abc$def", u"$x$ghi", u"$x$jkl"])
+        self.assertRaises(ValueError, uh.parse_mc2_many, [u"$x$abc", u"$y$abc"], u"$x$")
+        self.assertRaises(ValueError, uh.parse_mc2_many, [u"$x$a$b$c"], u"$x$")
+        self.assertRaises(TypeError, uh.parse_mc2_many, [None], u"$x$")
+
+        # parse_mc3_many()
+        hashes = [u"$x$5$abc$def", u"$x$10$ghi", u"$x$$jkl", u"$x$0$mno$"]
+        rounds, salts, chks = uh.parse_mc3_many(hashes, u"$x$", default_rounds=7)
+        self.assertEqual(rounds, [5, 10, 7, 0])
+        self.assertEqual(salts, [u"abc", u"ghi", u"jkl", u"mno"])
+        self.assertEqual(chks, [u"def", None, None, None])
+        for hash, r, s, c in zip(hashes, rounds, salts, chks):
+            self.assertEqual(uh.parse_mc3(hash, u"$x$", default_rounds=7), (r, s, c))
+        self.assertEqual(uh.render_mc3_many(u"$x$", rounds, salts, chks),
+                         [u"$x$5$abc$def", u"$x$10$ghi", u"$x$7$jkl", u"$x$0$mno"])
+        self.assertEqual(uh.render_mc3_many(u"$x$", [31, None], [u"a", u"b"], [None, u"c"],
+                                            rounds_base=16),
+                         [u"$x$1f$a", u"$x$$b$c"])
+        self.assertEqual(uh.parse_mc3_many([u"$x$1f$a"], u"$x$", rounds_base=16)[0], [31])
+        self.assertRaises(ValueError, uh.parse_mc3_many, [u"$x$05$abc"], u"$x$")
+        self.assertRaises(ValueError, uh.parse_mc3_many, [u"$x$$abc"], u"$x$")
+        self.assertRaises(ValueError, uh.parse_mc3_many, [u"$x$1$a$b$c"], u"$x$")
+        self.assertRaises(ValueError, uh.parse_mc3_many, [u"$y$1$a"], u"$x$")
+
+        # parse_many() should validate values, same as from_string()
+        from passlib.hash import md5_crypt, pbkdf2_sha256
+        hash = md5_crypt.hash("test")
+        self.assertRaises(ValueError, md5_crypt.parse_many, [hash, hash + "x"])
+        self.assertRaises(ValueError, md5_crypt.parse_many, [hash.replace("$", "$!", 2)])
+        self.assertRaises(ValueError, md5_crypt.render_many, dict(salt=[b"!"], checksum=[None]))
+
+        # numpy output
+        hashes = [pbkdf2_sha256.using(rounds=1000 + i).hash("test") for i in range(3)]
+        try:
+            import numpy
+        except ImportError:
+            self.assertRaises(ImportError, pbkdf2_sha256.parse_many, hashes, numpy=True)
+        else:
+            columns = pbkdf2_sha256.parse_many(hashes, numpy=True)
+            self.assertIsInstance(columns["rounds"], numpy.ndarray)
+            self.assertEqual(columns["rounds"].dtype, numpy.int64)
+            self.assertEqual(columns["rounds"].tolist(), [1000, 1001, 1002])
+            self.assertEqual(pbkdf2_sha256.render_many(columns), hashes)
+
     #===================================================================
     # experimental - the following methods are not finished or tested,
     # but way work correctly for some hashes
@@ -732,6 +989,72 @@ class PrefixWrapperTest(TestCase):
         h = uh.PrefixWrapper("h2", "md5_crypt", orig_prefix="$6$")
         self.assertRaises(ValueError, h.hash, 'test')
 
+    def test_20_compile(self):
+        """test compile()"""
+        from passlib.hash import md5_crypt
+        d1 = uh.PrefixWrapper("d1", "ldap_md5", "{XXX}", "{MD5}")
+        c1 = d1.compile()
+        self.assertIs(d1.compile(), c1)
+        self.assertTrue(issubclass(c1, ldap_md5))
+        self.assertEqual(c1.name, "d1")
+        dph = "{XXX}X03MO1qnZdYdgyfeuILPmQ=="
+        lph = "{MD5}X03MO1qnZdYdgyfeuILPmQ=="
+
+        # check methods match wrapper (see test_11_wrapped_methods)
+        self.assertEqual(c1.genconfig(), d1.genconfig())
+        self.assertRaises(TypeError, c1.genhash, "password", None)
+        self.assertEqual(c1.genhash("password", dph), dph)
+        self.assertEqual(c1.genhash("password", dph.encode("ascii")), dph)
+        self.assertRaises(ValueError, c1.genhash, "password", lph)
+        self.assertEqual(c1.hash("password"), dph)
+        self.assertTrue(c1.identify(dph))
+        self.assertTrue(c1.identify(dph.encode("ascii")))
+        self.assertFalse(c1.identify(lph))
+        self.assertRaises(ValueError, c1.verify, "password", lph)
+        self.assertTrue(c1.verify("password", dph))
+        self.assertFalse(c1.verify("wrong", dph))
+        self.assertEqual(c1.verify_and_needs_update("password", dph), (True, False))
+        self.assertRaises(ValueError, c1.needs_update, lph)
+
+        # check CryptContext can identify it
+        from passlib.context import CryptContext
+        ctx = CryptContext([uh.PrefixWrapper("xxx_md5", "ldap_md5", "{XXX}", "{MD5}").compile(),
+                            "ldap_md5"])
+        self.assertEqual(ctx.identify(dph), "xxx_md5")
+        self.assertEqual(ctx.identify(lph), "ldap_md5")
+
+        # check w/ orig_prefix & rounds
+        d2 = uh.PrefixWrapper("d2", "sha256_crypt", "{XXX}", "$5$")
+        c2 = d2.compile()
+        for handler, other in [(d2, c2), (c2, d2)]:
+            hash = handler.using(rounds=1000).hash("test")
+            self.assertTrue(hash.startswith("{XXX}rounds=1000$"))
+            self.assertTrue(other.identify(hash))
+            self.assertTrue(other.verify("test", hash))
+            self.assertFalse(other.verify("wrong", hash))
+            self.assertEqual(other.using(min_rounds=2000).needs_update(hash), True)
+            self.assertEqual(other.verify_and_needs_update("test", hash),
+                             (True, other.needs_update(hash)))
+        self.assertEqual(c2.parsehash("{XXX}rounds=1000$abc$" + "x" * 43)['rounds'], 1000)
+
+        # check orig_prefix sanity check (see test_14_bad_hash)
+        c3 = uh.PrefixWrapper("c3", "md5_crypt", orig_prefix="$6$").compile()
+        self.assertRaises(ValueError, c3.hash, 'test')
+
+        # check unsupported handlers
+        self.assertRaises(TypeError, uh.PrefixWrapper("c4", "plaintext", "{X}").compile)
+        self.assertRaises(TypeError, uh.PrefixWrapper("c5", "bcrypt", "{X}").compile)
+
+        # parse_many() / render_many() should handle prefix,
+        # both for handlers w/ their own _parse_many() (pbkdf2), and w/o (sha256_crypt)
+        for wrapper in [uh.PrefixWrapper("c6", "pbkdf2_sha256", "{X}", "$pbkdf2-sha256$"), d2]:
+            compiled = wrapper.compile()
+            hashes = [compiled.using(rounds=1000).hash("test") for _ in range(3)]
+            columns = compiled.parse_many(hashes)
+            self.assertEqual(list(columns["rounds"]), [1000] * 3)
+            self.assertEqual(compiled.render_many(columns), hashes)
+            self.assertRaises(ValueError, compiled.parse_many, hashes + [hashes[0][1:]])
+
 #=============================================================================
 # sample algorithms - these serve as known quantities
 # to test the unittests themselves, as well as other
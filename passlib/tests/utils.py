@@ -3,6 +3,7 @@
 # imports
 #=============================================================================
 # core
+from array import array
 from binascii import unhexlify
 import contextlib
 from functools import wraps, partial
@@ -27,7 +28,7 @@ from passlib.exc import MissingBackendError
 import passlib.registry as registry
 from passlib.utils import has_rounds_info, has_salt_info, rounds_cost_values, \
                           rng as sys_rng, getrandstr, is_ascii_safe, to_native_str, \
-                          repeat_string, tick, batch
+                          repeat_string, tick, batch, consteq
 from passlib.utils.decor import classproperty
 import passlib.utils.handlers as uh
 # local
@@ -2378,6 +2379,14 @@ class HandlerCase(TestCase):
                 self.check_verify(secret, hash, "verify() of known hash failed: "
                                   "secret=%r, hash=%r" % (secret, hash))
 
+                # combined verify_and_needs_update() should agree w/ separate calls
+                if hasattr(self.handler, "verify_and_needs_update"):
+                    kwds = {}
+                    tmp = self.populate_context(secret, kwds)
+                    result = self.handler.verify_and_needs_update(tmp, hash, **kwds)
+                    self.assertEqual(result, (self.do_verify(secret, hash),
+                                              self.handler.needs_update(hash, secret=tmp)))
+
                 # genhash() should reproduce same hash
                 result = self.do_genhash(secret, hash)
                 self.assertIsInstance(result, str,
@@ -2579,6 +2588,43 @@ class HandlerCase(TestCase):
         self.do_identify('\xe2\x82\xac\xc2\xa5$') # utf-8
         self.do_identify('abc\x91\x00') # non-utf8
 
+    def test_76b_compiled_verify(self):
+        """test compiled verify() fast path agrees with regular path"""
+        handler = self.handler
+        if not hasattr(handler, "_get_compiled_verify") or handler.context_kwds:
+            raise self.skipTest("handler doesn't support compiled verify()")
+        func = handler._get_compiled_verify()
+        if func is None:
+            raise self.skipTest("handler has no compiled verify()")
+
+        def regular_verify(secret, hash):
+            self = handler.from_string(hash)
+            return consteq(self._calc_checksum(secret), self.checksum)
+
+        # fast path should agree w/ regular path, or defer to it (by returning None)
+        used = 0
+        for secret, hash in self.iter_known_hashes():
+            other = secret + (b"x" if isinstance(secret, bytes) else u"x")
+            for candidate in (secret, other):
+                try:
+                    expected = regular_verify(candidate, hash)
+                except (ValueError, MissingBackendError) as err:
+                    try:
+                        result = func(candidate, hash)
+                    except type(err):
+                        continue
+                    self.assertIs(result, None, "fast path didn't reject %r" % (hash,))
+                    continue
+                result = func(candidate, hash)
+                if result is not None:
+                    used += 1
+                    self.assertEqual(result, expected, "fast path result differs for %r" % (hash,))
+        self.assertTrue(used, "fast path wasn't used for any known hashes")
+
+        # malformed hashes should always be deferred to regular path
+        for hash in self.known_malformed_hashes:
+            self.assertIs(func("stub", hash), None, "fast path accepted malformed hash %r" % (hash,))
+
     #===================================================================
     # test parsehash()
     #===================================================================
@@ -2652,6 +2698,84 @@ class HandlerCase(TestCase):
             result = self.handler.parsehash(hash)
             self.assertEqual(result, correct, "hash=%r:" % hash)
 
+    #===================================================================
+    # test parse_many() / render_many()
+    #===================================================================
+    def test_72_parse_many(self):
+        """
+        parse_many() / render_many() -- agree with from_string()
+        """
+        handler = self.handler
+        if not hasattr(handler, "parse_many"):
+            raise self.skipTest("parse_many() not implemented")
+        names = handler._column_names
+        self.assertEqual(names[-1], "checksum")
+
+        # build list of known hashes, and what from_string() returns for each
+        hashes = []
+        expected = []
+        for secret, hash in self.iter_known_hashes():
+            try:
+                obj = handler.from_string(hash)
+            except (ValueError, MissingBackendError) as err:
+                # parse_many() should reject same hashes
+                self.assertRaises(type(err), handler.parse_many, [hash])
+                continue
+            hashes.append(hash)
+            expected.append(obj)
+        if not hashes:
+            raise self.skipTest("no parseable known hashes")
+
+        # parse_many() should return same values as from_string(),
+        # as bytes for salt & checksum; and int arrays for integer settings
+        columns = handler.parse_many(hashes)
+        self.assertEqual(list(columns), list(names))
+        for name in names:
+            column = columns[name]
+            self.assertEqual(len(column), len(hashes))
+            for hash, obj, value in zip(hashes, expected, column):
+                correct = getattr(obj, name)
+                if name in ("salt", "checksum") and isinstance(correct, str):
+                    correct = correct.encode("utf-8")
+                self.assertEqual(value, correct, "column %r for hash %r:" % (name, hash))
+            if name == "rounds":
+                self.assertIsInstance(column, array)
+
+        # render_many() should be the inverse
+        self.assertEqual(handler.render_many(columns),
+                         [obj.to_string() for obj in expected])
+
+        # should accept plain lists, and salt/checksum as unicode
+        plain = dict((name, list(column)) for name, column in columns.items())
+        for name in ("salt", "checksum"):
+            if name in plain:
+                plain[name] = [getattr(obj, name) for obj in expected]
+        self.assertEqual(handler.render_many(plain), [obj.to_string() for obj in expected])
+
+        # bad columns should be rejected
+        self.assertRaises(ValueError, handler.render_many, dict(columns, xxx=[]))
+        bad = dict(columns)
+        del bad["checksum"]
+        self.assertRaises(ValueError, handler.render_many, bad)
+        if len(names) > 1:
+            bad["checksum"] = list(columns["checksum"]) + [None]
+            self.assertRaises(ValueError, handler.render_many, bad)
+
+        # malformed hashes should raise same error as from_string()
+        for hash in self.known_malformed_hashes:
+            try:
+                handler.from_string(hash)
+            except Exception as err:
+                self.assertRaises(type(err), handler.parse_many, hashes + [hash])
+            else:
+                # some "malformed" hashes are only detected later on
+                handler.parse_many([hash])
+
+        # empty input
+        columns = handler.parse_many([])
+        self.assertEqual(list(columns), list(names))
+        self.assertEqual(handler.render_many(columns), [])
+
     #===================================================================
     # fuzz testing
     #===================================================================
@@ -0,0 +1,201 @@
+"""passlib.tune - helpers for choosing cost settings appropriate for the current host"""
+#=============================================================================
+# imports
+#=============================================================================
+# core
+import argparse
+import math
+import logging; log = logging.getLogger(__name__)
+import sys
+# site
+# pkg
+from passlib.utils import _measure
+# local
+__all__ = [
+    "tune_handler",
+    "main",
+]
+
+#=============================================================================
+# helpers
+#=============================================================================
+
+#: number of timing samples (per thread) used for each estimate
+_samples = 3
+
+def _get_knobs(handler):
+    """
+    return list of ``(setting, cost, min, max)`` tuples describing
+    the tunable cost parameters of handler, in the order they should be tuned.
+    *cost* is either ``"linear"`` or ``"log2"``, describing how hash time
+    varies with the setting's value.
+    """
+    settings = handler.setting_kwds
+    if "memory_cost" in settings:
+        # argon2 -- memory is the security-relevant parameter, so scale that,
+        #           and leave time_cost as configured.
+        lower = max(handler.min_memory_cost, 8 * getattr(handler, "parallelism", 1))
+        return [("memory_cost", "linear", lower, None)]
+    if "rounds" not in settings:
+        return []
+    lower = handler.min_rounds
+    if handler.min_desired_rounds is not None:
+        lower = max(lower, handler.min_desired_rounds)
+    upper = handler.max_rounds
+    if handler.max_desired_rounds is not None:
+        upper = min(upper, handler.max_desired_rounds) if upper else handler.max_desired_rounds
+    knobs = [("rounds", handler.rounds_cost, lower, upper)]
+    if "block_size" in settings:
+        # scrypt -- use block_size to make up the difference left by log2 rounds
+        knobs.append(("block_size", "linear", 1, None))
+    return knobs
+
+def _get_value(handler, setting):
+    """return current default value for setting"""
+    if setting == "rounds":
+        return handler.default_rounds
+    return getattr(handler, setting)
+
+#=============================================================================
+# tuning
+#=============================================================================
+def tune_handler(handler, target=0.350, concurrency=1):
+    """
+    measure handler on the current host, and choose cost settings
+    so that the median :meth:`!verify` time is as close to *target* as possible.
+
+    :arg handler:
+        :class:`~passlib.ifc.PasswordHash` to tune. the current default settings
+        (and any min / max rounds limits) of the handler will be honored.
+
+    :param target:
+        target time in seconds (defaults to 350ms).
+
+    :param concurrency:
+        number of hashes to run in parallel while measuring,
+        to simulate a server under load (defaults to 1).
+
+    :returns:
+        dict mapping setting names (e.g. ``"default_rounds"``, ``"memory_cost"``)
+        to the chosen values. this will be empty if the handler has no tunable settings.
+
+    .. versionadded:: 1.8
+    """
+    if target <= 0:
+        raise ValueError("target must be > 0")
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    knobs = _get_knobs(handler)
+    settings = {}
+    for index, (setting, cost, lower, upper) in enumerate(knobs):
+        if cost == "log2":
+            def to_cost(value):
+                return 2 ** value
+            def from_cost(cost):
+                return math.log(cost, 2) if cost > 0 else lower
+        else:
+            assert cost == "linear"
+            to_cost = from_cost = lambda value: value
+
+        def clamp(value):
+            """convert float value to int, clamped to limits"""
+            if upper and value > upper:
+                value = upper
+            value = int(value)
+            if setting == "rounds" and getattr(handler, "_avoid_even_rounds", False):
+                value |= 1
+            return max(lower, value)
+
+        def measure(value):
+            kwds = settings.copy()
+            kwds[setting] = value
+            return _measure(handler.using(**kwds), concurrency, _samples)
+
+        # refine estimate of speed a few times, starting from current default.
+        value = clamp(_get_value(handler, setting))
+        elapsed = measure(value)
+        for _ in range(2):
+            speed = to_cost(value) / elapsed
+            next_value = None
+            try:
+                next_value = clamp(from_cost(speed * target))
+                next_elapsed = measure(next_value)
+            except (ValueError, MemoryError) as err:
+                # e.g. scrypt exceeding memory limits, stick w/ last good value
+                log.debug("%s: can't measure %s=%r: %s", handler.name, setting, next_value, err)
+                break
+            value, elapsed = next_value, next_elapsed
+
+        # pick final value
+        speed = to_cost(value) / elapsed
+        ideal = from_cost(speed * target)
+        if cost == "log2":
+            # target usually falls between two integer values.
+            # if there's a later knob to make up the difference, round down;
+            # otherwise choose whichever is proportionally closer to the target.
+            value = clamp(math.floor(ideal))
+            if index + 1 == len(knobs) and math.ceil(ideal) - ideal < ideal - math.floor(ideal):
+                value = clamp(math.ceil(ideal))
+        else:
+            value = clamp(round(ideal))
+        settings[setting] = value
+
+    log.debug("%s: chose %r", handler.name, settings)
+    if "rounds" in settings:
+        settings["default_rounds"] = settings.pop("rounds")
+    return settings
+
+#=============================================================================
+# cli
+#=============================================================================
+_description = """\
+measure the hashes in a CryptContext configuration on the current host,
+and output the configuration with cost settings adjusted to reach the target time.
+"""
+
+def main(*args):
+    parser = argparse.ArgumentParser(prog="python -m passlib.tune", description=_description)
+    parser.add_argument("schemes", nargs="*",
+                        help="schemes to include (defaults to the schemes in --config)")
+    parser.add_argument("-c", "--config", metavar="PATH",
+                        help="INI file containing existing CryptContext configuration")
+    parser.add_argument("--section", default="passlib",
+                        help="INI section to read config from (default: %(default)s)")
+    parser.add_argument("--category", default=None,
+                        help="user category to tune (default: none)")
+    parser.add_argument("-t", "--target", type=int, default=350, metavar="MS",
+                        help="target verify time in milliseconds (default: %(default)s)")
+    parser.add_argument("-j", "--concurrency", type=int, default=1, metavar="N",
+                        help="number of hashes to run in parallel while measuring (default: %(default)s)")
+    parser.add_argument("-o", "--output", metavar="PATH",
+                        help="write resulting config to file instead of stdout")
+    opts = parser.parse_args(args)
+
+    from passlib.context import CryptContext
+    if opts.config:
+        context = CryptContext.from_path(opts.config, section=opts.section)
+    elif opts.schemes:
+        context = CryptContext(opts.schemes)
+    else:
+        parser.error("either --config or a list of schemes must be specified")
+    if opts.target <= 0:
+        parser.error("target time must be integer milliseconds > 0")
+    if opts.concurrency < 1:
+        parser.error("concurrency must be >= 1")
+
+    result = context.autotune(target_ms=opts.target, concurrency=opts.concurrency,
+                              category=opts.category, schemes=opts.schemes or None)
+    output = result.to_string(section=opts.section)
+    if opts.output:
+        with open(opts.output, "w") as fh:
+            fh.write(output)
+    else:
+        sys.stdout.write(output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:]))
+
+#=============================================================================
+# eof
+#=============================================================================
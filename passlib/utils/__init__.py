@@ -14,9 +14,10 @@ except ImportError:
     from collections import Sequence
     from collections import Iterable
 from codecs import lookup as _lookup_codec
-from functools import update_wrapper
+from functools import lru_cache, update_wrapper
 import itertools
 import inspect
+import json
 import logging; log = logging.getLogger(__name__)
 import math
 import os
@@ -44,6 +45,7 @@ except ImportError:
 import timeit
 import types
 from warnings import warn
+import weakref
 # site
 # pkg
 from passlib.utils.binary import (
@@ -93,9 +95,13 @@ __all__ = [
     'test_crypt',
     'safe_crypt',
     'tick',
+    'ProbeCache',
+    'probe_cache',
 
     # randomness
     'rng',
+    'salt_rng',
+    'EntropyPool',
     'getrandbytes',
     'getrandstr',
     'generate_password',
@@ -954,6 +960,9 @@ def test_crypt(secret, hash):
     :arg secret: password to test
     :arg hash: known hash of password to use as reference
     :returns: True or False
+
+    .. versionchanged:: 1.8
+        results are now stored in :data:`probe_cache`, if it's enabled.
     """
     # safe_crypt() always returns unicode, which means that for py3,
     # 'hash' can't be bytes, or "== hash" will never be True.
@@ -962,12 +971,37 @@ def test_crypt(secret, hash):
     assert isinstance(hash, str), \
         "hash must be str, got %s" % type(hash)
     assert hash, "hash must be non-empty"
-    return safe_crypt(secret, hash) == hash
+    return probe_cache.get("test_crypt:%s:%s" % (secret, hash),
+                           lambda: safe_crypt(secret, hash) == hash)
 
 timer = timeit.default_timer
 # legacy alias, will be removed in passlib 2.0
 tick = timer
 
+#: secret used when timing hashes (see _measure)
+_sample_secret = "S0m3-S3Kr1T"
+
+def _measure(handler, concurrency, samples):
+    """
+    return median time (in seconds) that handler.verify() takes,
+    while *concurrency* calls are running at once.
+    (shared by :mod:`passlib.tune`, :mod:`passlib.analyze`, and :meth:`BackendMixin.get_backend_timings`).
+    """
+    hash = handler.hash(_sample_secret)
+    def helper(_=None):
+        start = timer()
+        handler.verify(_sample_secret, hash)
+        return timer() - start
+    if concurrency == 1:
+        timings = [helper() for _ in range(samples)]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(concurrency) as pool:
+            timings = list(pool.map(helper, range(samples * concurrency)))
+    timings.sort()
+    # NOTE: clamping to small positive value, in case hash is faster than timer resolution
+    return max(timings[len(timings) // 2], 1e-7)
+
 def parse_version(source):
     """helper to parse version string"""
     m = re.search(r"(\d+(?:\.\d+)+)", source)
@@ -975,6 +1009,239 @@ def parse_version(source):
         return tuple(int(elem) for elem in m.group(1).split("."))
     return None
 
+#=============================================================================
+# backend probe cache
+#=============================================================================
+
+#: env var which enables the on-disk probe cache (see :class:`ProbeCache`)
+_PROBE_CACHE_ENV = "PASSLIB_PROBE_CACHE"
+
+#: des-crypt config used as a quick sanity check that the cached results
+#: still match the behavior of the host's crypt() (see ProbeCache._get_check_value)
+_PROBE_CHECK_CONFIG = "ab"
+
+def _get_crypt_signature():
+    """
+    return list of ``[path, size, mtime]`` entries identifying the crypt()
+    implementation currently in use (the stdlib's ``_crypt`` extension,
+    and any ``libcrypt`` shared library mapped into this process).
+    """
+    if not has_crypt:
+        return []
+    paths = set()
+    path = getattr(sys.modules.get("_crypt"), "__file__", None)
+    if path:
+        paths.add(path)
+    # NOTE: /proc/self/maps only exists under linux; elsewhere we fall back
+    #       to the _crypt module (and the interpreter version in the cache key).
+    try:
+        with open("/proc/self/maps") as fh:
+            for line in fh:
+                path = line.rstrip().rpartition(" ")[2]
+                if os.path.basename(path).startswith("libcrypt"):
+                    paths.add(path)
+    except (OSError, UnicodeDecodeError):
+        pass
+    result = []
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        result.append([path, st.st_size, st.st_mtime_ns])
+    return result
+
+class ProbeCache(object):
+    """
+    Persistent cache for the results of backend feature-detection probes.
+
+    Loading some backends requires running a few reference hashes,
+    in order to detect what the host supports: e.g. which formats the
+    platform's :func:`!crypt.crypt` recognizes (via :func:`test_crypt`),
+    or which bugs & workarounds apply to each :class:`~passlib.hash.bcrypt` backend.
+    These results only change when the interpreter, the host's crypt library,
+    or Passlib itself changes; so when enabled, this object stores them in a small JSON file,
+    letting subsequent processes skip the probes.
+
+    The cache is disabled by default; in which case probes are always run,
+    and nothing is written to disk.  It can be enabled by setting
+    the ``PASSLIB_PROBE_CACHE`` environmental variable to the path of the cache file
+    (or to ``"default"``, to use :samp:`{$XDG_CACHE_HOME}/passlib/probe-cache.json`),
+    or by calling :meth:`set_path` before any backends are loaded.
+
+    The stored results are discarded (and the probes re-run) whenever the cache key
+    -- the Passlib version, interpreter version, and the paths, sizes & timestamps
+    of the crypt libraries loaded into the process -- doesn't match.
+    As an extra sanity check, a single (cheap) des-crypt hash is recalculated
+    each time the file is loaded, and compared to the stored value.
+    Any other problems reading or writing the file are logged and otherwise ignored.
+
+    To force all probes to be re-run, call :meth:`clear` (or just delete the file).
+
+    .. note::
+
+        Probes which detect a security flaw (e.g. the bcrypt 8-bit bug)
+        raise an error instead of returning a result; so they'll never be cached,
+        and will be re-run (and fail) on every start.
+
+    .. versionadded:: 1.8
+    """
+    #===================================================================
+    # instance attrs
+    #===================================================================
+
+    #: path to cache file, or ``None`` if disabled.
+    path = None
+
+    #: dict mapping probe name -> result (``None`` until loaded).
+    _results = None
+
+    #===================================================================
+    # init
+    #===================================================================
+    def __init__(self, path=None):
+        if threading:
+            self._lock = threading.RLock()
+        else:
+            from passlib.utils.compat import nullcontext
+            self._lock = nullcontext()
+        self.set_path(path)
+
+    @classmethod
+    def from_environ(cls):
+        """construct instance configured from ``$PASSLIB_PROBE_CACHE``"""
+        value = os.environ.get(_PROBE_CACHE_ENV, "").strip()
+        if value.lower() in ("", "0", "false", "no", "off"):
+            return cls()
+        if value.lower() in ("1", "true", "yes", "on", "default"):
+            value = cls.default_path()
+        return cls(value)
+
+    @staticmethod
+    def default_path():
+        """return default location for the cache file"""
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(root, "passlib", "probe-cache.json")
+
+    def set_path(self, path):
+        """
+        change the location of the cache file (``None`` disables it).
+        any results already loaded are discarded.
+        """
+        self.path = path
+        self._results = None
+
+    #===================================================================
+    # cache key
+    #===================================================================
+    @staticmethod
+    def _get_key():
+        """return key identifying the environment the probes ran under"""
+        from passlib import __version__
+        return [__version__, sys.version, sys.platform, _get_crypt_signature()]
+
+    @staticmethod
+    def _get_check_value():
+        """return result of cheap probe used to validate cache on load"""
+        return safe_crypt("test", _PROBE_CHECK_CONFIG)
+
+    #===================================================================
+    # file io
+    #===================================================================
+    def _load(self):
+        """return dict of cached results (loading from disk if needed)"""
+        results = self._results
+        if results is not None:
+            return results
+        results = {}
+        try:
+            with open(self.path) as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as err:
+            if not isinstance(err, FileNotFoundError):
+                log.debug("ignoring unreadable probe cache: %r", self.path, exc_info=True)
+        else:
+            if not isinstance(data, dict) or data.get("key") != self._get_key():
+                log.debug("discarding stale probe cache: %r", self.path)
+            elif data.get("check") != self._get_check_value():
+                log.debug("discarding probe cache, crypt() behavior changed: %r", self.path)
+            elif isinstance(data.get("results"), dict):
+                results = data["results"]
+        self._results = results
+        return results
+
+    def _save(self):
+        """write current results to disk"""
+        path = self.path
+        data = dict(key=self._get_key(), check=self._get_check_value(), results=self._results)
+        tmp = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            dirname = os.path.dirname(path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            with open(tmp, "w") as fh:
+                json.dump(data, fh, sort_keys=True)
+            # NOTE: replace() is atomic, so concurrent readers will see the old or new file,
+            #       never a partial one; concurrent writers will just lose some results.
+            os.replace(tmp, path)
+        except (OSError, ValueError):
+            log.debug("failed to write probe cache: %r", path, exc_info=True)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    #===================================================================
+    # public api
+    #===================================================================
+    def get(self, name, probe):
+        """
+        return cached result for the named probe;
+        calling ``probe()`` (and storing its result) if not found.
+
+        :arg name:
+            unique name for the probe.
+
+        :arg probe:
+            function which runs the probe, and returns a JSON-compatible result
+            (typically a bool, or dict of bools).
+            Any errors it raises are propagated, and nothing is cached.
+        """
+        if self.path is None:
+            return probe()
+        with self._lock:
+            results = self._load()
+            if name in results:
+                return results[name]
+        value = probe()
+        with self._lock:
+            results = self._load()
+            results[name] = value
+            self._save()
+        return value
+
+    def clear(self):
+        """
+        remove all cached results (and the cache file),
+        so that probes will be re-run the next time they're needed.
+        """
+        with self._lock:
+            self._results = None
+            if self.path is None:
+                return
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    #===================================================================
+    # eoc
+    #===================================================================
+
+#: global :class:`ProbeCache` instance used by passlib's backends,
+#: configured from ``$PASSLIB_PROBE_CACHE``.
+probe_cache = ProbeCache.from_environ()
+
 #=============================================================================
 # randomness
 #=============================================================================
@@ -1036,6 +1303,156 @@ else: # pragma: no cover -- runtime detection
     # XXX: could reseed on every call
     rng = random.Random(genseed())
 
+#------------------------------------------------------------------------
+# buffered entropy pool
+#------------------------------------------------------------------------
+
+#: weakset of EntropyPool instances, reset in child process after fork()
+_entropy_pools = weakref.WeakSet()
+
+def _reset_entropy_pools():
+    for pool in list(_entropy_pools):
+        pool._reset()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_entropy_pools)
+
+@lru_cache(maxsize=64)
+def _get_charset_tables(charset):
+    """
+    helper for EntropyPool -- returns ``(table, delete)`` pair for use with
+    :meth:`!bytes.translate`, which maps random bytes onto *charset*
+    (dropping bytes which would cause modulo bias); or ``None`` if charset
+    can't be handled this way.
+    """
+    if isinstance(charset, str):
+        try:
+            charset = charset.encode("latin-1")
+        except UnicodeEncodeError:
+            return None
+    letters = len(charset)
+    if letters > 256:
+        return None
+    limit = 256 - 256 % letters
+    table = bytes(charset[i % letters] for i in range(256))
+    return table, bytes(range(limit, 256))
+
+class EntropyPool(random.SystemRandom):
+    """
+    :class:`!random.SystemRandom` variant which draws its random bytes
+    from a buffer that's refilled in large chunks, instead of invoking
+    :func:`os.urandom` for every call.
+
+    In addition, :func:`getrandbytes` and :func:`getrandstr` recognize
+    instances of this class, and generate their output directly from the buffer
+    (the latter mapping bytes onto the charset via :meth:`!bytes.translate`);
+    which is much faster than the generic implementation when generating
+    large numbers of salts.
+
+    Instances are thread-safe; and discard their buffer in the child process
+    after a :func:`!os.fork`, so that parent & child never share random bytes.
+
+    :param chunk_size:
+        number of bytes to read from the source at once.
+        requests for more than this are passed straight through to the source.
+
+    :param source:
+        function returning the requested number of random bytes
+        (defaults to :func:`os.urandom`).
+
+    .. versionadded:: 1.8
+    """
+    #===================================================================
+    # init
+    #===================================================================
+    def __init__(self, chunk_size=4096, source=None):
+        self.chunk_size = chunk_size
+        self._source = source or os.urandom
+        self._reset()
+        _entropy_pools.add(self)
+        super().__init__()
+
+    def _reset(self):
+        """discard buffer (called at init, and after fork)"""
+        if threading:
+            self._lock = threading.Lock()
+        else:
+            from passlib.utils.compat import nullcontext
+            self._lock = nullcontext()
+        self._buffer = _BEMPTY
+        self._offset = 0
+        self._pid = os.getpid()
+
+    #===================================================================
+    # buffer management
+    #===================================================================
+    def _getbytes(self, count):
+        """return *count* random bytes from buffer, refilling it as needed"""
+        if count > self.chunk_size:
+            return self._source(count)
+        # NOTE: register_at_fork() hook above should take care of this,
+        #       pid check is here for forks it doesn't see (and pythons lacking it).
+        if self._pid != os.getpid():
+            self._reset()
+        with self._lock:
+            start = self._offset
+            end = start + count
+            buffer = self._buffer
+            if end > len(buffer):
+                buffer = self._buffer = self._source(self.chunk_size)
+                start = 0
+                end = count
+            self._offset = end
+            return buffer[start:end]
+
+    def _getrandstr(self, charset, count):
+        """
+        helper for :func:`getrandstr` -- returns random string drawn from charset,
+        or ``None`` if the charset isn't supported by the fast path.
+        """
+        tables = _get_charset_tables(charset)
+        if tables is None:
+            return None
+        table, delete = tables
+        result = _BEMPTY
+        while len(result) < count:
+            # NOTE: when charset size isn't a divisor of 256, up to half
+            #       of the bytes may be rejected, so request extra to make up for it.
+            needed = count - len(result)
+            if delete:
+                needed <<= 1
+            result += self._getbytes(needed).translate(table, delete)
+        result = result[:count]
+        if isinstance(charset, str):
+            return result.decode("latin-1")
+        return result
+
+    #===================================================================
+    # random.Random interface
+    #===================================================================
+    def random(self):
+        return (int.from_bytes(self._getbytes(7), "big") >> 3) * 2.0 ** -53
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        if k == 0:
+            return 0
+        size = (k + 7) // 8
+        value = int.from_bytes(self._getbytes(size), "big")
+        return value >> (size * 8 - k)
+
+    def randbytes(self, n):
+        return self._getbytes(n)
+
+    #===================================================================
+    # eoc
+    #===================================================================
+
+#: :class:`EntropyPool` used to generate salts
+#: (falls back to :data:`rng` if :func:`os.urandom` isn't available).
+salt_rng = EntropyPool() if has_urandom else rng
+
 #------------------------------------------------------------------------
 # some rng helpers
 #------------------------------------------------------------------------
@@ -1050,6 +1467,8 @@ def getrandbytes(rng, count):
 
     if not count:
         return _BEMPTY
+    if isinstance(rng, EntropyPool):
+        return rng._getbytes(count)
     def helper():
         # XXX: break into chunks for large number of bits?
         value = rng.getrandbits(count<<3)
@@ -1074,6 +1493,10 @@ def getrandstr(rng, charset, count):
         raise ValueError("alphabet must not be empty")
     if letters == 1:
         return charset * count
+    if isinstance(rng, EntropyPool):
+        result = rng._getrandstr(charset, count)
+        if result is not None:
+            return result
 
     # get random value, and write out to buffer
     def helper():
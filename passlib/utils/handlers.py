@@ -3,6 +3,8 @@
 # imports
 #=============================================================================
 # core
+from array import array
+from collections import OrderedDict
 import inspect
 import logging; log = logging.getLogger(__name__)
 import math
@@ -17,10 +19,10 @@ from passlib.ifc import PasswordHash
 from passlib.registry import get_crypt_handler
 from passlib.utils import (
     consteq, getrandstr, getrandbytes,
-    rng, to_native_str,
+    salt_rng as rng, to_native_str,
     is_crypt_handler, to_unicode,
     MAX_PASSWORD_SIZE, accepts_keyword, as_bool,
-    update_mixin_classes)
+    update_mixin_classes, _measure)
 from passlib.utils.binary import (
     BASE64_CHARS, HASH64_CHARS, PADDED_BASE64_CHARS,
     HEX_CHARS, UPPER_HEX_CHARS, LOWER_HEX_CHARS,
@@ -35,6 +37,10 @@ __all__ = [
     'parse_mc3',
     'render_mc2',
     'render_mc3',
+    'parse_mc2_many',
+    'parse_mc3_many',
+    'render_mc2_many',
+    'render_mc3_many',
 
     # framework for implementing handlers
     'GenericHandler',
@@ -49,6 +55,7 @@ __all__ = [
 
     # other helpers
     'PrefixWrapper',
+    'ParseCache',
 
     # TODO: a bunch of other things are commonly assumed in this namespace
     #       (e.g. HEX_CHARS etc); need to audit uses and update this list.
@@ -260,6 +267,100 @@ def parse_int(source, base=10, default=None, param="value", handler=None):
     else:
         return default
 
+def parse_mc2_many(hashes, prefix, sep=_UDOLLAR, handler=None):
+    """bulk version of :func:`parse_mc2`, for parsing many hashes in one call.
+
+    :arg hashes: iterable of hashes to parse (bytes or str)
+    :arg prefix: the identifying prefix (str)
+    :param sep: field separator (unicode, defaults to ``$``).
+    :param handler: handler class to pass to error constructors.
+
+    :returns:
+        a ``(salts, checksums)`` tuple of lists
+        (with ``None`` in *checksums* for config strings).
+
+    .. versionadded:: 1.8
+    """
+    assert isinstance(prefix, str)
+    assert isinstance(sep, str)
+    size = len(prefix)
+    salts = []
+    checksums = []
+    add_salt = salts.append
+    add_checksum = checksums.append
+    for hash in hashes:
+        if not isinstance(hash, str):
+            hash = to_unicode(hash, "ascii", "hash")
+        if not hash.startswith(prefix):
+            raise exc.InvalidHashError(handler)
+        parts = hash[size:].split(sep)
+        count = len(parts)
+        if count == 2:
+            add_salt(parts[0])
+            add_checksum(parts[1] or None)
+        elif count == 1:
+            add_salt(parts[0])
+            add_checksum(None)
+        else:
+            raise exc.MalformedHashError(handler)
+    return salts, checksums
+
+def parse_mc3_many(hashes, prefix, sep=_UDOLLAR, rounds_base=10,
+                   default_rounds=None, handler=None):
+    """bulk version of :func:`parse_mc3`, for parsing many hashes in one call.
+
+    :arg hashes: iterable of hashes to parse (bytes or str)
+    :arg prefix: the identifying prefix (unicode)
+    :param sep: field separator (unicode, defaults to ``$``).
+    :param rounds_base:
+        the numeric base the rounds are encoded in (defaults to base 10).
+    :param default_rounds:
+        the default rounds value to use if the rounds field was omitted.
+        if this is ``None`` (the default), the rounds field is *required*.
+    :param handler: handler class to pass to error constructors.
+
+    :returns:
+        a ``(rounds, salts, checksums)`` tuple of lists
+        (with ``None`` in *checksums* for config strings).
+
+    .. versionadded:: 1.8
+    """
+    assert isinstance(prefix, str)
+    assert isinstance(sep, str)
+    size = len(prefix)
+    rounds_list = []
+    salts = []
+    checksums = []
+    add_rounds = rounds_list.append
+    add_salt = salts.append
+    add_checksum = checksums.append
+    for hash in hashes:
+        if not isinstance(hash, str):
+            hash = to_unicode(hash, "ascii", "hash")
+        if not hash.startswith(prefix):
+            raise exc.InvalidHashError(handler)
+        parts = hash[size:].split(sep)
+        count = len(parts)
+        if count == 3:
+            rounds, salt, chk = parts
+        elif count == 2:
+            rounds, salt = parts
+            chk = None
+        else:
+            raise exc.MalformedHashError(handler)
+        if rounds.startswith(_UZERO) and rounds != _UZERO:
+            raise exc.ZeroPaddedRoundsError(handler)
+        elif rounds:
+            rounds = int(rounds, rounds_base)
+        elif default_rounds is None:
+            raise exc.MalformedHashError(handler, "empty rounds field")
+        else:
+            rounds = default_rounds
+        add_rounds(rounds)
+        add_salt(salt)
+        add_checksum(chk or None)
+    return rounds_list, salts, checksums
+
 #=============================================================================
 # formatting helpers
 #=============================================================================
@@ -313,6 +414,50 @@ def render_mc3(ident, rounds, salt, checksum, sep=u"$", rounds_base=10):
     return join_unicode(parts)
 
 
+def render_mc2_many(ident, salts, checksums, sep=u"$"):
+    """bulk version of :func:`render_mc2`, for rendering many hashes in one call.
+
+    :arg ident: identifier prefix (unicode)
+    :arg salts: sequence of encoded salts (unicode)
+    :arg checksums: sequence of encoded checksums (unicode or None), same length as *salts*.
+    :param sep: separator char (unicode, defaults to ``$``)
+
+    :returns:
+        list of configs / hashes (native str)
+
+    .. versionadded:: 1.8
+    """
+    return [ident + salt + sep + checksum if checksum else ident + salt
+            for salt, checksum in zip(salts, checksums)]
+
+def render_mc3_many(ident, rounds, salts, checksums, sep=u"$", rounds_base=10):
+    """bulk version of :func:`render_mc3`, for rendering many hashes in one call.
+
+    :arg ident: identifier prefix (unicode)
+    :arg rounds: sequence of rounds values (int or None)
+    :arg salts: sequence of encoded salts (unicode), same length as *rounds*.
+    :arg checksums: sequence of encoded checksums (unicode or None), same length as *rounds*.
+    :param sep: separator char (unicode, defaults to ``$``)
+    :param rounds_base: base to encode rounds value (defaults to base 10)
+
+    :returns:
+        list of configs / hashes (native str)
+
+    .. versionadded:: 1.8
+    """
+    if rounds_base == 16:
+        fmt = u"%x"
+    else:
+        assert rounds_base == 10
+        fmt = u"%d"
+    result = []
+    add = result.append
+    for value, salt, checksum in zip(rounds, salts, checksums):
+        prefix = ident + (u'' if value is None else fmt % value) + sep + salt
+        add(prefix + sep + checksum if checksum else prefix)
+    return result
+
+
 def mask_value(value, show=4, pct=0.125, char=u"*"):
     """
     helper to mask contents of sensitive field.
@@ -343,6 +488,102 @@ def mask_value(value, show=4, pct=0.125, char=u"*"):
     show = min(show, int(size * pct))
     return value[:show] + char * (size - show)
 
+#=============================================================================
+# bulk parsing helpers
+#=============================================================================
+
+#: columns which GenericHandler.parse_many() returns as bytes
+_bytes_columns = frozenset(["salt", "checksum"])
+
+#: columns which GenericHandler.parse_many() returns as int arrays
+_int_columns = frozenset(["rounds", "memory_cost", "parallelism", "block_size", "version"])
+
+def _get_numpy():
+    """helper to import numpy, for parse_many(numpy=True)"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("parse_many(numpy=True) requires the 'numpy' package") from None
+    return numpy
+
+def collect_columns(names, rows):
+    """
+    helper for :meth:`GenericHandler._parse_many` implementations --
+    converts iterable of dicts (e.g. one per parsed hash) into a dict of lists.
+
+    :arg names: sequence of keys to extract from each row
+    :arg rows: iterable of dicts
+
+    :returns:
+        dict mapping each name -> list of values.
+
+    .. versionadded:: 1.8
+    """
+    columns = dict((name, []) for name in names)
+    appenders = [(name, columns[name].append) for name in names]
+    for row in rows:
+        for name, append in appenders:
+            append(row[name])
+    return columns
+
+def _pack_columns(handler, columns, numpy=False):
+    """
+    helper for :meth:`GenericHandler.parse_many` --
+    converts columns returned by _parse_many() into public format.
+    """
+    if numpy:
+        numpy = _get_numpy()
+    result = {}
+    for name in handler._column_names:
+        values = columns[name]
+        if name in _bytes_columns:
+            values = [value.encode("utf-8") if isinstance(value, str) else value
+                      for value in values]
+        elif name in _int_columns and all(type(value) is int for value in values):
+            if numpy:
+                values = numpy.array(values, dtype=numpy.int64)
+            else:
+                try:
+                    values = array("q", values)
+                except OverflowError:
+                    # leave oversized values as a list
+                    pass
+        result[name] = values
+    return result
+
+def _unpack_columns(handler, columns):
+    """
+    helper for :meth:`GenericHandler.render_many` --
+    validates columns, and converts them into format expected by _render_many().
+    """
+    names = handler._column_names
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise ValueError("%s: missing columns: %s" % (handler.name, ", ".join(missing)))
+    unknown = [name for name in columns if name not in names]
+    if unknown:
+        raise ValueError("%s: unknown columns: %s" % (handler.name, ", ".join(unknown)))
+    decode = dict(salt=not getattr(handler, "_salt_is_bytes", False),
+                  checksum=not handler._checksum_is_bytes)
+    result = {}
+    size = None
+    for name in names:
+        values = columns[name]
+        # NOTE: array.array & numpy arrays both offer tolist(), which returns python ints
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+        else:
+            values = list(values)
+        if size is None:
+            size = len(values)
+        elif len(values) != size:
+            raise ValueError("%s: columns must all be the same length" % (handler.name,))
+        if decode.get(name):
+            values = [value.decode("utf-8") if isinstance(value, bytes) else value
+                      for value in values]
+        result[name] = values
+    return result
+
 #=============================================================================
 # parameter helpers
 #=============================================================================
@@ -392,6 +633,96 @@ def norm_integer(handler, value, min=1, max=None, # *
 
     return value
 
+#=============================================================================
+# parsed hash cache
+#=============================================================================
+#: types which are safe to share between instances restored from ParseCache
+_immutable_types = (str, bytes, int, float, bool, type(None), tuple)
+
+class ParseCache(object):
+    """
+    bounded LRU cache of parsed hash strings,
+    used by :meth:`GenericHandler.enable_parse_cache`.
+
+    This maps ``(handler, hash)`` to the attributes of the instance
+    returned by ``handler.from_string(hash)``; so repeated calls to
+    :meth:`!verify`, :meth:`!needs_update` etc for the same hash can skip
+    re-parsing & re-validating it. Instances whose attributes aren't
+    immutable (e.g. :class:`~passlib.hash.scram`'s checksum dict) are never cached.
+
+    :param max_size:
+        maximum number of hashes to keep (least recently used are evicted first).
+
+    .. attribute:: hits
+
+        number of parses which were served from the cache.
+
+    .. attribute:: misses
+
+        number of parses which had to call :meth:`!from_string`.
+
+    .. versionadded:: 1.8
+    """
+    #: number of cache hits
+    hits = 0
+
+    #: number of cache misses
+    misses = 0
+
+    def __init__(self, max_size=1024):
+        if not isinstance(max_size, int):
+            raise exc.ExpectedTypeError(max_size, "int", "max_size")
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # maps (handler, hash) -> (instance class, instance attrs), in LRU order
+        self._entries = OrderedDict()
+
+    def __repr__(self):
+        return "<ParseCache max_size=%r size=%d hits=%d misses=%d>" % \
+               (self.max_size, len(self), self.hits, self.misses)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """fraction of parses served from the cache (``0.0`` if unused)"""
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
+    def parse(self, handler, hash):
+        """return ``handler.from_string(hash)``, using cached result if available"""
+        key = (handler, hash)
+        entries = self._entries
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            klass, state = entry
+            result = klass.__new__(klass)
+            result.__dict__.update(state)
+            return result
+        result = handler.from_string(hash)
+        state = vars(result)
+        if all(isinstance(value, _immutable_types) for value in state.values()):
+            with self._lock:
+                entries[key] = (type(result), state.copy())
+                while len(entries) > self.max_size:
+                    entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        """remove all entries from cache, and reset the stats"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
 #=============================================================================
 # MinimalHandler
 #=============================================================================
@@ -683,7 +1014,7 @@ class GenericHandler(MinimalHandler):
         # as fallback, try to parse hash, and see if we succeed.
         # inefficient, but works for most cases.
         try:
-            cls.from_string(hash)
+            cls._parse_hash(hash)
             return True
         except ValueError:
             return False
@@ -714,6 +1045,221 @@ class GenericHandler(MinimalHandler):
         """
         raise NotImplementedError("%s must implement from_string()" % (self.__class__,))
 
+    #===================================================================
+    # parse cache
+    #===================================================================
+
+    #: :class:`ParseCache` used by :meth:`_parse_hash` (``None`` if disabled).
+    #: this is shared with any subclasses created via :meth:`using`.
+    parse_cache = None
+
+    @classmethod
+    def enable_parse_cache(cls, max_size=1024):
+        """
+        enable LRU cache of parsed hashes for this class (and its subclasses),
+        so that :meth:`verify`, :meth:`needs_update`, etc don't have to
+        re-parse hashes they've recently seen.
+
+        Handlers which accept context keywords (e.g. ``user``)
+        are never cached, in which case this is a noop.
+
+        :returns:
+            the new :class:`ParseCache` instance, or ``None`` if caching isn't supported.
+
+        .. versionadded:: 1.8
+        """
+        if cls.context_kwds:
+            return None
+        cls.parse_cache = ParseCache(max_size)
+        return cls.parse_cache
+
+    @classmethod
+    def disable_parse_cache(cls):
+        """
+        disable cache enabled by :meth:`enable_parse_cache`.
+
+        .. versionadded:: 1.8
+        """
+        cls.parse_cache = None
+
+    @classmethod
+    def _parse_hash(cls, hash, **context):
+        """
+        wrapper for :meth:`from_string` used internally by verify() etc,
+        which consults the :attr:`parse_cache` when enabled.
+        """
+        cache = cls.parse_cache
+        if cache is None or context or cls.context_kwds:
+            return cls.from_string(hash, **context)
+        return cache.parse(cls, hash)
+
+    #===================================================================
+    # compiled verify() fast path
+    #===================================================================
+
+    @classmethod
+    def _compile_verify(cls):
+        """
+        optional hook which subclasses may override to provide a fast path for :meth:`verify`.
+
+        This should return a ``func(secret, hash) -> bool``, which parses *hash*
+        straight into primitive values & invokes the digest, without creating
+        a handler instance or re-running the constructor's normalization.
+        *func* must return ``None`` for any hash it doesn't recognize as canonical & strictly valid,
+        in which case :meth:`verify` falls back to :meth:`from_string` (which takes care of
+        reporting the appropriate error).  The result is cached per class,
+        and recompiled whenever the active backend changes.
+
+        :returns:
+            verify function, or ``None`` if class doesn't offer a fast path (the default).
+
+        .. versionadded:: 1.8
+        """
+        return None
+
+    @classmethod
+    def _get_compiled_verify(cls):
+        """return cached result of :meth:`_compile_verify` for this class"""
+        entry = cls.__dict__.get("_compiled_verify")
+        if entry is not None and entry[0] == cls._get_compile_key():
+            return entry[1]
+        try:
+            func = cls._compile_verify()
+        except exc.MissingBackendError:
+            # let regular verify() path report the error
+            return None
+        cls._compiled_verify = (cls._get_compile_key(), func)
+        return func
+
+    @classmethod
+    def _get_compile_key(cls):
+        """
+        return value which changes whenever :meth:`_compile_verify` needs to be re-run.
+        (overridden by :class:`BackendMixin` to return the active backend).
+        """
+        return None
+
+    #===================================================================
+    # bulk parsing / rendering
+    #===================================================================
+
+    @classproperty
+    def _column_names(cls):
+        """
+        helper for :meth:`parse_many` --
+        returns names of the columns it returns: the settings stored in each hash, plus checksum.
+
+        default implementation takes :attr:`!_parsed_settings`, excluding 'truncate_error'
+        (which isn't stored in the hash).
+        """
+        return tuple(key for key in cls._parsed_settings if key != "truncate_error") + \
+               ("checksum",)
+
+    @classmethod
+    def parse_many(cls, hashes, numpy=False):
+        """
+        Parse many hashes into columns of their settings & checksums.
+
+        This is equivalent to calling :meth:`!from_string` on each hash, and collecting
+        its attributes; but returns them column-wise (e.g. for exporting a table of hashes).
+        Handlers with simple formats (such as :class:`~passlib.hash.md5_crypt`,
+        :class:`~passlib.hash.pbkdf2_sha256`, :class:`~passlib.hash.argon2`, and
+        :class:`~passlib.hash.scrypt`) parse all the hashes in a single loop,
+        without creating a handler instance for each one.
+
+        :arg hashes:
+            iterable of hash strings (unicode or bytes).
+
+        :param numpy:
+            If ``True``, integer columns are returned as NumPy ``int64`` arrays
+            (requires :mod:`!numpy` to be installed).
+
+        :returns:
+            dict mapping column name -> column, with an entry for each setting
+            stored in the hash (e.g. ``salt``, ``rounds``), plus ``checksum``.
+            Integer columns (e.g. ``rounds``) are returned as an :class:`!array.array`
+            of type ``"q"``; ``salt`` and ``checksum`` as lists of :class:`!bytes`
+            (with ``None`` for configuration strings w/o a checksum);
+            and any other column as a list.
+
+        :raises ValueError:
+            if any hash is malformed (the same as :meth:`!from_string` would).
+
+        .. versionadded:: 1.8
+        """
+        return _pack_columns(cls, cls._parse_many(hashes), numpy)
+
+    @classmethod
+    def render_many(cls, columns):
+        """
+        Render columns of settings & checksums into hash strings;
+        the inverse of :meth:`parse_many`.
+
+        :arg columns:
+            dict mapping column name -> column, in the format returned by :meth:`parse_many`.
+            Any sequence may be used for a column (including NumPy arrays),
+            and ``salt`` / ``checksum`` values may be bytes or unicode.
+
+        :returns:
+            list of hash strings.
+
+        :raises ValueError:
+            if a column is missing or unknown, the columns differ in length,
+            or any value is invalid.
+
+        .. versionadded:: 1.8
+        """
+        return cls._render_many(_unpack_columns(cls, columns))
+
+    @classmethod
+    def _parse_many(cls, hashes):
+        """
+        helper for :meth:`parse_many` -- returns dict mapping column name -> list of values,
+        in same format as the instance attributes (e.g. unicode salts).
+
+        default implementation calls :meth:`from_string` for each hash. handlers may override
+        this to parse hashes without creating instances, passing the result through :meth:`_norm_many`.
+        """
+        names = cls._column_names
+        columns = dict((name, []) for name in names)
+        appenders = [(name, columns[name].append) for name in names]
+        from_string = cls.from_string
+        for hash in hashes:
+            obj = from_string(hash)
+            for name, append in appenders:
+                append(getattr(obj, name))
+        return columns
+
+    @classmethod
+    def _render_many(cls, columns):
+        """
+        helper for :meth:`render_many` -- takes dict mapping column name -> list of values
+        (in same format as the instance attributes), and returns list of hashes.
+
+        default implementation creates an instance for each row, and calls :meth:`to_string`.
+        handlers may override this to pass the columns through :meth:`_norm_many`,
+        and render them directly.
+        """
+        names = list(columns)
+        return [cls(**dict(zip(names, row))).to_string()
+                for row in zip(*(columns[name] for name in names))]
+
+    @classmethod
+    def _norm_many(cls, columns):
+        """
+        helper for :meth:`_parse_many` / :meth:`_render_many` implementations which
+        don't create instances -- validates & normalizes each column, the same way
+        the constructor would for the corresponding keyword. mixins extend this
+        to handle their own settings. modifies & returns *columns*.
+        """
+        checksums = columns.get("checksum")
+        if checksums is not None:
+            # NOTE: _norm_checksum() only reads class attrs, except for handlers
+            #       such as fshp (which don't use this method).
+            norm = cls.__new__(cls)._norm_checksum
+            columns["checksum"] = [None if value is None else norm(value) for value in checksums]
+        return columns
+
     #===================================================================
     # checksum generation
     #===================================================================
@@ -781,7 +1327,13 @@ class GenericHandler(MinimalHandler):
         # override this method, or ensure that from_string() / _norm_checksum()
         # ensures .checksum always uses a single canonical representation.
         validate_secret(secret)
-        self = cls.from_string(hash, **context)
+        if not context and cls.parse_cache is None:
+            func = cls._get_compiled_verify()
+            if func is not None:
+                result = func(secret, hash)
+                if result is not None:
+                    return result
+        self = cls._parse_hash(hash, **context)
         chk = self.checksum
         if chk is None:
             raise exc.MissingDigestError(cls)
@@ -822,10 +1374,40 @@ class GenericHandler(MinimalHandler):
     def needs_update(cls, hash, secret=None, **kwds):
         # NOTE: subclasses should generally just wrap _calc_needs_update()
         #       to check their particular keywords.
-        self = cls.from_string(hash)
+        self = cls._parse_hash(hash)
         assert isinstance(self, cls)
         return self._calc_needs_update(secret=secret, **kwds)
 
+    @classmethod
+    def verify_and_needs_update(cls, secret, hash, **context):
+        """
+        combined version of :meth:`verify` and :meth:`needs_update`,
+        which only has to parse the hash once.
+        used by :meth:`CryptContext.verify_and_update`.
+
+        :returns:
+            ``(verified, needs_update)`` tuple.
+            ``needs_update`` will always be ``False`` if the secret didn't verify.
+        """
+        if cls.verify.__func__ is not GenericHandler.verify.__func__:
+            # NOTE: subclass has customized verify(), so the single-parse
+            #       logic below can't be relied on to match it.
+            if not cls.verify(secret, hash, **context):
+                return False, False
+            return True, cls.needs_update(hash, secret=secret)
+        validate_secret(secret)
+        self = cls._parse_hash(hash, **context)
+        chk = self.checksum
+        if chk is None:
+            raise exc.MissingDigestError(cls)
+        if not consteq(self._calc_checksum(secret), chk):
+            return False, False
+        if cls.needs_update.__func__ is not GenericHandler.needs_update.__func__:
+            # NOTE: subclass has customized needs_update() (e.g. bcrypt checks the raw
+            #       hash string for padding errors), so defer to it.
+            return True, cls.needs_update(hash, secret=secret)
+        return True, self._calc_needs_update(secret=secret)
+
     def _calc_needs_update(self, secret=None):
         """
         internal helper for :meth:`needs_update`.
@@ -878,7 +1460,7 @@ class GenericHandler(MinimalHandler):
         # FIXME: this may not work for hashes with non-standard settings.
         # XXX: how should this handle checksum/salt encoding?
         # need to work that out for hash() anyways.
-        self = cls.from_string(hash)
+        self = cls._parse_hash(hash)
         # XXX: could split next few lines out as self._parsehash() for subclassing
         # XXX: could try to resolve ident/variant to publically suitable alias.
         # XXX: for v1.8, consider making "always" the default policy, and compare to class default
@@ -1115,6 +1697,15 @@ class HasManyIdents(GenericHandler):
             raise TypeError("no ident specified")
         self.ident = ident
 
+    @classmethod
+    def _norm_many(cls, columns):
+        # validate ident column, for GenericHandler._norm_many()
+        values = columns.get("ident")
+        if values is not None:
+            norm = cls._norm_ident
+            columns["ident"] = [norm(value) for value in values]
+        return super()._norm_many(columns)
+
     @classmethod
     def _norm_ident(cls, ident):
         """
@@ -1377,6 +1968,15 @@ class HasSalt(GenericHandler):
     def _parse_salt(self, salt):
         return self._norm_salt(salt)
 
+    @classmethod
+    def _norm_many(cls, columns):
+        # validate salt column, for GenericHandler._norm_many()
+        values = columns.get("salt")
+        if values is not None:
+            norm = cls._norm_salt
+            columns["salt"] = [norm(value) for value in values]
+        return super()._norm_many(columns)
+
     @classmethod
     def _norm_salt(cls, salt, relaxed=False):
         """helper to normalize & validate user-provided salt string
@@ -1762,6 +2362,15 @@ class HasRounds(GenericHandler):
     def _parse_rounds(self, rounds):
         return self._norm_rounds(rounds)
 
+    @classmethod
+    def _norm_many(cls, columns):
+        # validate rounds column, for GenericHandler._norm_many()
+        values = columns.get("rounds")
+        if values is not None:
+            norm = cls._norm_rounds
+            columns["rounds"] = [norm(value) for value in values]
+        return super()._norm_many(columns)
+
     @classmethod
     def _norm_rounds(cls, rounds, relaxed=False, param="rounds"):
         """
@@ -1907,6 +2516,15 @@ class ParallelismMixin(GenericHandler):
         else:
             self.parallelism = self._norm_parallelism(parallelism)
 
+    @classmethod
+    def _norm_many(cls, columns):
+        # validate parallelism column, for GenericHandler._norm_many()
+        values = columns.get("parallelism")
+        if values is not None:
+            norm = cls._norm_parallelism
+            columns["parallelism"] = [norm(value) for value in values]
+        return super()._norm_many(columns)
+
     @classmethod
     def _norm_parallelism(cls, parallelism, relaxed=False):
         return norm_integer(cls, parallelism, min=1, param="parallelism", relaxed=relaxed)
@@ -1938,6 +2556,57 @@ class ParallelismMixin(GenericHandler):
 #: class-level state that may be modified during a "dry run"
 _backend_lock = threading.RLock()
 
+#: process-wide cache of BackendMixin.get_backend_timings() results,
+#: maps (handler module, handler name, host key) -> {backend: seconds or None}
+_backend_timings = {}
+
+def _get_host_key():
+    """
+    return tuple identifying current host & interpreter,
+    used as part of the key for cached backend measurements.
+    """
+    import platform
+    import sys
+    return (platform.node(), platform.machine(), platform.python_implementation(),
+            sys.version)
+
+#: minimum time (in seconds) a single get_backend_timings() measurement should take
+#: before it's scaled up to the hash's default rounds (see _measure_default_cost())
+_backend_timing_budget = 0.01
+
+def _measure_default_cost(handler):
+    """
+    helper for :meth:`BackendMixin.get_backend_timings` --
+    estimate seconds per ``handler.verify()`` call at the handler's default rounds.
+
+    rather than measuring slow (e.g. pure-python) backends at the default rounds directly,
+    this measures at the lowest rounds value which takes at least :data:`_backend_timing_budget`,
+    and scales the result up.  (rounds values much cheaper than that would mostly be
+    measuring per-call overhead, rather than the speed of the backend).
+    """
+    default = getattr(handler, "default_rounds", None)
+    if "rounds" not in handler.setting_kwds or not default:
+        return _measure(handler, 1, 3)
+    log2 = (handler.rounds_cost == "log2")
+    avoid_even = getattr(handler, "_avoid_even_rounds", False)
+    rounds = max(handler.min_rounds or 1, 1)
+    while True:
+        if avoid_even:
+            rounds |= 1
+        rounds = min(rounds, default)
+        elapsed = _measure(handler.using(rounds=rounds), 1, 3)
+        if rounds >= default or elapsed >= _backend_timing_budget:
+            break
+        # jump to estimated rounds for budget (at least doubling the cost each time)
+        ratio = _backend_timing_budget / elapsed
+        if log2:
+            rounds += max(1, int(math.ceil(math.log(ratio, 2))))
+        else:
+            rounds = max(2 * rounds, int(math.ceil(rounds * ratio)))
+    if log2:
+        return elapsed * 2 ** (default - rounds)
+    return elapsed * default / rounds
+
 class BackendMixin(PasswordHash):
     """
     PasswordHash mixin which provides generic framework for supporting multiple backends
@@ -2046,6 +2715,56 @@ class BackendMixin(PasswordHash):
             assert cls.__backend, "set_backend() failed to load a default backend"
         return cls.__backend
 
+    @classmethod
+    def get_backend_timings(cls, refresh=False):
+        """
+        Measure how long each of the :attr:`backends` takes to verify a hash on the current host,
+        as used by :meth:`set_backend("fastest") <set_backend>`.
+
+        Each backend is timed at the fewest rounds which take a measurable amount
+        of time (around 10ms), and the result is scaled up to the hash's default rounds.
+        Backends are loaded into a private copy of the class while measuring,
+        so the active backend isn't changed (and other threads may keep using it).
+        Results are cached per scheme for the lifetime of the interpreter,
+        keyed by the current host.
+
+        :param refresh:
+            If ``True``, discard any cached results and re-measure the backends.
+
+        :returns:
+            dict mapping backend name -> median seconds per :meth:`!verify` call
+            (``None`` for backends which aren't available).
+
+        .. versionadded:: 1.8
+        """
+        key = (cls.__module__, cls.name, _get_host_key())
+        with _backend_lock:
+            timings = None if refresh else _backend_timings.get(key)
+            if timings is None:
+                timings = _backend_timings[key] = cls._measure_backends()
+            return timings.copy()
+
+    @classmethod
+    def _measure_backends(cls):
+        """
+        helper for :meth:`get_backend_timings` which does the actual measurements.
+        caller must hold the backend lock.
+        """
+        timings = {}
+        for name in cls.backends:
+            # NOTE: set_backend() isn't threadsafe w/ respect to other threads hashing
+            #       using the class, so each backend is loaded into a throwaway class instead.
+            probe = cls._get_backend_probe()
+            try:
+                probe.set_backend(name)
+            except (exc.MissingBackendError, exc.PasslibSecurityError):
+                timings[name] = None
+                continue
+            timings[name] = _measure_default_cost(probe)
+            log.debug("%s: %r backend takes %.6fs per verify() at default rounds",
+                      cls.name, name, timings[name])
+        return timings
+
     @classmethod
     def has_backend(cls, name="any"):
         """
@@ -2082,6 +2801,11 @@ class BackendMixin(PasswordHash):
 
             * ``"default"`` -- use the first available backend.
 
+            * ``"fastest"`` -- use whichever available backend :meth:`get_backend_timings`
+              measured as fastest on the current host.
+
+              .. versionadded:: 1.8
+
             * any string in :attr:`backends`, loads specified backend.
 
         :param dryrun:
@@ -2106,6 +2830,15 @@ class BackendMixin(PasswordHash):
         if (name == "any" and cls.__backend) or (name and name == cls.__backend):
             return cls.__backend
 
+        # pick backend that measured fastest (falling back to regular search for errors)
+        if name == "fastest":
+            if not dryrun:
+                timings = dict((backend, secs) for backend, secs
+                               in cls.get_backend_timings().items() if secs is not None)
+                if timings:
+                    return cls.set_backend(min(timings, key=timings.get))
+            return cls.set_backend("any", dryrun=dryrun)
+
         # if this isn't the final subclass, whose bases we can modify,
         # find that class, and recursively call this method for the proper class.
         owner = cls._get_backend_owner()
@@ -2153,6 +2886,11 @@ class BackendMixin(PasswordHash):
     # subclass hooks
     #===================================================================
 
+    @classmethod
+    def _get_compile_key(cls):
+        # NOTE: GenericHandler._compile_verify() results are backend-specific
+        return cls.__backend
+
     @classmethod
     def _get_backend_owner(cls):
         """
@@ -2161,6 +2899,14 @@ class BackendMixin(PasswordHash):
         """
         return cls
 
+    @classmethod
+    def _get_backend_probe(cls):
+        """
+        return throwaway class which backends can be loaded into by :meth:`get_backend_timings`,
+        without changing the backend of this class.
+        """
+        return type(cls.__name__, (cls,), dict(__module__=cls.__module__))
+
     @classmethod
     def _set_backend(cls, name, dryrun):
         """
@@ -2262,6 +3008,16 @@ class SubclassBackendMixin(BackendMixin):
                 return base
         raise AssertionError("expected to find class w/ '_backend_mixin_target' set")
 
+    @classmethod
+    def _get_backend_probe(cls):
+        # NOTE: a subclass won't do here, since the owner's current backend mixin
+        #       would still come first in its mro; so this copies the owner instead.
+        owner = cls._get_backend_owner()
+        attrs = dict(owner.__dict__)
+        attrs.pop("__dict__", None)
+        attrs.pop("__weakref__", None)
+        return type(owner)(owner.__name__, owner.__bases__, attrs)
+
     @classmethod
     def _set_backend(cls, name, dryrun):
         # invoke backend loader (will throw error if fails)
@@ -2438,6 +3194,8 @@ class PrefixWrapper(object):
     :param prefix: identifying prefix to prepend to all hashes
     :param orig_prefix: prefix to strip (defaults to '').
     :param lazy: if True and wrapped handler is specified by name, don't look it up until needed.
+
+    .. seealso:: :meth:`compile`, which generates an equivalent handler class.
     """
 
     #: list of attributes which should be cloned by .using()
@@ -2629,6 +3387,16 @@ class PrefixWrapper(object):
         hash = self._unwrap_hash(hash)
         return self.wrapped.needs_update(hash, **kwds)
 
+    def verify_and_needs_update(self, secret, hash, **kwds):
+        hash = to_unicode(hash, "ascii", "hash")
+        hash = self._unwrap_hash(hash)
+        wrapped = self.wrapped
+        if hasattr(wrapped, "verify_and_needs_update"):
+            return wrapped.verify_and_needs_update(secret, hash, **kwds)
+        if not wrapped.verify(secret, hash, **kwds):
+            return False, False
+        return True, wrapped.needs_update(hash, secret=secret)
+
     def identify(self, hash):
         hash = to_unicode_for_identify(hash)
         if not hash.startswith(self.prefix):
@@ -2663,6 +3431,163 @@ class PrefixWrapper(object):
         hash = self._unwrap_hash(hash)
         return self.wrapped.verify(secret, hash, **kwds)
 
+    #===================================================================
+    # compiled handler
+    #===================================================================
+
+    #: methods which (if overridden by the wrapped handler) prevent it from being compiled,
+    #: since they may inspect the hash string directly, instead of via from_string().
+    _compile_unsafe_methods = ("hash", "verify", "genconfig", "genhash",
+                               "needs_update", "verify_and_needs_update")
+
+    _compiled = None
+
+    def compile(self):
+        """
+        return a real handler class, which behaves the same as this wrapper.
+
+        The returned class is a subclass of the wrapped handler,
+        with the prefix handling built into its :meth:`~GenericHandler.from_string`,
+        :meth:`~GenericHandler.to_string`, and :meth:`~GenericHandler.identify` methods;
+        avoiding the attribute proxying and per-call string re-wrapping done by this object.
+        It can be used anywhere the wrapper can (e.g. in a :class:`~passlib.context.CryptContext`),
+        and produces & accepts the same hashes.
+
+        The main differences are that its :attr:`!ident` and :attr:`!ident_values`
+        attributes are those of the wrapped handler (since they're used to parse the unprefixed hash),
+        and that errors about malformed hashes will report the wrapper's name.
+
+        The class is generated the first time this is called, and reused afterwards.
+
+        :raises TypeError:
+            if the wrapped handler isn't a :class:`GenericHandler` subclass,
+            or overrides any of the :class:`~passlib.ifc.PasswordHash` methods
+            in a way that may parse the hash without going through :meth:`!from_string`.
+
+        .. versionadded:: 1.8
+        """
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        wrapped = self.wrapped
+        if not (isinstance(wrapped, type) and issubclass(wrapped, GenericHandler)):
+            raise TypeError("%s: can't compile wrapper around non-GenericHandler %r" %
+                            (self.name, wrapped))
+        for attr in self._compile_unsafe_methods:
+            owner = next(base for base in wrapped.__mro__ if attr in base.__dict__)
+            if owner.__module__ != __name__:
+                raise TypeError("%s: can't compile wrapper, %s overrides %s()" %
+                                (self.name, owner.__name__, attr))
+        dct = dict(
+            name=self.name,
+            _wrap_prefix=self.prefix,
+            _wrap_orig_prefix=self.orig_prefix,
+            _wrap_handler=wrapped,
+            __module__=wrapped.__module__,
+        )
+        doc = self.__dict__.get("__doc__")
+        if doc:
+            dct['__doc__'] = doc
+        compiled = self._compiled = type(self.name, (_CompiledPrefixMixin, wrapped), dct)
+        return compiled
+
+class _CompiledPrefixMixin(object):
+    """
+    mixin used by :meth:`PrefixWrapper.compile` --
+    adds the wrapper's prefix to the hashes of the handler it's inserted in front of.
+    """
+
+    #: prefix to prepend to hashes
+    _wrap_prefix = u''
+
+    #: prefix to strip from wrapped handler's hashes
+    _wrap_orig_prefix = u''
+
+    #: the wrapped handler
+    _wrap_handler = None
+
+    @classmethod
+    def identify(cls, hash):
+        hash = to_unicode_for_identify(hash)
+        prefix = cls._wrap_prefix
+        if not hash.startswith(prefix):
+            return False
+        # NOTE: deferring to wrapped handler itself, since a fallback to from_string()
+        #       would expect the prefixed hash.
+        return cls._wrap_handler.identify(cls._wrap_orig_prefix + hash[len(prefix):])
+
+    @classmethod
+    def from_string(cls, hash, **context):
+        hash = to_unicode(hash, "ascii", "hash")
+        prefix = cls._wrap_prefix
+        if not hash.startswith(prefix):
+            raise exc.InvalidHashError(cls)
+        return super().from_string(cls._wrap_orig_prefix + hash[len(prefix):], **context)
+
+    def to_string(self):
+        hash = super().to_string()
+        if isinstance(hash, bytes):
+            hash = hash.decode("ascii")
+        orig_prefix = self._wrap_orig_prefix
+        if not hash.startswith(orig_prefix):
+            raise exc.InvalidHashError(self._wrap_handler)
+        return self._wrap_prefix + hash[len(orig_prefix):]
+
+    @classmethod
+    def _compile_verify(cls):
+        func = super()._compile_verify()
+        if func is None:
+            return None
+        prefix = cls._wrap_prefix
+        orig_prefix = cls._wrap_orig_prefix
+        size = len(prefix)
+
+        def verify(secret, hash):
+            if isinstance(hash, bytes):
+                try:
+                    hash = hash.decode("ascii")
+                except UnicodeDecodeError:
+                    return None
+            if not hash.startswith(prefix):
+                return None
+            return func(secret, orig_prefix + hash[size:])
+
+        return verify
+
+    # NOTE: GenericHandler's default _parse_many() & _render_many() go through
+    #       from_string() / to_string(), which already handle the prefix;
+    #       but handlers which override them work w/ the unprefixed hashes.
+
+    @classmethod
+    def _parse_many(cls, hashes):
+        if cls._wrap_handler._parse_many.__func__ is GenericHandler._parse_many.__func__:
+            return super()._parse_many(hashes)
+        prefix = cls._wrap_prefix
+        orig_prefix = cls._wrap_orig_prefix
+        size = len(prefix)
+
+        def unwrap():
+            for hash in hashes:
+                hash = to_unicode(hash, "ascii", "hash")
+                if not hash.startswith(prefix):
+                    raise exc.InvalidHashError(cls)
+                yield orig_prefix + hash[size:]
+
+        return super()._parse_many(unwrap())
+
+    @classmethod
+    def _render_many(cls, columns):
+        result = super()._render_many(columns)
+        if cls._wrap_handler._render_many.__func__ is GenericHandler._render_many.__func__:
+            return result
+        prefix = cls._wrap_prefix
+        orig_prefix = cls._wrap_orig_prefix
+        size = len(orig_prefix)
+        for hash in result:
+            if not hash.startswith(orig_prefix):
+                raise exc.InvalidHashError(cls._wrap_handler)
+        return [prefix + hash[size:] for hash in result]
+
 #=============================================================================
 # eof
 #=============================================================================